@@ -5,21 +5,49 @@ Password Manager - A secure password manager with import/export capabilities.
 import sys
 import os
 import logging
+import threading
 from pathlib import Path
 
 # Add the src directory to the path so we can import from src
-sys.path.append(str(Path(__file__).parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtCore import QCoreApplication
+from PySide6.QtCore import QCoreApplication, QRunnable, QThreadPool
 from PySide6.QtGui import QIcon
 
+import src.resources_rc  # noqa: F401  (registers the :/icons resources)
 from src.core.config import ensure_data_dir
 from src.core.database import DatabaseManager
-from src.ui.main_window import MainWindow
-from src.ui.password_dialog import PasswordDialog
 from src.utils.logging_config import setup_logging
 
+class DbOpenTask(QRunnable):
+    """Open the database on a worker thread while the UI is being set up."""
+    
+    def __init__(self):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.db = None
+        self.error = None
+        self._done = threading.Event()
+    
+    def run(self):
+        try:
+            self.db = DatabaseManager()
+        except Exception as e:
+            self.error = e
+        finally:
+            self._done.set()
+    
+    def result(self) -> DatabaseManager:
+        """Wait for the database to open and return its manager.
+        
+        Re-raises any exception raised while opening the database.
+        """
+        self._done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.db
+
 def main():
     """Main entry point for the application."""
     try:
@@ -28,13 +56,11 @@ def main():
         QCoreApplication.setApplicationName("PasswordManager")
         QCoreApplication.setOrganizationName("Nsfr750")
         
-        # Set application icon
-        icon_path = Path(__file__).parent / "assets" / "logo.png"
-        if icon_path.exists():
-            app_icon = QIcon(str(icon_path))
-            app.setWindowIcon(app_icon)
-            if hasattr(QApplication, 'setWindowIcon'):
-                QApplication.setWindowIcon(app_icon)
+        # Set application icon from the compiled resource bundle
+        app_icon = QIcon(":/icons/logo.png")
+        app.setWindowIcon(app_icon)
+        if hasattr(QApplication, 'setWindowIcon'):
+            QApplication.setWindowIcon(app_icon)
         
         try:
             # Ensure data directory exists
@@ -44,20 +70,25 @@ def main():
             logger = setup_logging(log_level=logging.DEBUG, log_file='auto')
             logger.debug("Debug logging enabled")
             
+            # Open the database in the background while the theme is applied
+            db_task = DbOpenTask()
+            QThreadPool.globalInstance().start(db_task)
+            
             # Initialize theme manager and apply theme
             from src.ui.theme_manager import ThemeManager
             from src.core.settings import settings_manager
             theme_manager = ThemeManager(app)
             theme_manager.apply_theme(settings_manager.get("general.theme", "dark"))
             
-            # Initialize database
-            db = DatabaseManager()
+            # Wait for the database to be initialized
+            db = db_task.result()
             logger.info(f"Using database at: {db.db_path}")
             logger.info("✓ Database initialized successfully")
             
+            from src.ui.password_dialog import PasswordDialog
+            
             # Only prompt for master password if the database is not initialized
             if not db.is_initialized():
-                from src.ui.password_dialog import PasswordDialog
                 dialog = PasswordDialog(is_new_db=True)
                 if dialog.exec():
                     master_password = dialog.get_password()
@@ -68,7 +99,6 @@ def main():
                     return 1
             else:
                 # Database is already initialized, prompt for password to unlock
-                from src.ui.password_dialog import PasswordDialog
                 dialog = PasswordDialog(is_new_db=False)
                 if dialog.exec():
                     master_password = dialog.get_password()
@@ -80,6 +110,7 @@ def main():
                     return 1
             
             # Pass the authenticated db manager to the main window
+            from src.ui.main_window import MainWindow
             window = MainWindow(db_manager=db, app=app)
             window.show()
             
@@ -0,0 +1,14 @@
+"""
+Shared Qt helpers for the setup scripts.
+"""
+import sys
+
+
+def get_qapp():
+    """Return the running QApplication, creating it on first use.
+
+    PySide6 is imported here rather than at module level, so scripts only
+    pay for loading Qt once they actually show a dialog.
+    """
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication(sys.argv)
@@ -0,0 +1,252 @@
+"""
+Shared SQLite helpers for the maintenance scripts.
+"""
+import sqlite3
+from contextlib import closing, contextmanager
+from pathlib import Path
+
+# Default database location: <project root>/data/passwords.db
+DB_PATH = Path(__file__).resolve().parent.parent / 'data' / 'passwords.db'
+
+# Applied to every connection opened by the scripts. WAL + NORMAL halves the
+# fsyncs per commit, and the larger cache keeps hot pages and the schema in RAM.
+TUNED_PRAGMAS = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -20000;
+PRAGMA busy_timeout = 5000;
+PRAGMA foreign_keys = ON;
+PRAGMA mmap_size = 268435456;
+"""
+
+# Read-only connections cannot switch the journal mode, so only the
+# per-connection settings are applied to them.
+READONLY_PRAGMAS = """
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -20000;
+PRAGMA busy_timeout = 5000;
+PRAGMA mmap_size = 268435456;
+"""
+
+# Page cache for one-shot table copies (200 MB, against 20 MB by default), so
+# the source table and the new table's B-tree stay in memory while SQLite
+# copies the rows; reads of the source go through the mmap above.
+BULK_CACHE_PRAGMA = "PRAGMA cache_size = -200000"
+
+# Linux ioctl that makes a file share another file's extents (a reflink)
+FICLONE = 0x40049409
+
+# schema_version written to the metadata table by the timestamp migrations
+MIGRATED_SCHEMA_VERSION = '2.0.0'
+
+# Secondary indexes of the passwords table. A rebuilt table only carries its
+# primary key; the indexes are dropped first in case a leftover table, such
+# as passwords_old from an earlier migration, still holds these names.
+PASSWORDS_INDEXES_SQL = """
+DROP INDEX IF EXISTS idx_passwords_title;
+DROP INDEX IF EXISTS idx_passwords_username;
+DROP INDEX IF EXISTS idx_passwords_url;
+DROP INDEX IF EXISTS idx_passwords_folder;
+CREATE INDEX idx_passwords_title ON passwords (title);
+CREATE INDEX idx_passwords_username ON passwords (username);
+CREATE INDEX idx_passwords_url ON passwords (url);
+CREATE INDEX idx_passwords_folder ON passwords (folder);
+ANALYZE passwords;
+"""
+
+
+def open_tuned(path, readonly=False, bulk=False):
+    """Open a SQLite connection with the tuned PRAGMAs applied.
+
+    The connection runs in autocommit mode (``isolation_level=None``); callers
+    that need atomicity issue ``BEGIN IMMEDIATE`` / ``COMMIT`` explicitly.
+
+    Args:
+        path: Path to the database file
+        readonly: Open the database in read-only mode
+        bulk: Use the larger page cache for scripts that copy whole tables
+
+    Returns:
+        sqlite3.Connection: The configured connection
+    """
+    if readonly:
+        uri = f"{Path(path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, isolation_level=None, timeout=5)
+    else:
+        conn = sqlite3.connect(str(path), isolation_level=None, timeout=5)
+    tune(conn, readonly=readonly)
+    if bulk:
+        conn.execute(BULK_CACHE_PRAGMA)
+    return conn
+
+
+def tune(conn, readonly=False):
+    """Apply the tuned PRAGMAs to a connection the caller opened itself.
+
+    For scripts that keep the default transaction handling of
+    ``sqlite3.connect``; call it right after connecting, before any
+    statement opens a transaction.
+
+    Args:
+        conn: The connection to configure
+        readonly: Only apply the per-connection settings (no WAL switch)
+
+    Returns:
+        sqlite3.Connection: The same connection
+    """
+    conn.executescript(READONLY_PRAGMAS if readonly else TUNED_PRAGMAS)
+    return conn
+
+
+def table_columns(cursor, table):
+    """Return the columns of a table as an ordered ``{name: type}`` mapping.
+
+    Callers keep the result and update it after ``ALTER TABLE`` instead of
+    issuing ``PRAGMA table_info`` again.
+    """
+    cursor.execute(f"PRAGMA table_info({table})")
+    return {col[1]: col[2] for col in cursor.fetchall()}
+
+
+def table_schemas(cursor):
+    """Return the columns of every table as ``{table: [(name, type), ...]}``.
+
+    All tables are read with one query joining ``sqlite_master`` to
+    ``pragma_table_info``, in creation order.
+    """
+    cursor.execute(
+        "SELECT m.name, p.name, p.type FROM sqlite_master m "
+        "JOIN pragma_table_info(m.name) p WHERE m.type = 'table' "
+        "ORDER BY m.rowid, p.cid"
+    )
+    schemas = {}
+    for table, name, col_type in cursor:
+        schemas.setdefault(table, []).append((name, col_type))
+    return schemas
+
+
+def row_count(cursor, table, exact=False):
+    """Return the number of rows in a table.
+
+    Unless ``exact`` is set, the count is taken from the leaf-page cell
+    counts in the ``dbstat`` virtual table, or from the ``sqlite_stat1``
+    estimate when ``dbstat`` is not compiled in. ``COUNT(*)`` is only run
+    when neither is available.
+    """
+    if not exact:
+        try:
+            cursor.execute(
+                "SELECT SUM(ncell) FROM dbstat WHERE name = ? AND pagetype = 'leaf'",
+                (table,)
+            )
+            return cursor.fetchone()[0] or 0
+        except sqlite3.OperationalError:
+            pass
+
+        try:
+            cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = ? LIMIT 1", (table,))
+            result = cursor.fetchone()
+            if result:
+                return int(result[0].split()[0])
+        except sqlite3.OperationalError:
+            pass
+
+    cursor.execute(f"SELECT COUNT(*) FROM {table}")
+    return cursor.fetchone()[0]
+
+
+def row_counts(cursor, tables, exact=False):
+    """Return ``{table: row count}`` for the given tables.
+
+    Unless ``exact`` is set, every count comes from a single grouped
+    ``dbstat`` query; otherwise each table goes through row_count().
+    """
+    if not exact:
+        try:
+            cursor.execute(
+                "SELECT name, SUM(ncell) FROM dbstat WHERE pagetype = 'leaf' GROUP BY name"
+            )
+            counts = dict(cursor.fetchall())
+            return {table: counts.get(table, 0) for table in tables}
+        except sqlite3.OperationalError:
+            pass
+
+    return {table: row_count(cursor, table, exact=exact) for table in tables}
+
+
+def index_passwords(cursor):
+    """Recreate the passwords indexes and refresh the planner statistics.
+
+    The statements are run one by one, unlike ``executescript``, so they
+    join the caller's open transaction instead of committing it.
+    """
+    for statement in PASSWORDS_INDEXES_SQL.split(';'):
+        if statement.strip():
+            cursor.execute(statement)
+
+
+def mark_migrated(cursor):
+    """Record MIGRATED_SCHEMA_VERSION in the metadata table, if there is one.
+
+    Call it inside the migration's transaction so the marker and the
+    migrated data are committed together.
+    """
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='metadata'")
+    if cursor.fetchone():
+        cursor.execute(
+            "UPDATE metadata SET value = ? WHERE key = 'schema_version'",
+            (MIGRATED_SCHEMA_VERSION,)
+        )
+
+
+def backup_database(db_path, backup_path):
+    """Write a consistent snapshot of a database using SQLite's backup API.
+
+    The WAL is checkpointed into the main file first, so the snapshot is a
+    single self-contained file even if another connection has it open.
+    """
+    with closing(sqlite3.connect(str(db_path))) as src:
+        src.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        with closing(sqlite3.connect(str(backup_path))) as dst:
+            src.backup(dst)
+
+
+def clone_database(db_path, backup_path):
+    """Snapshot a database with a copy-on-write reflink when possible.
+
+    After a WAL checkpoint the main file holds the whole database, and on
+    filesystems with reflinks (Btrfs, XFS) the FICLONE ioctl copies it
+    without moving any data. Elsewhere, or when the clone is refused, this
+    falls back to backup_database(). A hardlink is never used: it would
+    share the inode, so later checkpoints into the original would change
+    the backup too.
+    """
+    with closing(sqlite3.connect(str(db_path))) as src:
+        src.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    try:
+        import fcntl
+        with open(db_path, 'rb') as fin, open(backup_path, 'wb') as fout:
+            fcntl.ioctl(fout.fileno(), FICLONE, fin.fileno())
+        return
+    except (ImportError, OSError):
+        pass
+    backup_database(db_path, backup_path)
+
+
+@contextmanager
+def unsynchronized(conn):
+    """Run a one-shot migration without fsyncs or an on-disk journal.
+
+    A crash inside the block can corrupt the database, so only use this
+    right after taking a backup. WAL and ``synchronous = NORMAL`` are
+    restored on exit; the changes were written straight to the main file,
+    so there is nothing to checkpoint.
+    """
+    conn.executescript("PRAGMA synchronous = OFF;\nPRAGMA journal_mode = MEMORY;")
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        conn.executescript("PRAGMA synchronous = NORMAL;\nPRAGMA journal_mode = WAL;")
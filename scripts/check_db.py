@@ -1,39 +1,34 @@
-import sqlite3
+import sys
+from contextlib import closing
 
-def check_database():
-    db_path = r"X:\GitHub\pass_mgr\data\passwords.db"
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    # List all tables
-    print("\nTables in the database:")
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-    tables = cursor.fetchall()
-    for table in tables:
-        table_name = table[0]
-        print(f"\nTable: {table_name}")
-        
-        # Get table schema
-        cursor.execute(f"PRAGMA table_info({table_name});")
-        columns = cursor.fetchall()
-        print("Columns:")
-        for col in columns:
-            print(f"  {col[1]} ({col[2]})")
+from _sqlite_util import DB_PATH, open_tuned, row_counts, table_schemas
+
+def check_database(exact=False, fast=False):
+    with closing(open_tuned(DB_PATH, readonly=True)) as conn:
+        cursor = conn.cursor()
         
-        # Get row count
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name};")
-        count = cursor.fetchone()[0]
-        print(f"Row count: {count}")
+        # Read every table's schema, and their row counts unless --fast
+        schemas = table_schemas(cursor)
+        counts = {} if fast else row_counts(cursor, schemas, exact=exact)
         
-        # Show first few rows if table is not empty
-        if count > 0:
-            cursor.execute(f"SELECT * FROM {table_name} LIMIT 5;")
-            rows = cursor.fetchall()
-            print("First few rows:")
-            for row in rows:
-                print(f"  {row}")
-    
-    conn.close()
+        # List all tables
+        print("\nTables in the database:")
+        for table_name, columns in schemas.items():
+            print(f"\nTable: {table_name}")
+            
+            print("Columns:")
+            for name, col_type in columns:
+                print(f"  {name} ({col_type})")
+            
+            count = counts.get(table_name)
+            if count is not None:
+                print(f"Row count: {count}")
+            
+            # Show first few rows if table is not empty
+            if count != 0:
+                print("First few rows:")
+                for row in cursor.execute(f"SELECT * FROM {table_name} LIMIT 5;"):
+                    print(f"  {row}")
 
 if __name__ == "__main__":
-    check_database()
+    check_database(exact='-v' in sys.argv[1:], fast='--fast' in sys.argv[1:])
@@ -5,11 +5,13 @@ Check database file status and permissions.
 import os
 import sys
 import stat
-from pathlib import Path
+from contextlib import closing
 
-def check_database_file():
+from _sqlite_util import DB_PATH, open_tuned, row_count
+
+def check_database_file(exact=False):
     """Check the status of the database file."""
-    db_path = Path(__file__).parent.parent / 'data' / 'passwords.db'
+    db_path = DB_PATH
     
     print(f"🔍 Checking database file: {db_path}")
     
@@ -43,31 +45,29 @@ def check_database_file():
     # Check if it's a valid SQLite database
     try:
         import sqlite3
-        conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
-        cursor.execute("SELECT sqlite_version()")
-        version = cursor.fetchone()[0]
-        print(f"\n✅ Valid SQLite database (version: {version})")
-        
-        # Check tables
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = [row[0] for row in cursor.fetchall()]
-        print(f"\n📋 Tables in database: {', '.join(tables) if tables else 'No tables found'}")
-        
-        if 'passwords' in tables:
-            cursor.execute("SELECT COUNT(*) FROM passwords")
-            count = cursor.fetchone()[0]
-            print(f"📊 Passwords table has {count} entries")
-        
-        conn.close()
-        return True
-        
+        with closing(open_tuned(db_path, readonly=True)) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT sqlite_version()")
+            version = cursor.fetchone()[0]
+            print(f"\n✅ Valid SQLite database (version: {version})")
+            
+            # Check tables
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            tables = [row[0] for row in cursor.fetchall()]
+            print(f"\n📋 Tables in database: {', '.join(tables) if tables else 'No tables found'}")
+            
+            if 'passwords' in tables:
+                count = row_count(cursor, 'passwords', exact=exact)
+                print(f"📊 Passwords table has {count} entries")
+            
+            return True
+            
     except sqlite3.Error as e:
         print(f"❌ SQLite error: {e}")
         return False
 
 if __name__ == "__main__":
-    if check_database_file():
+    if check_database_file(exact='-v' in sys.argv[1:]):
         print("\n✅ Database file check completed successfully!")
         sys.exit(0)
     else:
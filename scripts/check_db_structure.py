@@ -1,50 +1,44 @@
-import sqlite3
+from contextlib import closing
+import sys
 
-def check_db_structure():
-    db_path = r"X:\GitHub\pass_mgr\data\passwords.db"
-    
+from _sqlite_util import DB_PATH, open_tuned, row_counts, table_schemas
+
+def check_db_structure(exact=False, fast=False):
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # List all tables
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = cursor.fetchall()
-        
-        print("Tables in the database:")
-        for table in tables:
-            table_name = table[0]
-            print(f"\n=== Table: {table_name} ===")
+        with closing(open_tuned(DB_PATH, readonly=True)) as conn:
+            cursor = conn.cursor()
             
-            # Get table info
-            cursor.execute(f"PRAGMA table_info({table_name});")
-            columns = cursor.fetchall()
-            print("Columns:")
-            for col in columns:
-                print(f"  {col[1]} ({col[2]})")
+            # Read every table's schema, and their row counts unless --fast
+            schemas = table_schemas(cursor)
+            counts = {} if fast else row_counts(cursor, schemas, exact=exact)
             
-            # Get row count
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name};")
-            count = cursor.fetchone()[0]
-            print(f"Total rows: {count}")
+            print("Tables in the database:")
+            for table_name, columns in schemas.items():
+                print(f"\n=== Table: {table_name} ===")
+                
+                print("Columns:")
+                for name, col_type in columns:
+                    print(f"  {name} ({col_type})")
+                
+                count = counts.get(table_name)
+                if count is not None:
+                    print(f"Total rows: {count}")
+                
+                # Show first row as sample
+                if count != 0:
+                    cursor.execute(f"SELECT * FROM {table_name} LIMIT 1;")
+                    row = cursor.fetchone()
+                    if row is None:
+                        continue
+                    print("Sample row:")
+                    for (col_name, _), value in zip(columns, row):
+                        if isinstance(value, bytes):
+                            print(f"  {col_name}: <binary data, {len(value)} bytes>")
+                        else:
+                            print(f"  {col_name}: {value}")
             
-            # Show first row as sample
-            if count > 0:
-                cursor.execute(f"SELECT * FROM {table_name} LIMIT 1;")
-                row = cursor.fetchone()
-                print("Sample row:")
-                for i, value in enumerate(row):
-                    col_name = columns[i][1]
-                    if isinstance(value, bytes):
-                        print(f"  {col_name}: <binary data, {len(value)} bytes>")
-                    else:
-                        print(f"  {col_name}: {value}")
-        
     except Exception as e:
         print(f"Error: {str(e)}")
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 if __name__ == "__main__":
-    check_db_structure()
+    check_db_structure(exact='-v' in sys.argv[1:], fast='--fast' in sys.argv[1:])
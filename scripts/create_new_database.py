@@ -2,24 +2,56 @@
 """
 Create a new database with the correct schema.
 """
-import sqlite3
-from pathlib import Path
+from contextlib import closing
 import os
-import shutil
 from datetime import datetime
 
+from _sqlite_util import DB_PATH, backup_database, open_tuned
+
+# Schema for a fresh database, applied as a single script
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS passwords (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    username TEXT,
+    password_encrypted BLOB,
+    url TEXT,
+    notes_encrypted BLOB,
+    folder TEXT,
+    tags_encrypted BLOB,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    iv BLOB,
+    notes TEXT,
+    tags TEXT
+);
+
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value BLOB
+);
+
+-- Set schema version
+INSERT OR REPLACE INTO metadata (key, value) VALUES ('schema_version', '2');
+
+-- Indexes for better performance
+CREATE INDEX IF NOT EXISTS idx_passwords_title ON passwords(title);
+CREATE INDEX IF NOT EXISTS idx_passwords_username ON passwords(username);
+CREATE INDEX IF NOT EXISTS idx_passwords_folder ON passwords(folder);
+"""
+
 def create_new_database():
     """Create a new database with the correct schema."""
     # Define paths
-    db_dir = Path(__file__).parent.parent / 'data'
-    db_path = db_dir / 'passwords.db'
+    db_path = DB_PATH
+    db_dir = db_path.parent
     backup_path = db_dir / 'passwords.db.backup'
     
     # Create backup of existing database if it exists
     if db_path.exists():
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_path = db_dir / f'passwords.db.backup_{timestamp}'
-        shutil.copy2(db_path, backup_path)
+        backup_database(db_path, backup_path)
         print(f"Created backup of existing database at: {backup_path}")
     
     try:
@@ -27,69 +59,30 @@ def create_new_database():
         db_dir.mkdir(parents=True, exist_ok=True)
         
         # Connect to the new database
-        conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
-        
-        # Create the passwords table with the correct schema
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS passwords (
-                id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                username TEXT,
-                password_encrypted BLOB,
-                url TEXT,
-                notes_encrypted BLOB,
-                folder TEXT,
-                tags_encrypted BLOB,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                iv BLOB,
-                notes TEXT,
-                tags TEXT
-            )
-        ''')
-        
-        # Create metadata table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS metadata (
-                key TEXT PRIMARY KEY,
-                value BLOB
-            )
-        ''')
-        
-        # Set schema version
-        cursor.execute('''
-            INSERT OR REPLACE INTO metadata (key, value)
-            VALUES (?, ?)
-        ''', ('schema_version', '2'))
-        
-        # Create indexes for better performance
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_passwords_title ON passwords(title)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_passwords_username ON passwords(username)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_passwords_folder ON passwords(folder)')
-        
-        conn.commit()
-        
-        # Verify the schema
-        cursor.execute("PRAGMA table_info(passwords)")
-        print("\nDatabase schema created successfully:")
-        for col in cursor.fetchall():
-            print(f"- {col[1]}: {col[2]}")
-        
-        print(f"\n✅ New database created at: {db_path}")
-        if db_path.exists():
-            print(f"   Size: {os.path.getsize(db_path) / 1024:.2f} KB")
-        
-        return True, str(db_path)
-        
+        with closing(open_tuned(db_path)) as conn, conn:
+            cursor = conn.cursor()
+            
+            # Create the schema, seed the metadata and build the indexes
+            # in a single transaction
+            conn.executescript("BEGIN IMMEDIATE;\n" + SCHEMA_SQL + "\nCOMMIT;")
+            
+            # Verify the schema
+            cursor.execute("PRAGMA table_info(passwords)")
+            print("\nDatabase schema created successfully:")
+            for col in cursor.fetchall():
+                print(f"- {col[1]}: {col[2]}")
+            
+            print(f"\n✅ New database created at: {db_path}")
+            if db_path.exists():
+                print(f"   Size: {os.path.getsize(db_path) / 1024:.2f} KB")
+            
+            return True, str(db_path)
+            
     except Exception as e:
         print(f"❌ Error creating database: {e}")
         import traceback
         traceback.print_exc()
         return False, None
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 if __name__ == "__main__":
     print("Creating a new database with the correct schema...")
@@ -3,13 +3,15 @@
 Script to fix database constraints and schema issues.
 """
 import sqlite3
-from pathlib import Path
-import datetime
-import shutil
+from contextlib import closing
+
+from _sqlite_util import (
+    DB_PATH, backup_database, index_passwords, open_tuned, table_columns, unsynchronized
+)
 
 def fix_database():
     """Fix database schema and constraints."""
-    db_path = Path(__file__).parent.parent / 'data' / 'passwords.db'
+    db_path = DB_PATH
     backup_path = db_path.with_suffix('.db.backup')
     
     if not db_path.exists():
@@ -17,93 +19,85 @@ def fix_database():
         return False, None
     
     # Create a backup
-    shutil.copy2(db_path, backup_path)
+    backup_database(db_path, backup_path)
     print(f"Created backup at {backup_path}")
     
     try:
-        # Connect to the database
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        # Get current schema
-        cursor.execute("PRAGMA table_info(passwords)")
-        columns = {col[1]: col for col in cursor.fetchall()}
-        
-        # Create a new table with the correct schema
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS passwords_new (
-                id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                username TEXT,
-                password_encrypted BLOB,
-                url TEXT,
-                notes_encrypted BLOB,
-                folder TEXT,
-                tags_encrypted BLOB,
-                created_at TIMESTAMP,
-                updated_at TIMESTAMP,
-                iv BLOB,
-                notes TEXT,
-                tags TEXT
-            )
-        ''')
-        
-        # Get all data from the original table
-        cursor.execute('SELECT * FROM passwords')
-        rows = cursor.fetchall()
-        
-        # Insert data into the new table
-        for row in rows:
-            row_dict = dict(row)
+        # Connect to the database. Syncing is switched off for the
+        # migration, which is safe because the backup was just taken.
+        with closing(open_tuned(db_path)) as conn, unsynchronized(conn), conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
             
-            # Ensure required fields have values
-            if 'id' not in row_dict or not row_dict['id']:
-                row_dict['id'] = str(datetime.datetime.now().timestamp())
+            # Get current schema
+            columns = table_columns(cursor, 'passwords')
             
-            if 'title' not in row_dict or not row_dict['title']:
-                row_dict['title'] = 'Untitled'
+            # Create a new table with the correct schema
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS passwords_new (
+                    id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    username TEXT,
+                    password_encrypted BLOB,
+                    url TEXT,
+                    notes_encrypted BLOB,
+                    folder TEXT,
+                    tags_encrypted BLOB,
+                    created_at TIMESTAMP,
+                    updated_at TIMESTAMP,
+                    iv BLOB,
+                    notes TEXT,
+                    tags TEXT
+                )
+            ''')
             
-            # Prepare values for insertion
-            columns = list(row_dict.keys())
-            values = list(row_dict.values())
+            # Copy every column the old and new tables have in common
+            cols = [col for col in table_columns(cursor, 'passwords_new') if col in columns]
             
-            # Insert the row
-            placeholders = ', '.join(['?'] * len(values))
-            columns_str = ', '.join(columns)
+            # Ensure required fields have values while SQLite copies the rows
+            required = {
+                'id': "COALESCE(NULLIF(id, ''), lower(hex(randomblob(8))))",
+                'title': "COALESCE(NULLIF(title, ''), 'Untitled')",
+            }
+            select_list = ', '.join(required.get(col, col) for col in cols)
             
+            # Dropping the old passwords table must not cascade into the sharing
+            # tables; foreign_keys cannot be changed inside the transaction
+            cursor.execute('PRAGMA foreign_keys = OFF')
+            
+            # Run the whole copy and table swap as a single transaction
+            cursor.execute('BEGIN IMMEDIATE')
             cursor.execute(
-                f'INSERT INTO passwords_new ({columns_str}) VALUES ({placeholders})',
-                values
+                f"INSERT INTO passwords_new ({', '.join(cols)}) "
+                f"SELECT {select_list} FROM passwords"
             )
-        
-        # Rename tables
-        cursor.execute('DROP TABLE IF EXISTS passwords_old')
-        cursor.execute('ALTER TABLE passwords RENAME TO passwords_old')
-        cursor.execute('ALTER TABLE passwords_new RENAME TO passwords')
-        
-        # Verify the data
-        cursor.execute('SELECT COUNT(*) FROM passwords')
-        count = cursor.fetchone()[0]
-        print(f"Successfully migrated {count} entries.")
-        
-        # Show sample data
-        cursor.execute('SELECT id, title, created_at, updated_at FROM passwords LIMIT 5')
-        print("\nSample entries after migration:")
-        for row in cursor.fetchall():
-            print(f"ID: {row['id']}, Title: {row['title']}, Created: {row.get('created_at')}, Updated: {row.get('updated_at')}")
-        
-        conn.commit()
-        return True, str(backup_path)
-        
+            
+            # Replace the old table with the new one. Renaming it to passwords_old
+            # would repoint the sharing tables' foreign keys at the copy; the
+            # backup taken above already keeps the original rows
+            cursor.execute('DROP TABLE IF EXISTS passwords_old')
+            cursor.execute('DROP TABLE passwords')
+            cursor.execute('ALTER TABLE passwords_new RENAME TO passwords')
+            index_passwords(cursor)
+            cursor.execute('COMMIT')
+            
+            # Verify the data
+            cursor.execute('SELECT COUNT(*) FROM passwords')
+            count = cursor.fetchone()[0]
+            print(f"Successfully migrated {count} entries.")
+            
+            # Show sample data
+            print("\nSample entries after migration:")
+            for row in cursor.execute('SELECT id, title, created_at, updated_at FROM passwords LIMIT 5'):
+                print(f"ID: {row['id']}, Title: {row['title']}, Created: {row['created_at']}, Updated: {row['updated_at']}")
+            
+            return True, str(backup_path)
+            
     except Exception as e:
         print(f"Error during migration: {e}")
         import traceback
         traceback.print_exc()
         return False, str(backup_path)
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 if __name__ == "__main__":
     print("Starting database migration to fix constraints...")
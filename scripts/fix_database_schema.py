@@ -5,8 +5,11 @@ Script to fix the database schema by adding missing columns.
 import os
 import sys
 import sqlite3
+from contextlib import closing
 from pathlib import Path
 
+from _sqlite_util import table_columns
+
 # Add the project root to the Python path
 project_root = str(Path(__file__).parent.parent)
 if project_root not in sys.path:
@@ -28,44 +31,40 @@ def add_notes_column():
         return True
     
     try:
-        conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
-        
-        # Enable foreign key constraints
-        cursor.execute("PRAGMA foreign_keys = ON")
-        
-        # Check if the notes column exists
-        cursor.execute("PRAGMA table_info(passwords)")
-        columns = [column[1] for column in cursor.fetchall()]
-        
-        if 'notes' not in columns:
-            print("Adding 'notes' column to passwords table...")
-            cursor.execute('''
-                ALTER TABLE passwords 
-                ADD COLUMN notes TEXT
-            ''')
-            print("Successfully added 'notes' column.")
-        else:
-            print("'notes' column already exists.")
-        
-        # Check if we need to update any other schema issues
-        cursor.execute("PRAGMA table_info(passwords)")
-        print("\nCurrent schema of 'passwords' table:")
-        for column in cursor.fetchall():
-            print(f"- {column[1]}: {column[2]}")
-        
-        conn.commit()
-        return True
-        
+        with closing(sqlite3.connect(str(db_path))) as conn, conn:
+            cursor = conn.cursor()
+            
+            # Enable foreign key constraints
+            cursor.execute("PRAGMA foreign_keys = ON")
+            
+            # Check if the notes column exists
+            columns = table_columns(cursor, 'passwords')
+            
+            if 'notes' not in columns:
+                print("Adding 'notes' column to passwords table...")
+                cursor.execute('''
+                    ALTER TABLE passwords 
+                    ADD COLUMN notes TEXT
+                ''')
+                columns['notes'] = 'TEXT'
+                print("Successfully added 'notes' column.")
+            else:
+                print("'notes' column already exists.")
+            
+            # Check if we need to update any other schema issues
+            print("\nCurrent schema of 'passwords' table:")
+            for name, col_type in columns.items():
+                print(f"- {name}: {col_type}")
+            
+            conn.commit()
+            return True
+            
     except sqlite3.Error as e:
         print(f"Database error: {e}")
         return False
     except Exception as e:
         print(f"Error during migration: {e}")
         return False
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 if __name__ == "__main__":
     if add_notes_column():
@@ -2,12 +2,13 @@
 """
 Fix database schema and timestamp issues.
 """
-import sqlite3
 import os
+from contextlib import closing
 from pathlib import Path
-import shutil
 from datetime import datetime
 
+from _sqlite_util import backup_database, index_passwords, open_tuned, table_columns
+
 def fix_database():
     """Fix database schema and timestamp issues."""
     db_path = Path(__file__).parent.parent / 'data' / 'passwords.db'
@@ -18,143 +19,143 @@ def fix_database():
         return False
     
     # Create a backup
-    shutil.copy2(db_path, backup_path)
+    backup_database(db_path, backup_path)
     print(f"✅ Created backup at {backup_path}")
     
     try:
         # Connect to the database
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        # Check if the passwords table exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='passwords'")
-        if not cursor.fetchone():
-            print("❌ 'passwords' table not found in the database!")
-            return False
-        
-        # Get the current schema
-        cursor.execute("PRAGMA table_info(passwords)")
-        columns = [row['name'] for row in cursor.fetchall()]
-        print(f"Current columns: {', '.join(columns)}")
-        
-        # Add missing columns if they don't exist
-        if 'notes' not in columns:
-            print("🔄 Adding 'notes' column...")
-            cursor.execute("ALTER TABLE passwords ADD COLUMN notes TEXT")
+        with closing(open_tuned(db_path, bulk=True)) as conn, conn:
+            cursor = conn.cursor()
             
-        if 'tags' not in columns:
-            print("🔄 Adding 'tags' column...")
-            cursor.execute("ALTER TABLE passwords ADD COLUMN tags TEXT")
+            # Check if the passwords table exists
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='passwords'")
+            if not cursor.fetchone():
+                print("❌ 'passwords' table not found in the database!")
+                return False
             
-        # Fix NULL password_encrypted and iv values
-        print("🔄 Fixing NULL password_encrypted and iv values...")
-        cursor.execute("UPDATE passwords SET password_encrypted = x'' WHERE password_encrypted IS NULL")
-        cursor.execute("UPDATE passwords SET iv = x'' WHERE iv IS NULL")
-        
-        # Commit changes so far
-        conn.commit()
-        
-        # Check timestamp format
-        cursor.execute("SELECT created_at, updated_at FROM passwords LIMIT 1")
-        sample = cursor.fetchone()
-        
-        if sample and isinstance(sample['created_at'], str) and 'T' in sample['created_at']:
-            print("🔄 Fixing timestamp format...")
-            # Create a new table with the correct schema
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS passwords_new (
-                    id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    username TEXT,
-                    password_encrypted BLOB NOT NULL DEFAULT x'',
-                    url TEXT,
-                    notes_encrypted BLOB,
-                    folder TEXT,
-                    tags_encrypted BLOB,
-                    created_at TEXT,
-                    updated_at TEXT,
-                    iv BLOB,
-                    notes TEXT,
-                    tags TEXT
-                )
-            ''')
+            # Dropping the old passwords table must not cascade into the sharing
+            # tables; foreign_keys cannot be changed inside the transaction
+            cursor.execute("PRAGMA foreign_keys = OFF")
             
-            # Copy data to the new table
-            cursor.execute('''
-                INSERT INTO passwords_new (
-                    id, title, username, password_encrypted, url,
-                    notes_encrypted, folder, tags_encrypted,
-                    created_at, updated_at, iv, notes, tags
-                )
-                SELECT 
-                    id, title, username, 
-                    COALESCE(password_encrypted, x'') as password_encrypted, 
-                    url,
-                    notes_encrypted, folder, tags_encrypted,
-                    created_at, updated_at, iv, notes, tags
-                FROM passwords
-            ''')
+            # Run the whole repair as a single transaction
+            cursor.execute("BEGIN IMMEDIATE")
             
-            # Verify the data was copied
-            cursor.execute('SELECT COUNT(*) FROM passwords_new')
-            new_count = cursor.fetchone()[0]
+            # Count the rows once; the copy below is checked against its rowcount
             cursor.execute('SELECT COUNT(*) FROM passwords')
-            old_count = cursor.fetchone()[0]
+            count = cursor.fetchone()[0]
             
-            if new_count != old_count:
-                print(f"❌ Error: Row count mismatch! Original: {old_count}, New: {new_count}")
-                raise Exception("Row count mismatch during migration")
+            # Get the current schema
+            columns = table_columns(cursor, 'passwords')
+            print(f"Current columns: {', '.join(columns)}")
             
-            # Replace the old table with the new one
-            cursor.execute('DROP TABLE IF EXISTS passwords_old')
-            cursor.execute('ALTER TABLE passwords RENAME TO passwords_old')
-            cursor.execute('ALTER TABLE passwords_new RENAME TO passwords')
+            # Add missing columns if they don't exist
+            if 'notes' not in columns:
+                print("🔄 Adding 'notes' column...")
+                cursor.execute("ALTER TABLE passwords ADD COLUMN notes TEXT")
+                columns['notes'] = 'TEXT'
+                
+            if 'tags' not in columns:
+                print("🔄 Adding 'tags' column...")
+                cursor.execute("ALTER TABLE passwords ADD COLUMN tags TEXT")
+                columns['tags'] = 'TEXT'
+                
+            # Fix NULL password_encrypted and iv values
+            print("🔄 Fixing NULL password_encrypted and iv values...")
+            cursor.execute("UPDATE passwords SET password_encrypted = x'' WHERE password_encrypted IS NULL")
+            cursor.execute("UPDATE passwords SET iv = x'' WHERE iv IS NULL")
+            
+            # Check timestamp format
+            cursor.execute("SELECT created_at, updated_at FROM passwords LIMIT 1")
+            sample = cursor.fetchone()
+            
+            if sample and isinstance(sample[0], str) and 'T' in sample[0]:
+                print("🔄 Fixing timestamp format...")
+                # Create a new table with the correct schema
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS passwords_new (
+                        id TEXT PRIMARY KEY,
+                        title TEXT NOT NULL,
+                        username TEXT,
+                        password_encrypted BLOB NOT NULL DEFAULT x'',
+                        url TEXT,
+                        notes_encrypted BLOB,
+                        folder TEXT,
+                        tags_encrypted BLOB,
+                        created_at TEXT,
+                        updated_at TEXT,
+                        iv BLOB,
+                        notes TEXT,
+                        tags TEXT
+                    )
+                ''')
+                
+                # Copy data to the new table
+                cursor.execute('''
+                    INSERT INTO passwords_new (
+                        id, title, username, password_encrypted, url,
+                        notes_encrypted, folder, tags_encrypted,
+                        created_at, updated_at, iv, notes, tags
+                    )
+                    SELECT 
+                        id, title, username, 
+                        COALESCE(password_encrypted, x'') as password_encrypted, 
+                        url,
+                        notes_encrypted, folder, tags_encrypted,
+                        created_at, updated_at, iv, notes, tags
+                    FROM passwords
+                ''')
+                
+                # Verify the data was copied
+                new_count = cursor.rowcount
+                if new_count != count:
+                    print(f"❌ Error: Row count mismatch! Original: {count}, New: {new_count}")
+                    raise Exception("Row count mismatch during migration")
+                
+                # Replace the old table with the new one. Dropping it here instead of
+                # keeping passwords_old frees its pages without a separate VACUUM
+                cursor.execute('DROP TABLE IF EXISTS passwords_old')
+                cursor.execute('DROP TABLE passwords')
+                cursor.execute('ALTER TABLE passwords_new RENAME TO passwords')
+                index_passwords(cursor)
+                columns = table_columns(cursor, 'passwords')
+                
+                print("✅ Successfully updated database schema")
+            
+            # Update the metadata table if it exists
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='metadata'")
+            if cursor.fetchone():
+                cursor.execute('''
+                    UPDATE metadata 
+                    SET value = '2.0.0'
+                    WHERE key = 'schema_version'
+                ''')
+            
+            # Verify the changes
+            print(f"\n✅ Final schema: {', '.join(columns)}")
+            
+            print(f"✅ Total entries: {count}")
+            
+            cursor.execute("SELECT created_at, updated_at FROM passwords LIMIT 1")
+            sample = cursor.fetchone()
+            if sample:
+                print(f"✅ Sample timestamps - Created: {sample[0]}, Updated: {sample[1]}")
+            
+            conn.commit()
+            cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            print("\n✨ Database fixed successfully! ✨")
+            print(f"A backup of your original database was created at: {backup_path}")
+            return True
             
-            print("✅ Successfully updated database schema")
-        
-        # Update the metadata table if it exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='metadata'")
-        if cursor.fetchone():
-            cursor.execute('''
-                UPDATE metadata 
-                SET value = '2.0.0', 
-                    updated_at = datetime('now')
-                WHERE key = 'schema_version'
-            ''')
-        
-        # Verify the changes
-        cursor.execute("PRAGMA table_info(passwords)")
-        columns = [row['name'] for row in cursor.fetchall()]
-        print(f"\n✅ Final schema: {', '.join(columns)}")
-        
-        cursor.execute("SELECT COUNT(*) FROM passwords")
-        count = cursor.fetchone()[0]
-        print(f"✅ Total entries: {count}")
-        
-        cursor.execute("SELECT created_at, updated_at FROM passwords LIMIT 1")
-        sample = cursor.fetchone()
-        if sample:
-            print(f"✅ Sample timestamps - Created: {sample['created_at']}, Updated: {sample['updated_at']}")
-        
-        conn.commit()
-        print("\n✨ Database fixed successfully! ✨")
-        print(f"A backup of your original database was created at: {backup_path}")
-        return True
-        
     except Exception as e:
         print(f"\n❌ Error: {e}")
         import traceback
         traceback.print_exc()
         
         # Try to restore from backup if something went wrong
-        if 'conn' in locals():
-            conn.rollback()
-            
         print("\n⚠️  Attempting to restore from backup...")
         try:
             if backup_path.exists():
-                shutil.copy2(backup_path, db_path)
+                backup_database(backup_path, db_path)
                 print("✅ Successfully restored database from backup")
             else:
                 print("❌ Backup file not found. Manual recovery may be needed.")
@@ -162,10 +163,6 @@ def fix_database():
             print(f"❌ Failed to restore from backup: {restore_error}")
             
         return False
-        
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 if __name__ == "__main__":
     print("🔧 Starting database repair...")
@@ -2,12 +2,13 @@
 """
 Fix the timestamp format issue in the database.
 """
-import sqlite3
 import os
+from contextlib import closing
 from pathlib import Path
-import shutil
 from datetime import datetime
 
+from _sqlite_util import backup_database, index_passwords, mark_migrated, open_tuned
+
 def fix_timestamps():
     """Fix timestamp format in the database."""
     db_path = Path(__file__).parent.parent / 'data' / 'passwords.db'
@@ -17,77 +18,100 @@ def fix_timestamps():
         print(f"Database file not found at {db_path}")
         return False
     
-    # Create a backup
-    shutil.copy2(db_path, backup_path)
-    print(f"Created backup at {backup_path}")
-    
     try:
         # Connect to the database
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        # Get the current schema
-        cursor.execute("PRAGMA table_info(passwords)")
-        columns = [col[1] for col in cursor.fetchall()]
-        
-        # Create a new table with the correct schema
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS passwords_new (
-                id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                username TEXT,
-                password_encrypted BLOB,
-                url TEXT,
-                notes_encrypted BLOB,
-                folder TEXT,
-                tags_encrypted BLOB,
-                created_at TEXT,
-                updated_at TEXT,
-                iv BLOB,
-                notes TEXT,
-                tags TEXT
-            )
-        ''')
-        
-        # Copy data from old table to new table, converting timestamps
-        cursor.execute('''
-            INSERT INTO passwords_new (
-                id, title, username, password_encrypted, url,
-                notes_encrypted, folder, tags_encrypted,
-                created_at, updated_at, iv, notes, tags
-            )
-            SELECT 
-                id, title, username, password_encrypted, url,
-                notes_encrypted, folder, tags_encrypted,
-                strftime('%Y-%m-%d %H:%M:%S', created_at, 'unixepoch'),
-                strftime('%Y-%m-%d %H:%M:%S', updated_at, 'unixepoch'),
-                iv, notes, tags
-            FROM passwords
-        ''')
-        
-        # Drop the old table and rename the new one
-        cursor.execute('DROP TABLE IF EXISTS passwords_old')
-        cursor.execute('ALTER TABLE passwords RENAME TO passwords_old')
-        cursor.execute('ALTER TABLE passwords_new RENAME TO passwords')
-        
-        # Verify the data
-        cursor.execute('SELECT id, title, created_at, updated_at FROM passwords LIMIT 5')
-        print("\nSample entries after migration:")
-        for row in cursor.fetchall():
-            print(f"ID: {row['id']}, Title: {row['title']}, Created: {row['created_at']}, Updated: {row['updated_at']}")
-        
-        conn.commit()
-        return True
-        
+        with closing(open_tuned(db_path, bulk=True)) as conn, conn:
+            cursor = conn.cursor()
+            
+            # Nothing to do once no epoch timestamps are left. The
+            # schema_version marker is not checked: other scripts set it
+            # without converting timestamps
+            cursor.execute('''
+                SELECT 1 FROM passwords
+                WHERE typeof(created_at) IN ('integer', 'real')
+                   OR typeof(updated_at) IN ('integer', 'real')
+                LIMIT 1
+            ''')
+            if cursor.fetchone() is None:
+                print("Timestamps are already stored as text, nothing to migrate")
+                return True
+            
+            # Create a backup
+            backup_database(db_path, backup_path)
+            print(f"Created backup at {backup_path}")
+            
+            # Dropping the old passwords table must not cascade into the sharing
+            # tables; foreign_keys cannot be changed inside the transaction
+            cursor.execute("PRAGMA foreign_keys = OFF")
+            cursor.execute("BEGIN IMMEDIATE")
+            
+            # Get the current schema
+            cursor.execute("PRAGMA table_info(passwords)")
+            columns = [col[1] for col in cursor.fetchall()]
+            
+            # Create a new table with the correct schema
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS passwords_new (
+                    id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    username TEXT,
+                    password_encrypted BLOB,
+                    url TEXT,
+                    notes_encrypted BLOB,
+                    folder TEXT,
+                    tags_encrypted BLOB,
+                    created_at TEXT,
+                    updated_at TEXT,
+                    iv BLOB,
+                    notes TEXT,
+                    tags TEXT
+                )
+            ''')
+            
+            # Copy data from old table to new table, converting epoch timestamps
+            # and keeping values that are already text
+            cursor.execute('''
+                INSERT INTO passwords_new (
+                    id, title, username, password_encrypted, url,
+                    notes_encrypted, folder, tags_encrypted,
+                    created_at, updated_at, iv, notes, tags
+                )
+                SELECT 
+                    id, title, username, password_encrypted, url,
+                    notes_encrypted, folder, tags_encrypted,
+                    CASE WHEN typeof(created_at) IN ('integer', 'real')
+                         THEN strftime('%Y-%m-%d %H:%M:%S', created_at, 'unixepoch')
+                         ELSE created_at END,
+                    CASE WHEN typeof(updated_at) IN ('integer', 'real')
+                         THEN strftime('%Y-%m-%d %H:%M:%S', updated_at, 'unixepoch')
+                         ELSE updated_at END,
+                    iv, notes, tags
+                FROM passwords
+            ''')
+            
+            # Replace the old table with the new one. Dropping it here instead of
+            # keeping passwords_old frees its pages without a separate VACUUM
+            cursor.execute('DROP TABLE IF EXISTS passwords_old')
+            cursor.execute('DROP TABLE passwords')
+            cursor.execute('ALTER TABLE passwords_new RENAME TO passwords')
+            index_passwords(cursor)
+            mark_migrated(cursor)
+            
+            # Verify the data
+            cursor.execute('SELECT id, title, created_at, updated_at FROM passwords LIMIT 5')
+            print("\nSample entries after migration:")
+            for entry_id, title, created_at, updated_at in cursor:
+                print(f"ID: {entry_id}, Title: {title}, Created: {created_at}, Updated: {updated_at}")
+            
+            conn.commit()
+            cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            return True
+            
     except Exception as e:
         print(f"Error during migration: {e}")
         import traceback
         traceback.print_exc()
         return False
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 if __name__ == "__main__":
     print("Fixing timestamp format in the database...")
@@ -2,12 +2,13 @@
 """
 Final script to fix timestamp format in the database.
 """
-import sqlite3
 import os
+from contextlib import closing
 from pathlib import Path
-import shutil
 from datetime import datetime
 
+from _sqlite_util import backup_database, index_passwords, open_tuned, table_columns
+
 def fix_timestamps():
     """Fix timestamp format in the database."""
     db_path = Path(__file__).parent.parent / 'data' / 'passwords.db'
@@ -18,112 +19,136 @@ def fix_timestamps():
         return False
     
     # Create a backup
-    shutil.copy2(db_path, backup_path)
+    backup_database(db_path, backup_path)
     print(f"✅ Created backup at {backup_path}")
     
     try:
         # Connect to the database
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        # Create a new table with TEXT type for timestamps
-        print("\n🔧 Creating new table with corrected schema...")
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS passwords_new (
-                id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                username TEXT,
-                password_encrypted BLOB,
-                url TEXT,
-                notes_encrypted BLOB,
-                folder TEXT,
-                tags_encrypted BLOB,
-                created_at TEXT,
-                updated_at TEXT,
-                iv BLOB,
-                notes TEXT,
-                tags TEXT
-            )
-        ''')
-        
-        # Copy data from old table to new table, converting timestamps
-        print("🔄 Copying data to new table...")
-        cursor.execute('''
-            -- First, handle NULL password_encrypted values by setting them to an empty BLOB
-            UPDATE passwords 
-            SET password_encrypted = x'' 
-            WHERE password_encrypted IS NULL;
+        with closing(open_tuned(db_path, bulk=True)) as conn, conn:
+            cursor = conn.cursor()
+            
+            # Dropping the old passwords table must not cascade into the sharing
+            # tables; foreign_keys cannot be changed inside the transaction
+            cursor.execute("PRAGMA foreign_keys = OFF")
+            
+            # Run the whole migration as a single transaction
+            cursor.execute("BEGIN IMMEDIATE")
+            
+            # Count the rows once; the copy below is checked against its rowcount
+            cursor.execute('SELECT COUNT(*) FROM passwords')
+            count = cursor.fetchone()[0]
+            
+            # Handle NULL password_encrypted values by setting them to an empty BLOB
+            cursor.execute('''
+                UPDATE passwords 
+                SET password_encrypted = x'' 
+                WHERE password_encrypted IS NULL
+            ''')
+            
+            # Add missing columns in place; ADD COLUMN does not rewrite rows
+            columns = table_columns(cursor, 'passwords')
+            for column in ('notes', 'tags'):
+                if column not in columns:
+                    print(f"🔄 Adding '{column}' column...")
+                    cursor.execute(f"ALTER TABLE passwords ADD COLUMN {column} TEXT")
+            
+            # Changing the timestamp column types needs a table rebuild, which
+            # is only worth doing while they still hold non-text values
+            cursor.execute('''
+                SELECT 1 FROM passwords
+                WHERE typeof(created_at) NOT IN ('text', 'null')
+                   OR typeof(updated_at) NOT IN ('text', 'null')
+                LIMIT 1
+            ''')
+            if cursor.fetchone() is None:
+                print("\n✅ Timestamps are already stored as text, no table rebuild needed")
+            else:
+                # Create a new table with TEXT type for timestamps
+                print("\n🔧 Creating new table with corrected schema...")
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS passwords_new (
+                        id TEXT PRIMARY KEY,
+                        title TEXT NOT NULL,
+                        username TEXT,
+                        password_encrypted BLOB,
+                        url TEXT,
+                        notes_encrypted BLOB,
+                        folder TEXT,
+                        tags_encrypted BLOB,
+                        created_at TEXT,
+                        updated_at TEXT,
+                        iv BLOB,
+                        notes TEXT,
+                        tags TEXT
+                    )
+                ''')
+                
+                # Copy data from old table to new table
+                print("🔄 Copying data to new table...")
+                cursor.execute('''
+                    INSERT INTO passwords_new (
+                        id, title, username, password_encrypted, url,
+                        notes_encrypted, folder, tags_encrypted,
+                        created_at, updated_at, iv, notes, tags
+                    )
+                    SELECT 
+                        id, title, username, 
+                        COALESCE(password_encrypted, x'') as password_encrypted, 
+                        url,
+                        notes_encrypted, folder, tags_encrypted,
+                        created_at, updated_at, iv, notes, tags
+                    FROM passwords
+                ''')
+                
+                # Verify the data was copied
+                new_count = cursor.rowcount
+                if new_count != count:
+                    print(f"❌ Error: Row count mismatch! Original: {count}, New: {new_count}")
+                    conn.rollback()
+                    return False
+                
+                # Replace the old table with the new one. Dropping it here instead of
+                # keeping passwords_old frees its pages without a separate VACUUM
+                print("🔄 Replacing old table with new one...")
+                cursor.execute('DROP TABLE IF EXISTS passwords_old')
+                cursor.execute('DROP TABLE passwords')
+                cursor.execute('ALTER TABLE passwords_new RENAME TO passwords')
+                index_passwords(cursor)
+            
+            # Update the metadata table to reflect the change
+            cursor.execute('''
+                UPDATE metadata 
+                SET value = '2.0.0'
+                WHERE key = 'schema_version'
+            ''')
+            
+            # Verify the data
+            print("\n✅ Verification:")
+            print(f"- Total entries: {count}")
+            
+            cursor.execute('SELECT created_at, updated_at FROM passwords LIMIT 1')
+            sample = cursor.fetchone()
+            if sample:
+                print(f"- Sample timestamps - Created: {sample[0]}, Updated: {sample[1]}")
+            
+            conn.commit()
+            cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            print("\n✅ Database migration completed successfully!")
+            print(f"A backup of your database was created at: {backup_path}")
+            print("You can now run the main application.")
+            
+            return True
             
-            -- Now insert all data into the new table
-            INSERT INTO passwords_new (
-                id, title, username, password_encrypted, url,
-                notes_encrypted, folder, tags_encrypted,
-                created_at, updated_at, iv, notes, tags
-            )
-            SELECT 
-                id, title, username, 
-                COALESCE(password_encrypted, x'') as password_encrypted, 
-                url,
-                notes_encrypted, folder, tags_encrypted,
-                created_at, updated_at, iv, notes, tags
-            FROM passwords
-        ''')
-        
-        # Verify the data was copied
-        cursor.execute('SELECT COUNT(*) FROM passwords_new')
-        new_count = cursor.fetchone()[0]
-        cursor.execute('SELECT COUNT(*) FROM passwords')
-        old_count = cursor.fetchone()[0]
-        
-        if new_count != old_count:
-            print(f"❌ Error: Row count mismatch! Original: {old_count}, New: {new_count}")
-            return False
-        
-        # Drop the old table and rename the new one
-        print("🔄 Replacing old table with new one...")
-        cursor.execute('DROP TABLE IF EXISTS passwords_old')
-        cursor.execute('ALTER TABLE passwords RENAME TO passwords_old')
-        cursor.execute('ALTER TABLE passwords_new RENAME TO passwords')
-        
-        # Update the metadata table to reflect the change
-        cursor.execute('''
-            UPDATE metadata 
-            SET value = '2.0.0', 
-                updated_at = datetime('now')
-            WHERE key = 'schema_version'
-        ''')
-        
-        # Verify the data
-        print("\n✅ Verification:")
-        cursor.execute('SELECT COUNT(*) FROM passwords')
-        count = cursor.fetchone()[0]
-        print(f"- Total entries: {count}")
-        
-        cursor.execute('SELECT created_at, updated_at FROM passwords LIMIT 1')
-        sample = cursor.fetchone()
-        print(f"- Sample timestamps - Created: {sample[0]}, Updated: {sample[1]}")
-        
-        conn.commit()
-        print("\n✅ Database migration completed successfully!")
-        print(f"A backup of your database was created at: {backup_path}")
-        print("You can now run the main application.")
-        
-        return True
-        
     except Exception as e:
         print(f"\n❌ Error during migration: {e}")
         import traceback
         traceback.print_exc()
         
         # Try to restore from backup if something went wrong
-        if 'conn' in locals():
-            conn.rollback()
-            
         print("\n⚠️  Attempting to restore from backup...")
         try:
             if backup_path.exists():
-                shutil.copy2(backup_path, db_path)
+                backup_database(backup_path, db_path)
                 print("✅ Successfully restored database from backup")
             else:
                 print("❌ Backup file not found. Manual recovery may be needed.")
@@ -131,10 +156,6 @@ def fix_timestamps():
             print(f"❌ Failed to restore from backup: {restore_error}")
             
         return False
-        
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 if __name__ == "__main__":
     print("🔧 Starting database migration to fix timestamp format...")
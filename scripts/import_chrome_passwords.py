@@ -6,6 +6,7 @@ import os
 import sys
 import csv
 import json
+import logging
 from pathlib import Path
 from datetime import datetime
 
@@ -16,8 +17,14 @@ if project_root not in sys.path:
 
 from src.core.importers.chrome_importer import ChromeImporter
 from src.core.database import DatabaseManager
+from src.core.db_pool import get_conn
 from src.core.models import PasswordEntry
 
+logger = logging.getLogger(__name__)
+
+# Errors are logged here instead of printing tracebacks to the console
+LOG_FILE = Path(project_root) / 'logs' / 'import_chrome_passwords.log'
+
 def import_chrome_passwords(csv_path=None):
     """Import Chrome passwords from a CSV file."""
     try:
@@ -34,7 +41,8 @@ def import_chrome_passwords(csv_path=None):
             master_password = getpass.getpass("Enter master password: ")
             
         # Initialize database manager
-        db = DatabaseManager(db_path=str(db_path), master_password=master_password)
+        db = DatabaseManager(db_path=str(db_path), master_password=master_password,
+                             conn=get_conn(db_path))
         
         # If no CSV path provided, use a default location or prompt
         if not csv_path:
@@ -54,37 +62,37 @@ def import_chrome_passwords(csv_path=None):
         print(f"\n🔍 Found {csv_path}")
         print("🔐 Importing passwords...")
         
-        # Import passwords
+        # Stream the CSV into the database in batches of 1000 entries
         importer = ChromeImporter()
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            entries = importer.import_from_csv(f)
+        success_count = db.save_entries_bulk(
+            importer.iter_from_csv(csv_path),
+            progress_callback=lambda done: sys.stdout.write(f"\r  Imported {done} entries")
+        )
+        if success_count:
+            sys.stdout.write("\n")
+            sys.stdout.flush()
         
-        if not entries:
+        stats = importer.get_import_stats()
+        if not stats.total:
             print("❌ No entries found in the CSV file.")
             return False
         
-        print(f"✅ Found {len(entries)} entries to import.")
-        
-        # Import into database
-        success_count = 0
-        for entry in entries:
-            try:
-                db.save_entry(entry)
-                success_count += 1
-                print(f"  ✓ Imported: {entry.title}")
-            except Exception as e:
-                print(f"  ✗ Failed to import {entry.title}: {str(e)}")
-        
-        print(f"\n✅ Successfully imported {success_count} out of {len(entries)} entries.")
+        print(f"\n✅ Successfully imported {success_count} out of {stats.total} entries.")
         return True
         
     except Exception as e:
-        print(f"❌ Error during import: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Chrome password import failed")
+        print(f"\n❌ Error during import: {str(e)} (details in {LOG_FILE})")
         return False
 
 if __name__ == "__main__":
+    LOG_FILE.parent.mkdir(exist_ok=True)
+    logging.basicConfig(
+        level=logging.ERROR,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.FileHandler(LOG_FILE, encoding='utf-8')]
+    )
+    
     print("🔑 Chrome Password Import Tool\n" + "="*40)
     
     # Check for CSV path argument
@@ -94,4 +102,4 @@ if __name__ == "__main__":
         print("\n✅ Import completed successfully!")
         print("You can now run the main application to view your passwords.")
     else:
-        print("\n❌ Import failed. Please check the error messages above.")
+        print(f"\n❌ Import failed. Please check the error messages above and {LOG_FILE}.")
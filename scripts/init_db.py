@@ -12,9 +12,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from PySide6.QtWidgets import QApplication, QMessageBox, QInputDialog
 
+from _qt_util import get_qapp
+
 # Import local modules
 try:
     from src.core.database import DatabaseManager
+    from src.core.db_pool import get_conn
     from src.utils.logging_config import setup_logging, get_logger
 except ImportError as e:
     # If running the script directly, add src to path
@@ -22,6 +25,7 @@ except ImportError as e:
     if str(src_dir) not in sys.path:
         sys.path.insert(0, str(src_dir))
     from core.database import DatabaseManager
+    from core.db_pool import get_conn
     from utils.logging_config import setup_logging, get_logger
 
 # Set up logging
@@ -45,12 +49,8 @@ def init_database(app=None):
         app: Optional QApplication instance. If None, a new one will be created.
     """
     try:
-        app_created = False
-        if QApplication.instance() is None:
-            app = QApplication(sys.argv)
-            app_created = True
-        else:
-            app = QApplication.instance()
+        app_created = QApplication.instance() is None
+        app = get_qapp()
         
         # Get database path
         app_data_dir = get_app_data_path()
@@ -83,7 +83,7 @@ def init_database(app=None):
         app_data_dir.mkdir(parents=True, exist_ok=True)
         
         # Initialize database
-        db = DatabaseManager(str(db_path))
+        db = DatabaseManager(str(db_path), conn=get_conn(db_path))
         db.set_master_password(password)
         
         logger.info(f"Successfully created new database at {db_path}")
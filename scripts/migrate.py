@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Versioned schema migrator for the password database.
+
+Each step is applied once, in its own transaction, and recorded in
+``PRAGMA user_version`` so later runs skip it with an integer compare
+instead of re-inspecting the schema. All pending steps share one
+connection and its page cache, and the WAL is checkpointed once at the end.
+"""
+import sys
+from contextlib import closing
+from pathlib import Path
+
+from _sqlite_util import (
+    DB_PATH, PASSWORDS_INDEXES_SQL, backup_database, open_tuned, table_columns
+)
+
+SHARING_TABLES = ('password_shares', 'access_requests', 'share_activities')
+
+# Password sharing tables and their indexes
+SHARING_TABLES_DDL = """
+CREATE TABLE IF NOT EXISTS password_shares (
+    id TEXT PRIMARY KEY,
+    entry_id TEXT NOT NULL,
+    from_user TEXT NOT NULL,
+    to_email TEXT NOT NULL,
+    encrypted_data BLOB NOT NULL,
+    encryption_key_encrypted BLOB NOT NULL,
+    iv BLOB NOT NULL,
+    permissions TEXT NOT NULL,
+    expires_at TIMESTAMP NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_used BOOLEAN DEFAULT 0,
+    is_revoked BOOLEAN DEFAULT 0,
+    message TEXT,
+    FOREIGN KEY (entry_id) REFERENCES passwords (id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS access_requests (
+    id TEXT PRIMARY KEY,
+    share_id TEXT NOT NULL,
+    requester_email TEXT NOT NULL,
+    request_message TEXT,
+    status TEXT NOT NULL, -- 'pending', 'approved', 'rejected', 'revoked'
+    requested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    responded_at TIMESTAMP,
+    response_message TEXT,
+    FOREIGN KEY (share_id) REFERENCES password_shares (id) ON DELETE CASCADE
+);
+
+-- Audit log of share activity
+CREATE TABLE IF NOT EXISTS share_activities (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    share_id TEXT NOT NULL,
+    activity_type TEXT NOT NULL, -- 'created', 'viewed', 'revoked', 'expired', 'accepted', 'rejected'
+    performed_by TEXT NOT NULL,  -- Email of the user who performed the action
+    performed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    ip_address TEXT,
+    user_agent TEXT,
+    message TEXT,
+    FOREIGN KEY (share_id) REFERENCES password_shares (id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_share_entry ON password_shares(entry_id);
+CREATE INDEX IF NOT EXISTS idx_share_to_email ON password_shares(to_email);
+CREATE INDEX IF NOT EXISTS idx_share_from_user ON password_shares(from_user);
+CREATE INDEX IF NOT EXISTS idx_access_share_id ON access_requests(share_id);
+CREATE INDEX IF NOT EXISTS idx_activities_share_id ON share_activities(share_id);
+"""
+
+# Target schema of the passwords table
+PASSWORDS_TABLE_DDL = """
+CREATE TABLE passwords_new (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    username TEXT,
+    password_encrypted BLOB,
+    url TEXT,
+    notes_encrypted BLOB,
+    folder TEXT,
+    tags_encrypted BLOB,
+    created_at TIMESTAMP,
+    updated_at TIMESTAMP,
+    iv BLOB,
+    notes TEXT,
+    tags TEXT
+);
+"""
+
+# Numeric (epoch) timestamps become 'YYYY-MM-DD HH:MM:SS' in local time.
+# Values SQLite cannot convert fall back to the current time; empty and
+# non-numeric values are kept as they are.
+TIMESTAMP_SQL = (
+    "CASE WHEN typeof({col}) IN ('integer', 'real') AND {col} <> 0 "
+    "THEN COALESCE(strftime('%Y-%m-%d %H:%M:%S', {col}, 'unixepoch', 'localtime'), "
+    "strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')) "
+    "ELSE {col} END"
+)
+
+# Matches rows that still hold an epoch timestamp
+NUMERIC_TIMESTAMPS_WHERE = (
+    "(typeof(created_at) IN ('integer', 'real') AND created_at <> 0) "
+    "OR (typeof(updated_at) IN ('integer', 'real') AND updated_at <> 0)"
+)
+
+NEW_PASSWORDS_COLUMNS = (
+    'id', 'title', 'username', 'password_encrypted', 'url', 'notes_encrypted',
+    'folder', 'tags_encrypted', 'created_at', 'updated_at', 'iv', 'notes', 'tags'
+)
+
+
+def rebuild_passwords_sql(cursor):
+    """Build the SQL that rebuilds the passwords table with relaxed constraints.
+
+    Every column shared by the old and new tables is copied inside SQLite,
+    filling in a random id and an 'Untitled' title where they are missing.
+    """
+    columns = table_columns(cursor, 'passwords')
+    cols = [col for col in NEW_PASSWORDS_COLUMNS if col in columns]
+    required = {
+        'id': "COALESCE(NULLIF(id, ''), lower(hex(randomblob(8))))",
+        'title': "COALESCE(NULLIF(title, ''), 'Untitled')",
+    }
+    select_list = ', '.join(required.get(col, col) for col in cols)
+    return (
+        PASSWORDS_TABLE_DDL
+        + f"INSERT INTO passwords_new ({', '.join(cols)}) SELECT {select_list} FROM passwords;\n"
+        + "DROP TABLE passwords;\n"
+        + "ALTER TABLE passwords_new RENAME TO passwords;\n"
+        + PASSWORDS_INDEXES_SQL
+    )
+
+
+def add_column_sql(table, column, definition):
+    """Build a step that adds a column unless the table already has it.
+
+    detect_version() stops at the first missing change, so later steps may
+    find their column already in place.
+    """
+    def build(cursor):
+        if column in table_columns(cursor, table):
+            return ""
+        return f"ALTER TABLE {table} ADD COLUMN {column} {definition};"
+    return build
+
+
+def share_message_sql(cursor):
+    """Build the SQL that adds share_activities.message to older databases.
+
+    Sharing tables created by step 3 already have the column.
+    """
+    if 'message' in table_columns(cursor, 'share_activities'):
+        return ""
+    return "ALTER TABLE share_activities ADD COLUMN message TEXT;"
+
+
+# Epoch timestamps are rewritten in place; the column types do not change
+TIMESTAMPS_SQL = (
+    "UPDATE passwords SET "
+    f"created_at = {TIMESTAMP_SQL.format(col='created_at')}, "
+    f"updated_at = {TIMESTAMP_SQL.format(col='updated_at')} "
+    f"WHERE {NUMERIC_TIMESTAMPS_WHERE};"
+)
+
+
+# (version, description, SQL or callable(cursor) returning SQL).
+# Every step must be idempotent; see detect_version().
+STEPS = [
+    (1, "add notes column", add_column_sql('passwords', 'notes', 'TEXT')),
+    (2, "add tags column", add_column_sql('passwords', 'tags', 'TEXT')),
+    (3, "add password sharing tables", SHARING_TABLES_DDL),
+    (4, "rebuild passwords table with relaxed constraints", rebuild_passwords_sql),
+    (5, "add message column to share_activities", share_message_sql),
+    (6, "store epoch timestamps as text", TIMESTAMPS_SQL),
+]
+
+LATEST_VERSION = STEPS[-1][0]
+
+
+def detect_version(cursor):
+    """Infer the schema version of a database created before versioning.
+
+    Returns the number of leading steps whose changes are already present.
+    Steps after the first missing change are all rerun, so each of them
+    must be safe to apply to a database that already has it.
+    """
+    columns = table_columns(cursor, 'passwords')
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    tables = {row[0] for row in cursor.fetchall()}
+    cursor.execute(
+        "SELECT \"notnull\" FROM pragma_table_info('passwords') "
+        "WHERE name = 'password_encrypted'"
+    )
+    result = cursor.fetchone()
+    share_columns = table_columns(cursor, 'share_activities')
+    cursor.execute(f"SELECT 1 FROM passwords WHERE {NUMERIC_TIMESTAMPS_WHERE} LIMIT 1")
+    numeric_timestamps = cursor.fetchone() is not None
+
+    applied = [
+        'notes' in columns,
+        'tags' in columns,
+        all(table in tables for table in SHARING_TABLES),
+        result is not None and not result[0],
+        'message' in share_columns,
+        not numeric_timestamps,
+    ]
+    version = 0
+    for is_applied in applied:
+        if not is_applied:
+            break
+        version += 1
+    return version
+
+
+def migrate(db_path=DB_PATH, target=LATEST_VERSION):
+    """Bring the database schema up to the given version.
+
+    Args:
+        db_path: Path to the database file
+        target: Schema version to migrate to
+
+    Returns:
+        bool: True if the database is at (or above) the target version
+    """
+    db_path = Path(db_path)
+    if not db_path.exists():
+        print(f"Database file not found at {db_path}")
+        return False
+
+    try:
+        with closing(open_tuned(db_path)) as conn:
+            cursor = conn.cursor()
+
+            if not table_columns(cursor, 'passwords'):
+                print("The passwords table does not exist. Nothing to migrate.")
+                return False
+
+            cursor.execute("PRAGMA user_version")
+            version = cursor.fetchone()[0]
+            if version == 0:
+                version = detect_version(cursor)
+                cursor.execute(f"PRAGMA user_version = {version}")
+
+            pending = [step for step in STEPS if version < step[0] <= target]
+            if not pending:
+                print(f"Database schema is up to date (version {version}).")
+                return True
+
+            backup_path = db_path.with_suffix('.db.backup')
+            backup_database(db_path, backup_path)
+            print(f"Created backup at {backup_path}")
+
+            # The passwords rebuild drops the old table, which must not
+            # cascade into the sharing tables
+            cursor.execute("PRAGMA foreign_keys = OFF")
+            try:
+                for step_version, description, step in pending:
+                    print(f"Applying migration {step_version}: {description}...")
+                    sql = step(cursor) if callable(step) else step
+                    conn.executescript(
+                        f"BEGIN IMMEDIATE;\n{sql}\n"
+                        f"PRAGMA user_version = {step_version};\nCOMMIT;"
+                    )
+            except Exception:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+            finally:
+                cursor.execute("PRAGMA foreign_keys = ON")
+
+            # Fold the WAL back into the main file once, after every step
+            cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+            print(f"Database schema migrated to version {pending[-1][0]}.")
+            return True
+
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    sys.exit(0 if migrate() else 1)
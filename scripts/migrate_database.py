@@ -4,47 +4,69 @@ Migrate data to a new database with the correct schema.
 """
 import sqlite3
 import os
-import shutil
+from contextlib import closing
 from pathlib import Path
 from datetime import datetime
 
+from _sqlite_util import clone_database, index_passwords, table_columns, tune
+
+# Rows fetched from the old database per batch
+FETCH_SIZE = 10000
+
+# Columns of the new passwords table, in insert order
+PASSWORDS_COLUMNS = (
+    'id', 'title', 'username', 'password_encrypted', 'url',
+    'notes_encrypted', 'folder', 'tags_encrypted',
+    'created_at', 'updated_at', 'iv', 'notes', 'tags'
+)
+
+# Rarely used columns; they are left out of the copy when no old row has them
+SPARSE_COLUMNS = ('notes_encrypted', 'tags_encrypted', 'notes', 'tags')
+
+# Values used for NOT NULL columns that are NULL or missing in the old table
+COLUMN_DEFAULTS = {
+    'title': "''",
+    'password_encrypted': "x''",
+    'iv': "x''"
+}
+
+# Schema of the new database, created with a single executescript() call
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS passwords (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    username TEXT,
+    password_encrypted BLOB NOT NULL DEFAULT x'',
+    url TEXT,
+    notes_encrypted BLOB,
+    folder TEXT,
+    tags_encrypted BLOB,
+    created_at TEXT,
+    updated_at TEXT,
+    iv BLOB NOT NULL DEFAULT x'',
+    notes TEXT,
+    tags TEXT
+);
+
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT,
+    created_at TEXT,
+    updated_at TEXT
+);
+"""
+
+
 def create_new_database(new_db_path):
     """Create a new database with the correct schema."""
-    conn = sqlite3.connect(str(new_db_path))
-    cursor = conn.cursor()
+    conn = tune(sqlite3.connect(str(new_db_path)))
     
-    # Create the passwords table with the correct schema
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS passwords (
-        id TEXT PRIMARY KEY,
-        title TEXT NOT NULL,
-        username TEXT,
-        password_encrypted BLOB NOT NULL DEFAULT x'',
-        url TEXT,
-        notes_encrypted BLOB,
-        folder TEXT,
-        tags_encrypted BLOB,
-        created_at TEXT,
-        updated_at TEXT,
-        iv BLOB NOT NULL DEFAULT x'',
-        notes TEXT,
-        tags TEXT
-    )
-    ''')
-    
-    # Create metadata table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS metadata (
-        key TEXT PRIMARY KEY,
-        value TEXT,
-        created_at TEXT,
-        updated_at TEXT
-    )
-    ''')
+    # Create the passwords and metadata tables in one call
+    conn.executescript(SCHEMA_SQL)
     
     # Set the schema version
     now = datetime.now().isoformat()
-    cursor.execute('''
+    conn.execute('''
     INSERT OR REPLACE INTO metadata (key, value, created_at, updated_at)
     VALUES (?, ?, ?, ?)
     ''', ('schema_version', '2.0.0', now, now))
@@ -52,68 +74,86 @@ def create_new_database(new_db_path):
     conn.commit()
     return conn
 
+def copied_columns(cursor, old_columns):
+    """Return the columns worth copying from the old passwords table, in insert order.
+
+    The sparse columns are probed with a single COUNT query and left out when
+    they are missing or entirely NULL, so they fall back to their defaults
+    without being bound for every row.
+    """
+    present = [col for col in SPARSE_COLUMNS if col in old_columns]
+    used = set()
+    if present:
+        cursor.execute(f"SELECT {', '.join(f'COUNT({col})' for col in present)} FROM passwords")
+        used = {col for col, count in zip(present, cursor.fetchone()) if count}
+    return [col for col in PASSWORDS_COLUMNS if col not in SPARSE_COLUMNS or col in used]
+
+def select_passwords_sql(columns, old_columns):
+    """Build the SELECT that reads the old passwords table in the given column order.
+
+    Columns missing from the old table are read as their fallback value, and
+    the NOT NULL columns are COALESCEd, so the rows can be inserted as-is.
+    """
+    exprs = []
+    for col in columns:
+        default = COLUMN_DEFAULTS.get(col, 'NULL')
+        if col not in old_columns:
+            exprs.append(default)
+        elif col in COLUMN_DEFAULTS:
+            exprs.append(f"COALESCE({col}, {default})")
+        else:
+            exprs.append(col)
+    return f"SELECT {', '.join(exprs)} FROM passwords"
+
+def insert_passwords_sql(columns):
+    """Build the INSERT for the given columns of the new passwords table."""
+    return f'''
+        INSERT INTO passwords ({', '.join(columns)})
+        VALUES ({', '.join('?' * len(columns))})
+    '''
+
 def migrate_data(old_db_path, new_db_path):
     """Migrate data from old database to new database."""
     # Connect to both databases
-    old_conn = sqlite3.connect(str(old_db_path))
-    old_conn.row_factory = sqlite3.Row
-    old_cursor = old_conn.cursor()
-    
-    new_conn = create_new_database(new_db_path)
-    new_cursor = new_conn.cursor()
-    
-    try:
-        # Get all data from the old passwords table
-        old_cursor.execute('SELECT * FROM passwords')
-        rows = old_cursor.fetchall()
+    with closing(tune(sqlite3.connect(str(old_db_path)), readonly=True)) as old_conn, \
+            closing(create_new_database(new_db_path)) as new_conn:
+        old_cursor = old_conn.cursor()
+        # Manage the transaction explicitly instead of the implicit BEGIN
+        new_conn.isolation_level = None
+        new_cursor = new_conn.cursor()
         
-        # Insert data into the new database
-        for row in rows:
-            # Convert row to dict for easier handling
-            row_dict = dict(row)
+        try:
+            # Stream the old passwords table in batches instead of loading it whole
+            old_columns = table_columns(old_cursor, 'passwords')
+            columns = copied_columns(old_cursor, old_columns)
+            old_cursor.execute(select_passwords_sql(columns, old_columns))
+            insert_sql = insert_passwords_sql(columns)
             
-            # Handle NULL values
-            if 'password_encrypted' not in row_dict or row_dict['password_encrypted'] is None:
-                row_dict['password_encrypted'] = b''
-            if 'iv' not in row_dict or row_dict['iv'] is None:
-                row_dict['iv'] = b''
+            # Insert data into the new database in a single transaction
+            count = 0
+            new_cursor.execute('BEGIN')
+            while True:
+                rows = old_cursor.fetchmany(FETCH_SIZE)
+                if not rows:
+                    break
+                new_cursor.executemany(insert_sql, rows)
+                count += len(rows)
             
-            # Insert the row into the new database
-            new_cursor.execute('''
-                INSERT INTO passwords (
-                    id, title, username, password_encrypted, url,
-                    notes_encrypted, folder, tags_encrypted,
-                    created_at, updated_at, iv, notes, tags
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                row_dict.get('id'),
-                row_dict.get('title', ''),
-                row_dict.get('username'),
-                row_dict.get('password_encrypted', b''),
-                row_dict.get('url'),
-                row_dict.get('notes_encrypted'),
-                row_dict.get('folder'),
-                row_dict.get('tags_encrypted'),
-                row_dict.get('created_at'),
-                row_dict.get('updated_at'),
-                row_dict.get('iv', b''),
-                row_dict.get('notes'),
-                row_dict.get('tags')
-            ))
-        
-        # Commit the changes
-        new_conn.commit()
-        print(f"✅ Successfully migrated {len(rows)} entries to the new database.")
-        
-    except Exception as e:
-        print(f"❌ Error during migration: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-    finally:
-        old_conn.close()
-        new_conn.close()
+            # Build the indexes once the rows are in, rather than maintaining
+            # them during the copy, and refresh the planner statistics
+            index_passwords(new_cursor)
+            
+            # Commit the changes
+            new_cursor.execute('COMMIT')
+            print(f"✅ Successfully migrated {count} entries to the new database.")
+            
+        except Exception as e:
+            if new_conn.in_transaction:
+                new_cursor.execute('ROLLBACK')
+            print(f"❌ Error during migration: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
     
     return True
 
@@ -132,7 +172,7 @@ def main():
     print(f"🔄 Creating new database at {new_db_path}")
     
     # Create a backup of the old database
-    shutil.copy2(old_db_path, backup_path)
+    clone_database(old_db_path, backup_path)
     print(f"✅ Created backup at {backup_path}")
     
     # Migrate the data
@@ -3,8 +3,11 @@ Migration script to update empty passwords to use NULL instead of encrypted empt
 """
 import sqlite3
 import logging
+from contextlib import closing
 from pathlib import Path
 
+from _sqlite_util import index_passwords, table_columns, tune
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -21,98 +24,119 @@ def migrate_empty_passwords():
         return False
 
     try:
-        conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
-        
-        # Enable foreign keys
-        cursor.execute("PRAGMA foreign_keys = ON")
-        
-        # Begin transaction
-        conn.execute("BEGIN TRANSACTION")
-        
-        try:
-            # First, update the schema to allow NULL in password_encrypted and iv
-            logger.info("Updating database schema...")
-            
-            # Create a new temporary table with the updated schema
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS passwords_new (
-                    id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    username TEXT,
-                    password_encrypted BLOB,
-                    url TEXT,
-                    notes_encrypted BLOB,
-                    folder TEXT,
-                    tags_encrypted BLOB,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    iv BLOB
-                )
-            """)
-            
-            # Copy all data to the new table
-            logger.info("Copying data to new table...")
-            cursor.execute("""
-                INSERT INTO passwords_new
-                SELECT * FROM passwords
-            """)
-            
-            # Count empty passwords before migration
-            cursor.execute("""
-                SELECT COUNT(*) 
-                FROM passwords 
-                WHERE password_encrypted IS NOT NULL 
-                AND LENGTH(password_encrypted) = 16
-            """)
-            empty_count = cursor.fetchone()[0]
-            logger.info(f"Found {empty_count} potentially empty passwords")
-            
-            # Update empty passwords to use NULL
-            cursor.execute("""
-                UPDATE passwords_new 
-                SET password_encrypted = NULL, iv = NULL
-                WHERE password_encrypted IS NOT NULL 
-                AND LENGTH(password_encrypted) = 16
-            """)
-            
-            updated_count = cursor.rowcount
-            logger.info(f"Updated {updated_count} empty passwords to use NULL")
+        with closing(tune(sqlite3.connect(str(db_path)))) as conn, conn:
+            cursor = conn.cursor()
             
-            # Verify the update
+            # Without NOT NULL on password_encrypted and iv there is no schema
+            # to change, so the empty passwords are cleared in place
             cursor.execute("""
-                SELECT COUNT(*) 
-                FROM passwords_new 
-                WHERE password_encrypted IS NULL 
-                AND iv IS NULL
+                SELECT COUNT(*) FROM pragma_table_info('passwords')
+                WHERE name IN ('password_encrypted', 'iv') AND "notnull"
             """)
-            null_count = cursor.fetchone()[0]
-            logger.info(f"Total NULL passwords after update: {null_count}")
-            
-            # Rename tables
-            logger.info("Replacing old table with new schema...")
-            cursor.execute("ALTER TABLE passwords RENAME TO passwords_old")
-            cursor.execute("ALTER TABLE passwords_new RENAME TO passwords")
-            
-            # Drop the old table
-            cursor.execute("DROP TABLE IF EXISTS passwords_old")
+            if not cursor.fetchone()[0]:
+                logger.info("Schema already allows NULL passwords, updating in place...")
+                cursor.execute("""
+                    UPDATE passwords 
+                    SET password_encrypted = NULL, iv = NULL
+                    WHERE LENGTH(password_encrypted) = 16
+                """)
+                conn.commit()
+                logger.info(f"Updated {cursor.rowcount} empty passwords to use NULL")
+                return True
             
-            # Commit the transaction
-            conn.commit()
-            logger.info("Migration completed successfully")
-            return True
+            # Dropping the old passwords table must not cascade into the sharing
+            # tables; foreign_keys cannot be changed inside the transaction
+            cursor.execute("PRAGMA foreign_keys = OFF")
             
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Error during migration: {str(e)}", exc_info=True)
-            return False
+            # Begin transaction
+            conn.execute("BEGIN TRANSACTION")
             
+            try:
+                # First, update the schema to allow NULL in password_encrypted and iv
+                logger.info("Updating database schema...")
+                columns = table_columns(cursor, 'passwords')
+                
+                # Create a new temporary table with the updated schema
+                cursor.execute("""
+                    CREATE TABLE passwords_new (
+                        id TEXT PRIMARY KEY,
+                        title TEXT NOT NULL,
+                        username TEXT,
+                        password_encrypted BLOB,
+                        url TEXT,
+                        notes_encrypted BLOB,
+                        folder TEXT,
+                        tags_encrypted BLOB,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        iv BLOB,
+                        notes TEXT,
+                        tags TEXT
+                    )
+                """)
+                
+                # Count empty passwords before migration
+                cursor.execute("""
+                    SELECT COUNT(*) 
+                    FROM passwords 
+                    WHERE password_encrypted IS NOT NULL 
+                    AND LENGTH(password_encrypted) = 16
+                """)
+                empty_count = cursor.fetchone()[0]
+                logger.info(f"Found {empty_count} potentially empty passwords")
+                
+                # Copy all data to the new table, writing NULL for the empty
+                # passwords on the way instead of updating them afterwards
+                logger.info("Copying data to new table...")
+                cursor.execute(f"""
+                    INSERT INTO passwords_new (
+                        id, title, username, password_encrypted, url,
+                        notes_encrypted, folder, tags_encrypted,
+                        created_at, updated_at, iv, notes, tags
+                    )
+                    SELECT
+                        id, title, username,
+                        CASE WHEN LENGTH(password_encrypted) = 16
+                            THEN NULL ELSE password_encrypted END,
+                        url, notes_encrypted, folder, tags_encrypted,
+                        created_at, updated_at,
+                        CASE WHEN LENGTH(password_encrypted) = 16
+                            THEN NULL ELSE iv END,
+                        {'notes' if 'notes' in columns else 'NULL'},
+                        {'tags' if 'tags' in columns else 'NULL'}
+                    FROM passwords
+                """)
+                logger.info(f"Updated {empty_count} empty passwords to use NULL")
+                
+                # Verify the update
+                cursor.execute("""
+                    SELECT COUNT(*) 
+                    FROM passwords_new 
+                    WHERE password_encrypted IS NULL 
+                    AND iv IS NULL
+                """)
+                null_count = cursor.fetchone()[0]
+                logger.info(f"Total NULL passwords after update: {null_count}")
+                
+                # Replace the old table with the new one
+                logger.info("Replacing old table with new schema...")
+                cursor.execute("DROP TABLE passwords")
+                cursor.execute("ALTER TABLE passwords_new RENAME TO passwords")
+                index_passwords(cursor)
+                
+                # Commit the transaction
+                conn.commit()
+                logger.info("Migration completed successfully")
+                return True
+                
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Error during migration: {str(e)}", exc_info=True)
+                return False
+                
     except Exception as e:
         logger.error(f"Database error: {str(e)}", exc_info=True)
         return False
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 if __name__ == "__main__":
     print("Starting empty password migration...")
@@ -9,8 +9,11 @@ from pathlib import Path
 # Add the parent directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from PySide6.QtWidgets import QApplication, QMessageBox
+from PySide6.QtWidgets import QMessageBox
+
+from _qt_util import get_qapp
 from src.core.database import DatabaseManager
+from src.core.db_pool import get_conn
 from src.ui.password_dialog import PasswordDialog
 
 def get_app_data_path() -> Path:
@@ -27,7 +30,7 @@ def set_master_password():
     """Set or update the master password."""
     try:
         # Initialize QApplication
-        app = QApplication(sys.argv)
+        app = get_qapp()
         
         # Set up database path
         app_data_dir = get_app_data_path()
@@ -44,7 +47,7 @@ def set_master_password():
             return 0
         
         # Initialize database
-        db = DatabaseManager(str(db_path))
+        db = DatabaseManager(str(db_path), conn=get_conn(db_path))
         
         # Set or update the master password
         if is_new_db:
@@ -11,6 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core.database import DatabaseManager
+from src.core.db_pool import get_conn
 
 def get_app_data_path() -> Path:
     """Get the application data directory."""
@@ -49,7 +50,7 @@ def set_master_password():
             break
         
         # Initialize database
-        db = DatabaseManager(str(db_path))
+        db = DatabaseManager(str(db_path), conn=get_conn(db_path))
         
         # Set or update the master password
         if is_new_db:
@@ -9,8 +9,9 @@ from pathlib import Path
 # Add the parent directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from PySide6.QtWidgets import QApplication, QMessageBox
+from _qt_util import get_qapp
 from src.core.database import DatabaseManager
+from src.core.db_pool import get_conn
 from src.utils.logging_config import setup_logging, get_logger
 
 # Set up logging
@@ -28,6 +29,8 @@ def get_app_data_path() -> Path:
 
 def setup_master_password():
     """Set up or update the master password."""
+    # Qt is only imported once a dialog is about to be shown
+    QMessageBox = None
     try:
         # Set up database path
         app_data_dir = get_app_data_path()
@@ -38,6 +41,8 @@ def setup_master_password():
         is_new_db = not db_path.exists()
         
         # Get password from user
+        get_qapp()
+        from PySide6.QtWidgets import QMessageBox
         from src.ui.password_dialog import PasswordDialog
         password = PasswordDialog.get_password(is_new_db=is_new_db)
         
@@ -46,7 +51,7 @@ def setup_master_password():
             return 1
         
         # Initialize database
-        db = DatabaseManager(str(db_path))
+        db = DatabaseManager(str(db_path), conn=get_conn(db_path))
         
         # Set or update the master password
         if is_new_db:
@@ -86,13 +91,15 @@ def setup_master_password():
         
     except Exception as e:
         logger.exception("Error in setup_master_password")
-        QMessageBox.critical(
-            None,
-            "Error",
-            f"An error occurred: {str(e)}\n\nCheck the logs for more details."
-        )
+        if QMessageBox is None:
+            print(f"An error occurred: {str(e)}", file=sys.stderr)
+        else:
+            QMessageBox.critical(
+                None,
+                "Error",
+                f"An error occurred: {str(e)}\n\nCheck the logs for more details."
+            )
         return 1
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
     sys.exit(setup_master_password())
@@ -4,22 +4,100 @@ Simple script to import Chrome passwords directly into the database.
 """
 import csv
 import sqlite3
+from contextlib import closing
 from pathlib import Path
 from datetime import datetime
 import getpass
 import hashlib
 import os
+from itertools import chain, islice
+
+from _sqlite_util import tune
+
+# Rows per executemany() call
+BATCH_SIZE = 1000
+
+# SQLite's default limit on host parameters in one statement
+MAX_VARIABLES = 999
+
+# Rows per multi-row INSERT statement (7 parameters each)
+ROWS_PER_INSERT = 50
+
+# Insert into database (using direct SQL to avoid model dependencies)
+INSERT_PREFIX = '''
+    INSERT INTO passwords 
+    (id, title, username, password_encrypted, url, created_at, updated_at)
+    VALUES '''
+ROW_PLACEHOLDERS = '(?, ?, ?, ?, ?, ?, ?)'
+INSERT_SQL = INSERT_PREFIX + ROW_PLACEHOLDERS
+MULTI_INSERT_SQL = INSERT_PREFIX + ', '.join([ROW_PLACEHOLDERS] * ROWS_PER_INSERT)
+
+# Entries that are already in the database are updated in place
+UPDATE_SQL = '''
+    UPDATE passwords
+    SET title = ?, username = ?, password_encrypted = ?, url = ?, updated_at = ?
+    WHERE id = ?
+'''
 
 def get_database_path():
     """Get the path to the database file."""
     return Path(__file__).parent.parent / 'data' / 'passwords.db'
 
-def create_database_connection(db_path):
-    """Create and return a database connection."""
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+def create_database_connection(db_path, row_factory=None):
+    """Create and return a database connection.
+    
+    The import only writes, so rows are plain tuples unless a
+    row_factory (e.g. sqlite3.Row) is requested.
+    """
+    conn = tune(sqlite3.connect(str(db_path)))
+    if row_factory is not None:
+        conn.row_factory = row_factory
     return conn
 
+def iter_params(reader, now_str):
+    """Yield the INSERT parameters for each entry of a Chrome CSV reader."""
+    for entry in reader:
+        yield (
+            # Generate a unique ID if not exists
+            hashlib.sha256(b''.join((
+                (entry.get('name') or '').encode('utf-8'),
+                (entry.get('url') or '').encode('utf-8'),
+                (entry.get('username') or '').encode('utf-8')
+            ))).hexdigest(),
+            entry.get('name', 'Untitled'),
+            entry.get('username', ''),
+            (entry.get('password') or '').encode('utf-8'),
+            entry.get('url', ''),
+            now_str,
+            now_str
+        )
+
+def update_params(row):
+    """Turn an INSERT parameter tuple into the matching UPDATE_SQL parameters."""
+    entry_id, title, username, password, url, _, updated_at = row
+    return (title, username, password, url, updated_at, entry_id)
+
+def insert_rows(cursor, rows):
+    """Insert rows ROWS_PER_INSERT at a time, with the remainder one per row."""
+    full = len(rows) - len(rows) % ROWS_PER_INSERT
+    cursor.executemany(MULTI_INSERT_SQL, (
+        tuple(chain.from_iterable(rows[start:start + ROWS_PER_INSERT]))
+        for start in range(0, full, ROWS_PER_INSERT)
+    ))
+    cursor.executemany(INSERT_SQL, rows[full:])
+
+def existing_ids(cursor, ids):
+    """Return the subset of ids that are already in the passwords table."""
+    found = set()
+    for start in range(0, len(ids), MAX_VARIABLES):
+        chunk = ids[start:start + MAX_VARIABLES]
+        cursor.execute(
+            f"SELECT id FROM passwords WHERE id IN ({', '.join('?' * len(chunk))})",
+            chunk
+        )
+        found.update(row[0] for row in cursor)
+    return found
+
 def import_chrome_passwords(csv_path, master_password):
     """Import passwords from Chrome CSV export."""
     db_path = get_database_path()
@@ -28,67 +106,75 @@ def import_chrome_passwords(csv_path, master_password):
         return False
     
     try:
-        # Read the CSV file
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            entries = list(reader)
-        
-        if not entries:
-            print("❌ No entries found in the CSV file.")
-            return False
-        
-        print(f"🔍 Found {len(entries)} entries in {csv_path}")
-        
-        # Connect to the database
-        conn = create_database_connection(db_path)
-        cursor = conn.cursor()
-        
-        # For this simple import, we'll just store the raw data
-        # In a real implementation, you would want to encrypt the passwords
-        success_count = 0
+        print(f"🔍 Reading entries from {csv_path}")
         
-        for entry in entries:
-            try:
-                # Generate a unique ID if not exists
-                entry_id = hashlib.sha256(
-                    f"{entry.get('name', '')}{entry.get('url', '')}{entry.get('username', '')}"
-                    .encode('utf-8')
-                ).hexdigest()
-                
-                # Insert into database (using direct SQL to avoid model dependencies)
-                cursor.execute('''
-                    INSERT OR REPLACE INTO passwords 
-                    (id, title, username, password_encrypted, url, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    entry_id,
-                    entry.get('name', 'Untitled'),
-                    entry.get('username', ''),
-                    entry.get('password', '').encode('utf-8'),
-                    entry.get('url', ''),
-                    datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                ))
+        # Stream the CSV file straight into the database
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f, \
+                closing(create_database_connection(db_path)) as conn, conn:
+            reader = csv.DictReader(f)
+            cursor = conn.cursor()
+            
+            # For this simple import, we'll just store the raw data
+            # In a real implementation, you would want to encrypt the passwords
+            now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            rows = iter_params(reader, now_str)
+            
+            # Insert in batches, each under a savepoint, so a bad batch is
+            # skipped without losing the others. The savepoints nest in one
+            # explicit transaction; a SAVEPOINT opened outside a transaction
+            # would start its own, and RELEASE would commit every batch
+            cursor.execute('BEGIN')
+            total = 0
+            success_count = 0
+            while True:
+                chunk = list(islice(rows, BATCH_SIZE))
+                if not chunk:
+                    break
+                start = total
+                total += len(chunk)
                 
-                success_count += 1
-                if success_count % 50 == 0:
+                # Keep the last of any duplicate entries, so each id is written once
+                batch = list({row[0]: row for row in chunk}.values())
+                try:
+                    cursor.execute('SAVEPOINT import_batch')
+                    existing = existing_ids(cursor, [row[0] for row in batch])
+                    insert_rows(cursor, [row for row in batch if row[0] not in existing])
+                    cursor.executemany(UPDATE_SQL, [update_params(row) for row in batch if row[0] in existing])
+                    cursor.execute('RELEASE import_batch')
+                    success_count += len(batch)
                     print(f"  ✓ Processed {success_count} entries...")
-                    
-            except Exception as e:
-                print(f"  ✗ Error processing entry: {e}")
-        
-        conn.commit()
-        print(f"\n✅ Successfully imported {success_count} out of {len(entries)} entries.")
-        return True
-        
+                except sqlite3.IntegrityError:
+                    # Retry the batch row by row so one bad row doesn't cost the others
+                    cursor.execute('ROLLBACK TO import_batch')
+                    for row in batch:
+                        try:
+                            if row[0] in existing:
+                                cursor.execute(UPDATE_SQL, update_params(row))
+                            else:
+                                cursor.execute(INSERT_SQL, row)
+                            success_count += 1
+                        except sqlite3.IntegrityError as e:
+                            print(f"  ✗ Error importing entry '{row[1]}': {e}")
+                    cursor.execute('RELEASE import_batch')
+                    print(f"  ✓ Processed {success_count} entries...")
+                except sqlite3.Error as e:
+                    cursor.execute('ROLLBACK TO import_batch')
+                    cursor.execute('RELEASE import_batch')
+                    print(f"  ✗ Error importing entries {start + 1}-{total}: {e}")
+            
+            if not total:
+                print("❌ No entries found in the CSV file.")
+                return False
+            
+            conn.commit()
+            print(f"\n✅ Successfully imported {success_count} out of {total} entries.")
+            return True
+            
     except Exception as e:
         print(f"❌ Error during import: {e}")
         import traceback
         traceback.print_exc()
         return False
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 if __name__ == "__main__":
     import sys
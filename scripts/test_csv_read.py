@@ -9,13 +9,15 @@ from pathlib import Path
 def test_csv_read(file_path):
     """Test reading the CSV file and print the first few rows."""
     try:
-        # Check if file exists
-        if not os.path.exists(file_path):
+        # Check if file exists; a single stat also gives its size
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             print(f"❌ Error: File not found: {file_path}")
             return False
         
         print(f"✅ File found: {file_path}")
-        print(f"   Size: {os.path.getsize(file_path) / 1024:.2f} KB")
+        print(f"   Size: {st.st_size / 1024:.2f} KB")
         
         # Try to read the file
         with open(file_path, 'r', encoding='utf-8') as f:
@@ -28,10 +30,10 @@ def test_csv_read(file_path):
             print("\nFirst line of the file:")
             print(first_line)
             
-            # Try to parse as CSV
-            f.seek(0)  # Go back to the start of the file
+            # Try to parse as CSV. The headers come from the line already
+            # read, and the reader continues from the second line
+            headers = next(csv.reader([first_line]), None)
             reader = csv.reader(f)
-            headers = next(reader, None)
             
             if not headers:
                 print("❌ Error: Could not read CSV headers")
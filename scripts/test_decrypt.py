@@ -1,7 +1,11 @@
+import os
 import sys
 import sqlite3
 import base64
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from itertools import repeat
 from pathlib import Path
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives import hashes
@@ -17,6 +21,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Entries decrypted per thread-pool task
+DECRYPT_CHUNK_SIZE = 256
+
+# Rows read from the passwords query at a time
+FETCH_SIZE = 4096
+
 def derive_key(password: str, salt: bytes) -> bytes:
     """Derive a key from a password using PBKDF2."""
     logger.debug(f"Deriving key with salt (first 16 bytes): {salt[:16].hex()}")
@@ -30,198 +40,245 @@ def derive_key(password: str, salt: bytes) -> bytes:
     logger.debug(f"Derived key (first 16 bytes): {key[:16].hex()}")
     return key
 
-def decrypt_data(encrypted_data: bytes, nonce: bytes, key: bytes) -> str:
-    """Decrypt data using AES-GCM."""
-    logger.debug(f"Decrypting data - Length: {len(encrypted_data)}, Nonce: {nonce.hex()}")
+def decrypt_data(encrypted_data: bytes, nonce: bytes, aesgcm: AESGCM) -> str:
+    """Decrypt data using AES-GCM.
+    
+    The AESGCM instance is built once from the master key and shared, so the
+    key is not set up again for every entry.
+    """
+    # Checked once per call, so the hex dumps are only built when they are logged
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug(f"Decrypting data - Length: {len(encrypted_data)}, Nonce: {nonce.hex()}")
     try:
-        aesgcm = AESGCM(key)
         decrypted = aesgcm.decrypt(nonce[:12], encrypted_data, None)
-        logger.debug(f"Successfully decrypted data, length: {len(decrypted)}")
+        logger.debug("Successfully decrypted data, length: %d", len(decrypted))
         return decrypted.decode('utf-8')
     except Exception as e:
         logger.error(f"Decryption failed: {e}")
-        logger.debug(f"Encrypted data (hex): {encrypted_data.hex()}")
-        logger.debug(f"Nonce (hex): {nonce.hex()}")
+        if debug:
+            logger.debug(f"Encrypted data (hex): {encrypted_data.hex()}")
+            logger.debug(f"Nonce (hex): {nonce.hex()}")
         raise
 
+def try_decrypt(encrypted_data: bytes, nonce: bytes, aesgcm: AESGCM):
+    """Decrypt one value, returning (plaintext, None) or (None, error)."""
+    try:
+        return decrypt_data(encrypted_data, nonce, aesgcm), None
+    except Exception as e:
+        return None, e
+
+def decrypt_chunk(pairs, aesgcm: AESGCM):
+    """Decrypt (encrypted_data, nonce) pairs; a pair missing either part gives (None, None)."""
+    return [
+        try_decrypt(encrypted_data, nonce, aesgcm)
+        if encrypted_data is not None and nonce is not None else (None, None)
+        for encrypted_data, nonce in pairs
+    ]
+
+def decrypt_all(executor, pairs, aesgcm: AESGCM):
+    """Decrypt (encrypted_data, nonce) pairs on a thread pool, keeping their order.
+    
+    The pairs are handed out in chunks: a single decryption is cheaper than
+    dispatching it to a thread, so per-value tasks would be slower than a loop.
+    """
+    chunks = [pairs[i:i + DECRYPT_CHUNK_SIZE] for i in range(0, len(pairs), DECRYPT_CHUNK_SIZE)]
+    return [result for chunk in executor.map(decrypt_chunk, chunks, repeat(aesgcm)) for result in chunk]
+
+def row_get(row, columns, name, default=None):
+    """Return a sqlite3.Row column by name, or default if the table lacks it."""
+    return row[name] if name in columns else default
+
+def iter_decrypted(cursor, columns, aesgcm: AESGCM):
+    """Yield (row, (plaintext, error)) for every row of an executed query.
+    
+    Rows are fetched FETCH_SIZE at a time and each batch is decrypted before
+    the next one is read, so only one batch is held in memory.
+    """
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        while True:
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            pairs = [(row_get(row, columns, 'password_encrypted'), row_get(row, columns, 'iv'))
+                     for row in rows]
+            yield from zip(rows, decrypt_all(executor, pairs, aesgcm))
+
 def test_decrypt():
     db_path = Path("X:/GitHub/pass_mgr/data/passwords.db")
     
     try:
         logger.info(f"Connecting to database at {db_path}")
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        cursor = conn.cursor()
-        
-        # Get the salt from metadata
-        logger.debug("Fetching salt from metadata")
-        cursor.execute("SELECT value FROM metadata WHERE key = 'password_salt'")
-        salt_result = cursor.fetchone()
-        if not salt_result:
-            logger.error("No salt found in the database")
-            return
+        with closing(sqlite3.connect(db_path)) as conn:
+            conn.row_factory = sqlite3.Row  # Enable column access by name
+            cursor = conn.cursor()
             
-        salt = salt_result[0]
-        if isinstance(salt, str):
-            salt = base64.b64decode(salt)
-        
-        logger.info(f"Salt (first 16 bytes): {salt[:16].hex()}")
-        
-        # Get master password from user
-        master_password = input("Enter master password: ").strip()
-        if not master_password:
-            logger.error("No password provided")
-            return
+            # Get the salt from metadata
+            logger.debug("Fetching salt from metadata")
+            cursor.execute("SELECT value FROM metadata WHERE key = 'password_salt'")
+            salt_result = cursor.fetchone()
+            if not salt_result:
+                logger.error("No salt found in the database")
+                return
+                
+            salt = salt_result[0]
+            if isinstance(salt, str):
+                salt = base64.b64decode(salt)
             
-        # Derive the key
-        logger.info("Deriving master key...")
-        master_key = derive_key(master_password, salt)
-        logger.info(f"Master key derived (first 16 bytes): {master_key[:16].hex()}")
-        
-        # First, check the database structure
-        logger.info("Checking database structure...")
-        cursor.execute("PRAGMA table_info(passwords)")
-        columns = [col[1] for col in cursor.fetchall()]
-        logger.info(f"Password table columns: {', '.join(columns)}")
-        
-        # Get all password entries with all fields
-        logger.info("Fetching all password entries...")
-        cursor.execute('SELECT * FROM passwords')
-        entries = cursor.fetchall()
-        
-        if not entries:
-            logger.error("No password entries found in the database.")
-            return
+            logger.info(f"Salt (first 16 bytes): {salt[:16].hex()}")
             
-        logger.info(f"Found {len(entries)} entries to test")
-        
-        # Print summary of entries
-        print("\n=== Database Summary ===")
-        print(f"Total entries: {len(entries)}")
-        print("\nFirst few entries:")
-        
-        # Check first 5 entries in detail
-        for i, entry in enumerate(entries[:5]):
-            entry_dict = dict(zip(columns, entry))
-            entry_id = entry_dict.get('id', 'N/A')
-            title = entry_dict.get('title', 'N/A')
-            username = entry_dict.get('username', 'N/A')
-            has_encrypted = 'password_encrypted' in entry_dict and entry_dict['password_encrypted'] is not None
-            has_iv = 'iv' in entry_dict and entry_dict['iv'] is not None
-            has_plain = 'password' in entry_dict and entry_dict['password'] is not None
+            # Get master password from user
+            master_password = input("Enter master password: ").strip()
+            if not master_password:
+                logger.error("No password provided")
+                return
+                
+            # Derive the key
+            logger.info("Deriving master key...")
+            master_key = derive_key(master_password, salt)
+            logger.info(f"Master key derived (first 16 bytes): {master_key[:16].hex()}")
+            aesgcm = AESGCM(master_key)
             
-            print(f"\n--- Entry {i+1} ---")
-            print(f"ID: {entry_id}")
-            print(f"Title: {title}")
-            print(f"Username: {username}")
-            print(f"Has encrypted password: {has_encrypted}")
-            print(f"Has IV: {has_iv}")
-            print(f"Has plain password: {has_plain}")
+            # Aggregate the lengths first: it also gives the total for the
+            # summary, which is printed before the entries are streamed
+            cursor.execute("""
+                SELECT 
+                    COUNT(*) as total,
+                    SUM(CASE WHEN LENGTH(password_encrypted) = 0 THEN 1 ELSE 0 END) as empty_encrypted,
+                    SUM(CASE WHEN LENGTH(iv) = 0 THEN 1 ELSE 0 END) as empty_iv,
+                    AVG(LENGTH(password_encrypted)) as avg_encrypted_len,
+                    MIN(LENGTH(password_encrypted)) as min_encrypted_len,
+                    MAX(LENGTH(password_encrypted)) as max_encrypted_len
+                FROM passwords
+            """)
+            stats = cursor.fetchone()
+            total = stats[0]
             
-            # Try to decrypt if we have the required fields
-            if has_encrypted and has_iv:
-                try:
-                    encrypted_data = entry_dict['password_encrypted']
-                    iv = entry_dict['iv']
-                    logger.debug(f"Encrypted data (first 16 bytes): {encrypted_data[:16].hex()}")
-                    logger.debug(f"IV (first 16 bytes): {iv[:16].hex()}")
-                    
-                    decrypted = decrypt_data(encrypted_data, iv, master_key)
-                    print(f"Decrypted password: {decrypted}")
-                    print(f"Password length: {len(decrypted)} characters")
+            if not total:
+                logger.error("No password entries found in the database.")
+                return
+                
+            logger.info(f"Found {total} entries to test")
+            
+            # Stream all password entries with all fields
+            logger.info("Fetching all password entries...")
+            cursor.execute('SELECT * FROM passwords')
+            
+            # The table structure comes with the result; rows are read by name
+            # through sqlite3.Row, checking this set for optional columns
+            columns = {col[0] for col in cursor.description}
+            logger.info(f"Password table columns: {', '.join(col[0] for col in cursor.description)}")
+            
+            # Print summary of entries
+            print("\n=== Database Summary ===")
+            print(f"Total entries: {total}")
+            print("\nFirst few entries:")
+            
+            # Check every entry in a single pass: the first 5 are shown in detail,
+            # and the encryption counts, empty passwords and suspiciously short
+            # ciphertexts are collected for the reports below
+            encrypted_count = 0
+            missing_encryption = 0
+            empty_password_entries = []
+            suspicious_entries = []
+            
+            # Entries are decrypted batch by batch as they are read; AES-GCM
+            # runs in OpenSSL, so the worker threads can decrypt in parallel
+            for i, (entry, (decrypted, error)) in enumerate(iter_decrypted(cursor, columns, aesgcm)):
+                detail = i < 5
+                entry_id = row_get(entry, columns, 'id', 'N/A')
+                title = row_get(entry, columns, 'title', 'N/A')
+                username = row_get(entry, columns, 'username', 'N/A')
+                encrypted_data = row_get(entry, columns, 'password_encrypted')
+                iv = row_get(entry, columns, 'iv')
+                has_encrypted = encrypted_data is not None
+                has_iv = iv is not None
+                
+                if detail:
+                    has_plain = row_get(entry, columns, 'password') is not None
+                    print(f"\n--- Entry {i+1} ---")
+                    print(f"ID: {entry_id}")
+                    print(f"Title: {title}")
+                    print(f"Username: {username}")
+                    print(f"Has encrypted password: {has_encrypted}")
+                    print(f"Has IV: {has_iv}")
+                    print(f"Has plain password: {has_plain}")
+                
+                # Check the decryption if we had the required fields
+                if has_encrypted and has_iv:
+                    encrypted_count += 1
+                    if detail and logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Encrypted data (first 16 bytes): {encrypted_data[:16].hex()}")
+                        logger.debug(f"IV (first 16 bytes): {iv[:16].hex()}")
                     
-                except Exception as e:
-                    logger.error(f"❌ Failed to decrypt entry {entry_id}: {str(e)}")
-            else:
-                print("Skipping decryption - missing required fields")
-                if has_plain:
-                    print(f"Plain password: {entry_dict['password']}")
-        
-        # Count entries with/without encrypted passwords
-        cursor.execute("SELECT COUNT(*) FROM passwords WHERE password_encrypted IS NOT NULL AND iv IS NOT NULL")
-        encrypted_count = cursor.fetchone()[0]
-        cursor.execute("SELECT COUNT(*) FROM passwords WHERE password_encrypted IS NULL OR iv IS NULL")
-        missing_encryption = cursor.fetchone()[0]
-        
-        # Find entries with empty decrypted passwords
-        empty_password_entries = []
-        for entry in entries:
-            entry_dict = dict(zip(columns, entry))
-            if 'password_encrypted' in entry_dict and 'iv' in entry_dict and entry_dict['password_encrypted'] and entry_dict['iv']:
-                try:
-                    decrypted = decrypt_data(entry_dict['password_encrypted'], entry_dict['iv'], master_key)
-                    if not decrypted or decrypted.strip() == '':
-                        empty_password_entries.append({
-                            'id': entry_dict.get('id', 'N/A'),
-                            'title': entry_dict.get('title', 'N/A'),
-                            'username': entry_dict.get('username', 'N/A'),
-                            'encrypted_length': len(entry_dict['password_encrypted']),
-                            'iv_length': len(entry_dict['iv'])
-                        })
-                except Exception as e:
-                    logger.warning(f"Error checking entry {entry_dict.get('id', 'unknown')}: {e}")
-        
-        print("\n=== Encryption Status ===")
-        print(f"Total entries: {len(entries)}")
-        print(f"Entries with encrypted passwords: {encrypted_count}")
-        print(f"Entries missing encryption: {missing_encryption}")
-        print(f"\nEntries with empty/blank decrypted passwords: {len(empty_password_entries)}")
-        
-        if empty_password_entries:
-            print("\n=== Entries with Empty/Blank Passwords ===")
-            for i, entry in enumerate(empty_password_entries[:10], 1):  # Show first 10 for brevity
-                print(f"{i}. ID: {entry['id']}, Title: {entry['title']}, Username: {entry['username']}, "
-                      f"Encrypted Len: {entry['encrypted_length']}, IV Len: {entry['iv_length']}")
-            if len(empty_password_entries) > 10:
-                print(f"... and {len(empty_password_entries) - 10} more")
-        
-        # Check for entries with very short encrypted data (potential issues)
-        suspicious_entries = []
-        for entry in entries:
-            entry_dict = dict(zip(columns, entry))
-            if 'password_encrypted' in entry_dict and entry_dict['password_encrypted']:
-                enc_len = len(entry_dict['password_encrypted'])
-                if enc_len < 8:  # AES-GCM encrypted data should typically be longer
+                    if error is None:
+                        if detail:
+                            print(f"Decrypted password: {decrypted}")
+                            print(f"Password length: {len(decrypted)} characters")
+                        
+                        # Find entries with empty decrypted passwords
+                        if encrypted_data and iv and (not decrypted or decrypted.strip() == ''):
+                            empty_password_entries.append({
+                                'id': entry_id,
+                                'title': title,
+                                'username': username,
+                                'encrypted_length': len(encrypted_data),
+                                'iv_length': len(iv)
+                            })
+                    else:
+                        if detail:
+                            logger.error(f"❌ Failed to decrypt entry {entry_id}: {str(error)}")
+                        if encrypted_data and iv:
+                            logger.warning(f"Error checking entry {row_get(entry, columns, 'id', 'unknown')}: {error}")
+                else:
+                    missing_encryption += 1
+                    if detail:
+                        print("Skipping decryption - missing required fields")
+                        if has_plain:
+                            print(f"Plain password: {entry['password']}")
+                
+                # Check for entries with very short encrypted data (potential issues)
+                if encrypted_data and len(encrypted_data) < 8:  # AES-GCM encrypted data should typically be longer
                     suspicious_entries.append({
-                        'id': entry_dict.get('id', 'N/A'),
-                        'title': entry_dict.get('title', 'N/A'),
-                        'encrypted_length': enc_len,
-                        'iv_length': len(entry_dict.get('iv', ''))
+                        'id': entry_id,
+                        'title': title,
+                        'encrypted_length': len(encrypted_data),
+                        'iv_length': len(iv if iv is not None else '')
                     })
-        
-        if suspicious_entries:
-            print("\n=== Suspicious Entries (Very Short Encrypted Data) ===")
-            for entry in suspicious_entries:
-                print(f"ID: {entry['id']}, Title: {entry['title']}, "
-                      f"Encrypted Len: {entry['encrypted_length']}, IV Len: {entry['iv_length']}")
-        
-        # Check for potential encoding issues
-        print("\n=== Password Length Analysis ===")
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN LENGTH(password_encrypted) = 0 THEN 1 ELSE 0 END) as empty_encrypted,
-                SUM(CASE WHEN LENGTH(iv) = 0 THEN 1 ELSE 0 END) as empty_iv,
-                AVG(LENGTH(password_encrypted)) as avg_encrypted_len,
-                MIN(LENGTH(password_encrypted)) as min_encrypted_len,
-                MAX(LENGTH(password_encrypted)) as max_encrypted_len
-            FROM passwords
-        """)
-        stats = cursor.fetchone()
-        print(f"Total entries: {stats[0]}")
-        print(f"Entries with empty encrypted data: {stats[1]}")
-        print(f"Entries with empty IV: {stats[2]}")
-        print(f"Average encrypted data length: {stats[3]:.2f} bytes")
-        print(f"Minimum encrypted data length: {stats[4]} bytes")
-        print(f"Maximum encrypted data length: {stats[5]} bytes")
-                
-        logger.info("Test completed")
-                
+            
+            print("\n=== Encryption Status ===")
+            print(f"Total entries: {total}")
+            print(f"Entries with encrypted passwords: {encrypted_count}")
+            print(f"Entries missing encryption: {missing_encryption}")
+            print(f"\nEntries with empty/blank decrypted passwords: {len(empty_password_entries)}")
+            
+            if empty_password_entries:
+                print("\n=== Entries with Empty/Blank Passwords ===")
+                for i, entry in enumerate(empty_password_entries[:10], 1):  # Show first 10 for brevity
+                    print(f"{i}. ID: {entry['id']}, Title: {entry['title']}, Username: {entry['username']}, "
+                          f"Encrypted Len: {entry['encrypted_length']}, IV Len: {entry['iv_length']}")
+                if len(empty_password_entries) > 10:
+                    print(f"... and {len(empty_password_entries) - 10} more")
+            
+            if suspicious_entries:
+                print("\n=== Suspicious Entries (Very Short Encrypted Data) ===")
+                for entry in suspicious_entries:
+                    print(f"ID: {entry['id']}, Title: {entry['title']}, "
+                          f"Encrypted Len: {entry['encrypted_length']}, IV Len: {entry['iv_length']}")
+            
+            # Check for potential encoding issues
+            print("\n=== Password Length Analysis ===")
+            print(f"Total entries: {stats[0]}")
+            print(f"Entries with empty encrypted data: {stats[1]}")
+            print(f"Entries with empty IV: {stats[2]}")
+            print(f"Average encrypted data length: {stats[3]:.2f} bytes")
+            print(f"Minimum encrypted data length: {stats[4]} bytes")
+            print(f"Maximum encrypted data length: {stats[5]} bytes")
+                    
+            logger.info("Test completed")
+                    
     except Exception as e:
         logger.error(f"An error occurred: {str(e)}", exc_info=True)
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 if __name__ == "__main__":
     test_decrypt()
@@ -7,11 +7,15 @@ import sys
 import logging
 from pathlib import Path
 
-# Add the parent directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-# Import the logging configuration
-from src.utils.logging_config import setup_logging, get_logger
+# Import the logging configuration, from the installed package if there is one
+try:
+    from utils.logging_config import setup_logging, get_logger
+except ImportError:
+    # If running from a checkout, add src to path
+    src_dir = Path(__file__).parent.parent / 'src'
+    if str(src_dir) not in sys.path:
+        sys.path.insert(0, str(src_dir))
+    from utils.logging_config import setup_logging, get_logger
 
 def test_logging():
     """Test logging functionality."""
@@ -36,8 +40,13 @@ def test_logging():
     print(f"\nLog file should be at: {log_file.absolute()}")
     
     # Verify log file exists and has content
-    if log_file.exists():
-        print(f"Log file exists. Size: {log_file.stat().st_size} bytes")
+    try:
+        log_size = log_file.stat().st_size
+    except FileNotFoundError:
+        log_size = None
+    
+    if log_size is not None:
+        print(f"Log file exists. Size: {log_size} bytes")
         print("\nLog file contents:")
         print("-" * 50)
         try:
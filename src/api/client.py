@@ -6,20 +6,49 @@ Features:
 - Audit logging for sensitive operations
 - IP whitelisting for emergency access
 """
+from __future__ import annotations
+
+import atexit
+import ipaddress
 import json
 import logging
+import queue
 import time
 import socket
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Set, Tuple
-from functools import wraps
-import requests
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Set, Tuple
+from functools import lru_cache, wraps
 from urllib.parse import urljoin
 
+# requests (with urllib3) is only imported once a client is created, so
+# importing this module, e.g. from the UI at startup, doesn't load it
+if TYPE_CHECKING:
+    import requests
+
 from ..core.config import get_api_url, get_auth_token, load_config
 
+# Try to import orjson for faster audit log serialization, fallback to json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# Shared stand-in for requests made without per-call headers
+_NO_HEADERS = MappingProxyType({})
+
+
+@lru_cache(maxsize=256)
+def _endpoint_url(base_url: str, endpoint: str) -> str:
+    """Join an API endpoint to the base URL; clients call the same few endpoints."""
+    return urljoin(base_url, endpoint.lstrip('/'))
+
+
 class RateLimiter:
     """Implements rate limiting for API calls."""
     
@@ -32,30 +61,33 @@ class RateLimiter:
         """
         self.max_requests = max_requests
         self.per_seconds = per_seconds
-        self.requests = []
+        # Monotonic timestamps of the requests in the window, oldest first
+        self.requests = deque()
         
     def __call__(self, func):
         """Decorator to apply rate limiting to a function."""
         @wraps(func)
         def wrapper(*args, **kwargs):
-            self._check_rate_limit()
+            self.check()
             return func(*args, **kwargs)
         return wrapper
     
-    def _check_rate_limit(self):
+    def check(self):
         """Check if the current request exceeds the rate limit."""
-        current_time = time.time()
+        current_time = time.monotonic()
+        cutoff = current_time - self.per_seconds
         
-        # Remove requests outside the current time window
-        self.requests = [t for t in self.requests 
-                        if current_time - t < self.per_seconds]
+        # Remove requests outside the current time window; they are the
+        # oldest, so they are all at the front
+        while self.requests and self.requests[0] <= cutoff:
+            self.requests.popleft()
         
         if len(self.requests) >= self.max_requests:
-            sleep_time = self.per_seconds - (current_time - self.requests[0])
+            sleep_time = self.requests[0] - cutoff
             if sleep_time > 0:
                 time.sleep(sleep_time)
         
-        self.requests.append(time.time())
+        self.requests.append(time.monotonic())
 
 
 class AuditLogger:
@@ -68,16 +100,23 @@ class AuditLogger:
             log_file: Path to the audit log file
         """
         self.log_file = log_file
+        self._client_ip = None
         self.logger = logging.getLogger('audit')
         self.logger.setLevel(logging.INFO)
         
-        # Create file handler if it doesn't exist
+        # Create file handler if it doesn't exist. Records are put on a queue
+        # and written to the file by a background thread, so audited requests
+        # don't wait for the disk; the queue is drained at exit
         if not self.logger.handlers:
             file_handler = logging.FileHandler(self.log_file)
             file_handler.setFormatter(logging.Formatter(
                 '%(asctime)s - %(levelname)s - %(message)s'
             ))
-            self.logger.addHandler(file_handler)
+            log_queue = queue.SimpleQueue()
+            self.logger.addHandler(QueueHandler(log_queue))
+            listener = QueueListener(log_queue, file_handler)
+            listener.start()
+            atexit.register(listener.stop)
     
     def log(self, action: str, status: str, user: str = None, 
             ip_address: str = None, details: Dict = None):
@@ -99,16 +138,22 @@ class AuditLogger:
             'details': details or {}
         }
         
-        self.logger.info(json.dumps(log_entry, default=str))
+        if HAS_ORJSON:
+            message = orjson.dumps(log_entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        else:
+            message = json.dumps(log_entry, default=str)
+        self.logger.info(message)
     
     def _get_client_ip(self) -> str:
-        """Get the client's IP address."""
-        try:
-            # This is a simplified version - in production, you'd want to get the actual client IP
-            # from the request headers (e.g., X-Forwarded-For)
-            return socket.gethostbyname(socket.gethostname())
-        except Exception:
-            return 'unknown'
+        """Get the client's IP address (resolved once, then cached)."""
+        if self._client_ip is None:
+            try:
+                # This is a simplified version - in production, you'd want to get the actual client IP
+                # from the request headers (e.g., X-Forwarded-For)
+                self._client_ip = socket.gethostbyname(socket.gethostname())
+            except Exception:
+                self._client_ip = 'unknown'
+        return self._client_ip
 
 class IPWhitelist:
     """Manages IP whitelisting for emergency access."""
@@ -120,6 +165,39 @@ class IPWhitelist:
             whitelist: List of IP addresses or CIDR ranges to whitelist
         """
         self.whitelist = set(whitelist or [])
+        self._networks = self._build_index(frozenset(self.whitelist))
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _build_index(whitelist: frozenset) -> Dict[int, Tuple[Tuple[int, frozenset], ...]]:
+        """Group the whitelisted networks by IP version and prefix length.
+        
+        Each network is stored as its address shifted right by the host bits,
+        in a set per prefix length. A lookup then costs one shift and one set
+        membership test per distinct prefix length, however many entries the
+        whitelist has. Bare addresses are /32 (IPv4) or /128 (IPv6) networks.
+        
+        The index is immutable and cached by whitelist, so clients created
+        from the same configuration share it instead of parsing it again.
+        
+        Returns:
+            Dict mapping the IP version to (host bits, network set) pairs
+        """
+        by_prefix = {4: {}, 6: {}}
+        for entry in whitelist:
+            try:
+                network = ipaddress.ip_network(entry.strip(), strict=False)
+            except ValueError:
+                logger.warning(f"Ignoring invalid IP whitelist entry: {entry}")
+                continue
+            host_bits = network.max_prefixlen - network.prefixlen
+            by_prefix[network.version].setdefault(host_bits, set()).add(
+                int(network.network_address) >> host_bits
+            )
+        return {
+            version: tuple((host_bits, frozenset(nets)) for host_bits, nets in networks.items())
+            for version, networks in by_prefix.items()
+        }
     
     def is_allowed(self, ip_address: str) -> bool:
         """Check if an IP address is in the whitelist.
@@ -132,31 +210,15 @@ class IPWhitelist:
         """
         if not self.whitelist:
             return False
-            
-        for whitelisted in self.whitelist:
-            if '/' in whitelisted:
-                # Handle CIDR notation
-                if self._is_in_cidr(ip_address, whitelisted):
-                    return True
-            elif ip_address == whitelisted:
-                return True
-        return False
-    
-    def _is_in_cidr(self, ip_address: str, cidr: str) -> bool:
-        """Check if an IP address is within a CIDR range."""
+        
         try:
-            ip = self._ip_to_int(ip_address)
-            network, prefix = cidr.split('/')
-            network = self._ip_to_int(network)
-            prefix = int(prefix)
-            mask = (~0) << (32 - prefix)
-            return (ip & mask) == (network & mask)
-        except Exception:
+            ip = ipaddress.ip_address(ip_address.strip())
+        except ValueError:
             return False
-    
-    def _ip_to_int(self, ip: str) -> int:
-        """Convert an IP address to an integer."""
-        return int.from_bytes(socket.inet_aton(ip), byteorder='big')
+        
+        ip_int = int(ip)
+        return any(ip_int >> host_bits in networks
+                   for host_bits, networks in self._networks[ip.version])
 
 
 class APIClient:
@@ -171,6 +233,32 @@ class APIClient:
     # Rate limiting configuration (requests per minute)
     RATE_LIMIT = 100
     
+    # Sensitive operations for the audit log, by HTTP method, as
+    # (endpoint prefix, action) pairs; the first matching prefix wins
+    SENSITIVE_ENDPOINTS = {
+        'POST': (
+            ('/shares', 'share_created'),
+            ('/auth/login', 'user_login'),
+            ('/auth/register', 'user_registered'),
+            ('/shares/', 'access_requested'),
+            ('/shares/requests/', 'access_request_responded'),
+        ),
+        'DELETE': (
+            ('/shares/', 'share_revoked'),
+            ('/passwords/', 'password_deleted'),
+        ),
+        'PUT': (
+            ('/passwords/', 'password_updated'),
+        ),
+    }
+    
+    # Response fields masked before a response is written to the audit log
+    REDACTED_FIELDS = frozenset(('password', 'token', 'secret'))
+    
+    # Headers carrying the client IP, in order of preference: X-Forwarded-For
+    # (if behind a proxy), then X-Real-IP (common in nginx)
+    CLIENT_IP_HEADERS = ('X-Forwarded-For', 'X-Real-IP')
+    
     def __init__(self, base_url: Optional[str] = None, auth_token: Optional[str] = None):
         """Initialize the API client.
         
@@ -178,9 +266,30 @@ class APIClient:
             base_url: Base URL of the API (defaults to value from config)
             auth_token: Authentication token (defaults to value from config)
         """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
         self.base_url = base_url or get_api_url()
         self.auth_token = auth_token or get_auth_token()
         self.session = requests.Session()
+        self._local_ip = None
+        
+        # Keep more connections alive for reuse, and retry idempotent
+        # requests briefly when the backend is restarting or overloaded;
+        # the last response is returned if every retry fails
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.1,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         # Initialize rate limiter
         self.rate_limiter = RateLimiter(
@@ -207,18 +316,21 @@ class APIClient:
             })
     
     def _get_local_ip(self) -> str:
-        """Get the local IP address."""
-        try:
-            # Create a dummy socket to get the local IP
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))  # Google's public DNS
-            local_ip = s.getsockname()[0]
-            s.close()
-            return local_ip
-        except Exception:
-            return '127.0.0.1'
+        """Get the local IP address.
+        
+        It is looked up on the first call and cached for the client's
+        lifetime, since every request without proxy headers asks for it.
+        """
+        if self._local_ip is None:
+            try:
+                # Create a dummy socket to get the local IP
+                with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                    s.connect(("8.8.8.8", 80))  # Google's public DNS
+                    self._local_ip = s.getsockname()[0]
+            except Exception:
+                self._local_ip = '127.0.0.1'
+        return self._local_ip
     
-    @RateLimiter()
     def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make an HTTP request to the API with rate limiting and audit logging.
         
@@ -234,10 +346,12 @@ class APIClient:
             requests.exceptions.RequestException: If the request fails
             PermissionError: If the client's IP is not whitelisted for emergency access
         """
-        url = urljoin(self.base_url, endpoint.lstrip('/'))
+        import requests  # Already loaded by __init__
+        
+        url = _endpoint_url(self.base_url, endpoint)
         
         # Get client IP from headers or connection
-        client_ip = self._get_client_ip(kwargs.get('headers', {}))
+        client_ip = self._get_client_ip(kwargs.get('headers') or _NO_HEADERS)
         
         # Check for emergency access requirements
         if endpoint.startswith('/emergency/') and not self.ip_whitelist.is_allowed(client_ip):
@@ -254,8 +368,8 @@ class APIClient:
         logger.debug(f"API Request: {method} {endpoint} from {client_ip}")
         
         try:
-            # Add rate limiting
-            self.rate_limiter._check_rate_limit()
+            # Apply the client's rate limit
+            self.rate_limiter.check()
             
             # Make the request
             response = self.session.request(method, url, **kwargs)
@@ -263,8 +377,10 @@ class APIClient:
             # Log the response
             logger.debug(f"API Response: {response.status_code} {response.reason}")
             
-            # Log sensitive operations
-            self._audit_sensitive_operations(method, endpoint, response, client_ip)
+            # Log sensitive operations; methods with no sensitive endpoints
+            # (GET) skip the check entirely
+            if method.upper() in self.SENSITIVE_ENDPOINTS:
+                self._audit_sensitive_operations(method, endpoint, response, client_ip)
             
             return response
             
@@ -285,15 +401,11 @@ class APIClient:
     
     def _get_client_ip(self, headers: Dict) -> str:
         """Get the client's IP address from headers or connection."""
-        # Try to get IP from X-Forwarded-For header (if behind a proxy)
-        x_forwarded_for = headers.get('X-Forwarded-For')
-        if x_forwarded_for:
-            return x_forwarded_for.split(',')[0].strip()
-        
-        # Try to get IP from X-Real-IP header (common in nginx)
-        real_ip = headers.get('X-Real-IP')
-        if real_ip:
-            return real_ip
+        # Take the first hop of the first proxy header present
+        for header in self.CLIENT_IP_HEADERS:
+            value = headers.get(header)
+            if value:
+                return value.partition(',')[0].strip()
         
         # Fall back to local IP
         return self._get_local_ip()
@@ -301,41 +413,33 @@ class APIClient:
     def _audit_sensitive_operations(self, method: str, endpoint: str, 
                                   response: requests.Response, client_ip: str) -> None:
         """Log sensitive operations to the audit log."""
-        # Skip non-sensitive endpoints
-        sensitive_endpoints = {
-            'POST /shares': 'share_created',
-            'DELETE /shares/': 'share_revoked',
-            'POST /auth/login': 'user_login',
-            'POST /auth/register': 'user_registered',
-            'POST /shares/': 'access_requested',
-            'POST /shares/requests/': 'access_request_responded',
-            'PUT /passwords/': 'password_updated',
-            'DELETE /passwords/': 'password_deleted'
-        }
-        
-        # Check if this is a sensitive operation
-        action = None
-        for path, act in sensitive_endpoints.items():
-            http_method, path_prefix = path.split(' ', 1)
-            if method.upper() == http_method and endpoint.startswith(path_prefix):
-                action = act
-                break
+        # Check if this is a sensitive operation; only the prefixes
+        # registered for this method are tried
+        action = next(
+            (act for path_prefix, act in self.SENSITIVE_ENDPOINTS.get(method.upper(), ())
+             if endpoint.startswith(path_prefix)),
+            None
+        )
         
         if action:
             status = 'success' if 200 <= response.status_code < 300 else 'failed'
             
-            # Extract relevant details from the response
-            details = {}
-            try:
-                resp_data = response.json()
-                if isinstance(resp_data, dict):
-                    # Redact sensitive information
-                    for field in ['password', 'token', 'secret']:
-                        if field in resp_data:
-                            resp_data[field] = '***REDACTED***'
-                    details = resp_data
-            except ValueError:
-                details = {'response_status': response.status_code}
+            # Extract relevant details from the response; bodies that are
+            # not JSON are not parsed at all
+            details = {'response_status': response.status_code}
+            if 'json' in response.headers.get('Content-Type', '').lower():
+                try:
+                    resp_data = response.json()
+                    details = {}
+                    if isinstance(resp_data, dict):
+                        # Redact sensitive information into a copy, leaving
+                        # the parsed body untouched
+                        details = {
+                            key: '***REDACTED***' if key in self.REDACTED_FIELDS else value
+                            for key, value in resp_data.items()
+                        }
+                except ValueError:
+                    details = {'response_status': response.status_code}
             
             # Log the operation
             self.audit_logger.log(
@@ -210,28 +210,21 @@ async def respond_to_request(
 @router.get("/shares/requests", response_model=dict)
 async def get_access_requests(
     status_filter: Optional[str] = None,
-    current_user: User = Depends(get_current_user),
-    sharing_service: SharingService = Depends(get_sharing_service)
+    current_user: User = Depends(get_current_user)
 ):
     """Get access requests for the current user's shares."""
     try:
-        # Get shares created by the current user
-        shares = sharing_service.get_user_shares(current_user.email)
-        share_ids = [share['id'] for share in shares if share['type'] == 'sent']
-        
-        if not share_ids:
-            return {"status": "success", "data": []}
-        
-        # Get access requests for these shares
+        # Get access requests for the active shares created by the current
+        # user in one query (indexed by from_user and share_id)
         query = """
             SELECT ar.*, ps.entry_id, p.title as entry_title, p.username as entry_username
             FROM access_requests ar
             JOIN password_shares ps ON ar.share_id = ps.id
             JOIN passwords p ON ps.entry_id = p.id
-            WHERE ar.share_id IN ({})
-        """.format(", ".join(["?"] * len(share_ids)))
+            WHERE ps.from_user = ? AND ps.is_revoked = 0
+        """
         
-        params = tuple(share_ids)
+        params = (current_user.email,)
         
         if status_filter:
             query += " AND ar.status = ?"
@@ -243,9 +236,8 @@ async def get_access_requests(
         cursor = db.cursor()
         cursor.execute(query, params)
         
-        requests = []
-        for row in cursor.fetchall():
-            requests.append(dict(row))
+        # Build the rows straight from the cursor, without a fetchall() list
+        requests = [dict(row) for row in cursor]
             
         return {
             "status": "success",
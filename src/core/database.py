@@ -3,8 +3,9 @@ import hmac
 import os
 import sqlite3
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Callable, Iterable, List, Optional, Dict, Any, Tuple
 from datetime import datetime
+from itertools import islice
 import json
 import shutil
 
@@ -23,6 +24,7 @@ from .security import (
 )
 
 from .models import PasswordEntry, ImportStats
+from .db_pool import connect
 
 # Get logger instance
 logger = get_logger(__name__)
@@ -33,16 +35,20 @@ SCHEMA_VERSION = 1
 class DatabaseManager:
     """Manages the password database including encryption and decryption."""
     
-    def __init__(self, db_path: str = None, master_password: str = None, master_key: bytes = None):
+    def __init__(self, db_path: str = None, master_password: str = None, master_key: bytes = None,
+                 conn: sqlite3.Connection = None):
         """Initialize the database manager.
         
         Args:
             db_path: Optional path to the SQLite database file. If not provided,
                     uses the default path from config.
             master_password: Optional master password for encryption
+            conn: Optional open connection to use for every operation, e.g. one
+                  from db_pool.get_conn(), instead of connecting each time
         """
         self.db_path = Path(db_path) if db_path else get_database_path()
         self.master_key = master_key
+        self._conn = conn
         self._initialize_database()
         
         if master_password:
@@ -201,17 +207,10 @@ class DatabaseManager:
     
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection with the right settings."""
+        if self._conn is not None:
+            return self._conn
         try:
-            conn = sqlite3.connect(
-                str(self.db_path),
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
-            )
-            # Use sqlite3.Row to provide both dictionary-style and tuple access
-            conn.row_factory = sqlite3.Row
-            # Enable foreign keys and WAL mode for better concurrency
-            conn.execute('PRAGMA foreign_keys = ON')
-            conn.execute('PRAGMA journal_mode = WAL')
-            return conn
+            return connect(self.db_path)
         except sqlite3.Error as e:
             logger.error(f"Error connecting to database: {e}")
             raise
@@ -223,15 +222,19 @@ class DatabaseManager:
         key = derive_key(password, salt)
         return key, salt
     
-    def _encrypt_data(self, data: str) -> Tuple[bytes, bytes]:
-        """Encrypt data using AES-GCM."""
+    def _encrypt_data(self, data: str, aesgcm: AESGCM = None) -> Tuple[bytes, bytes]:
+        """Encrypt data using AES-GCM.
+        
+        Bulk callers pass an ``aesgcm`` built once from the master key;
+        otherwise a new one is created for this call.
+        """
         if data is None:
             return None, None
             
         try:
             # Generate a new nonce for each encryption
             nonce = os.urandom(12)  # 96 bits for AES-GCM
-            aesgcm = AESGCM(self.master_key)
+            aesgcm = aesgcm or AESGCM(self.master_key)
             ciphertext = aesgcm.encrypt(
                 nonce=nonce,
                 data=data.encode('utf-8'),
@@ -453,20 +456,23 @@ class DatabaseManager:
                 pass
             return False
     
-    def _save_entry(self, conn: sqlite3.Connection, entry: PasswordEntry) -> None:
-        """Save an entry to the database."""
-        cursor = conn.cursor()
+    def _entry_row(self, entry: PasswordEntry, updated_at: str,
+                   aesgcm: AESGCM = None) -> tuple:
+        """Build the passwords row for an entry.
         
+        The columns are (id, title, username, password_encrypted, url, notes,
+        folder, tags, created_at, updated_at, iv), the order used by
+        _save_entry() and save_entries_bulk().
+        """
         # Handle empty passwords by setting to NULL
         password_encrypted = None
         iv = None
         if entry.password:  # Only encrypt non-empty passwords
             if self.master_key:
-                password_encrypted, iv = self._encrypt_data(entry.password)
+                password_encrypted, iv = self._encrypt_data(entry.password, aesgcm)
         # If entry.password is empty string, both password_encrypted and iv will be None
         
-        # Prepare data for insertion/update
-        data = (
+        return (
             entry.id,
             entry.title,
             entry.username,
@@ -476,9 +482,16 @@ class DatabaseManager:
             entry.folder,
             json.dumps(entry.tags) if entry.tags else None,
             entry.created_at.isoformat() if entry.created_at else None,
-            datetime.now().isoformat(),
+            updated_at,
             iv  # Will be None for empty passwords
         )
+    
+    def _save_entry(self, conn: sqlite3.Connection, entry: PasswordEntry) -> None:
+        """Save an entry to the database."""
+        cursor = conn.cursor()
+        
+        # Prepare data for insertion/update
+        data = self._entry_row(entry, datetime.now().isoformat())
         
         # Check if entry exists
         cursor.execute('SELECT id FROM passwords WHERE id = ?', (entry.id,))
@@ -518,6 +531,68 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Error saving entry: {e}")
             return False
+
+    def save_entries_bulk(self, entries: Iterable[PasswordEntry],
+                          progress_callback: Optional[Callable[[int], None]] = None,
+                          batch_size: int = 1000) -> int:
+        """Save a stream of password entries in batches.
+
+        Entries are consumed lazily: each batch is encrypted with one AES-GCM
+        context, written with a single ``executemany`` and committed, so memory
+        use stays flat however many entries the iterable yields. Existing
+        entries with the same id are updated in place.
+
+        Args:
+            entries: Entries to save (any iterable, e.g. a generator)
+            progress_callback: Optional callable receiving the number of rows
+                written so far, called after every batch
+            batch_size: Number of rows per ``executemany`` call and commit
+
+        Returns:
+            int: Number of entries saved
+        
+        Raises:
+            Exception: If a batch fails to encrypt or write. Batches committed
+                before it stay saved; the rest of the iterable is not read.
+        """
+        if not self.master_key:
+            raise ValueError("Master key not set. Call set_master_password first.")
+
+        aesgcm = AESGCM(self.master_key)
+        now = datetime.now().isoformat()
+
+        query = """
+            INSERT INTO passwords
+            (id, title, username, password_encrypted, url, notes,
+             folder, tags, created_at, updated_at, iv)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                title=excluded.title, username=excluded.username,
+                password_encrypted=excluded.password_encrypted, url=excluded.url,
+                notes=excluded.notes, folder=excluded.folder, tags=excluded.tags,
+                created_at=excluded.created_at, updated_at=excluded.updated_at,
+                iv=excluded.iv
+        """
+
+        saved = 0
+        entries = iter(entries)
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                while True:
+                    rows = [self._entry_row(entry, now, aesgcm)
+                            for entry in islice(entries, batch_size)]
+                    if not rows:
+                        break
+                    cursor.executemany(query, rows)
+                    conn.commit()
+                    saved += len(rows)
+                    if progress_callback:
+                        progress_callback(saved)
+        except Exception as e:
+            logger.error(f"Error saving entries after {saved} rows: {e}")
+            raise
+        return saved
     
     def get_entry(self, entry_id: str) -> Optional[PasswordEntry]:
         """Get a password entry by ID."""
@@ -0,0 +1,84 @@
+"""
+Per-thread cache of long-lived SQLite connections, keyed by database path.
+"""
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Union
+
+# Applied to every connection, including the ones the application opens
+# for the vault, which keep SQLite's default (FULL) synchronous setting.
+CONNECTION_PRAGMAS = (
+    'PRAGMA foreign_keys = ON',
+    'PRAGMA journal_mode = WAL',
+)
+
+# Extra tuning for the long-lived connections get_conn() hands to the
+# scripts. In WAL mode synchronous=NORMAL only fsyncs at checkpoints, which
+# survives application crashes (not power loss) and makes each commit far
+# cheaper; the PRAGMAs are paid once per cached connection.
+POOLED_PRAGMAS = (
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA cache_size = -20000',
+    'PRAGMA busy_timeout = 5000',
+    'PRAGMA mmap_size = 268435456',
+)
+
+# sqlite3 connections may only be used by the thread that created them
+_local = threading.local()
+
+def connect(db_path: Union[str, Path]) -> sqlite3.Connection:
+    """Open a new database connection with the right settings.
+    
+    Args:
+        db_path: Path to the SQLite database file
+        
+    Returns:
+        sqlite3.Connection: The configured connection
+    """
+    conn = sqlite3.connect(
+        str(db_path),
+        detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
+    )
+    # Use sqlite3.Row to provide both dictionary-style and tuple access
+    conn.row_factory = sqlite3.Row
+    # Enable foreign keys and WAL mode for better concurrency
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def _connections() -> Dict[str, sqlite3.Connection]:
+    """Return the calling thread's connections, keyed by resolved path."""
+    if not hasattr(_local, 'connections'):
+        _local.connections = {}
+    return _local.connections
+
+def get_conn(db_path: Union[str, Path]) -> sqlite3.Connection:
+    """Get the calling thread's cached connection to a database.
+    
+    The connection is opened on first use, tuned with POOLED_PRAGMAS and
+    kept open, so its page cache stays warm across DatabaseManager instances
+    and operations.
+    
+    Args:
+        db_path: Path to the SQLite database file
+        
+    Returns:
+        sqlite3.Connection: The shared connection
+    """
+    key = str(Path(db_path).resolve())
+    connections = _connections()
+    conn = connections.get(key)
+    if conn is None:
+        conn = connections[key] = connect(key)
+        for pragma in POOLED_PRAGMAS:
+            conn.execute(pragma)
+    return conn
+
+def close_all() -> None:
+    """Close and forget the calling thread's cached connections."""
+    connections = _connections()
+    for conn in connections.values():
+        conn.close()
+    connections.clear()
@@ -0,0 +1,1008 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00<\x83\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00`\x00\x00\x00`\x08\x06\x00\x00\x00\xe2\x98w8\
+\x00\x00\x00\x07tIME\x07\xe9\x09\x04\x0e\x1f1\xe9\
+\xf76b\x00\x00\x00\x09pHYs\x00\x00.\x22\x00\
+\x00.\x22\x01\xaa\xe2\xdd\x92\x00\x00\x00\x04gAMA\
+\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00<\x12IDAT\
+x\xda\xed\xbd\x07\xbc]Wu'\xfc\xdf\xa7\xdcs{\
+y\xbdKzOz*V\xb3$#\x1bY\xd8\xb8 \
+ `c NL q2\x81/0)\xbfd\x86\
+$3\x19\xc6C\x98\x99o\xf82IH\x18\xf8l\xc2\
+P\x12\x9a\x0d\x06c\x83c\x03\xb61\xb8\xc9U\xb6\xd5\
+\xfb\xeb\xfd\xdd^N\x9f\xb5\xf7>\xe7\xbe'\xe1\xd8\x96\
+lb\x188\xfa\x1d\xdd\xfbn9e\x95\xff\xfa\xaf\xb5\
+\xd7\xde\x17\xf8\xe5\xf6\xcb\xed\x17yc\xaf\xf5\x05\xfck\
+n\xb7|\xe0\x03\xfa\xadO\xde\xfb\xe1\xc2\xe2\xc2\xee\x1d\
+\x17\x0e\xf6\x7f\xe4Ow\xb7\xb6\xa7\x0b'Q\xae\x96\xbc\
+\x86_\xf6\x8b\xe5\x13n\xcd\xafy\xf9\xc21\xcbI\xfa\
+N\xdd=a\xaa-\x95\xec\xd0\xf6\xe9\xec;.\xaf0\
+\xf6F\xe7\xa5\xce\xe1\xfb7)\xb5\xda\xef\xf6\x98\xb5\xfa\
+\x85\xb6g=\xd0\xd9\xb9\xb1\xf2b\x9f\xff\x85Q\xc0M\
+7\xdd\xa4\xfc\xe8\x1b\x9f\xfa{\xb3^\xfd\x10\x13\x1b\xb0\
+a\xd3j|\xf2k\x1f\x80\xaeM\xd1'*\xf0\xbd\x06\
+\xe0Z\x80e\x02\xa6\x0dV3\xe1\x96h\xaf\xd8u\xb7\
+\xc2\x1a\xa4\x9agm+\xf6\xc9\xec\xbbo\xfc6c\xd7\
+\xbb\xfc\xb8\xbe\xef+\x8b\x8b\xc7{Q\xb7w1\xe6_\
+\xce\x14\xb6\xdb\x07\xd6(\x0a\xd3|E\xbb\x22\xd7\xbe\xe6\
+\x87/v]\xbf0\x0a\xf8\xd5\xdd\x1b\xae8p\xfc\xc8\
+\xf7\x14\xf8\xaaB\xd2\xd7U\x05\x9a\xa6\xe0\xcf?\xf6!\
+\x5c\xf3\x9eu$\x88E\xfaT\x9dv\x0b>\xb8\xa1;\
+\xe29\xe0\x05\xcfI\xdeN\x03\xdeb\xc5\xad\x8dw\xff\
+\x99\xdd\xf9\x07s\xbeg\xef\x22a\xef&%\xac!\xe1\
+kB\x9ctl\xc6\x140E\x85\xa6'~=\xdb1\
+x\xeb\x8b]\x97\xf6Z\x0b\xe6_k\xab\x16&\xdf\x9f\
+\xd4\x98J6+\xfeVIV\x8a\xef\xe3\x9e\xdb\xee\xc2\
+57$Hp\x1c)l\x08A\x87\x1b\xf3\xb9\x89\x07\
+\x7f\xa8`Z\x14J\x87\xaa\xc6\xd8\xdcM\xb5\xc59\xcf\
+W\xa2\x19\xbf\xf9a\x9f\x04\xcfw\xfa\x9c\xcaw\xae\x0f\
+\xab\xe7\xa5\xae\xeb\x17B\x01\xfb\x1f\xb8)\xf9\x1f?\xf8\
+?\xf6\xb4D\x15\xe8\x8a\x86\xa8\xa6!B\xd6\x1f\x8bh\
+\x88\x15\x8a0\x17\x9f\x86\x91\x22\xab\xf5<\x82!)w\
+\xae'\xfe \xb0Jl\x8ax\x91y\x5c\x15NJ)\
+=5W36\xd3+\xfe\x19\xe7R\x14\x05\x8a\xa6\x93\
+\xf5\x1b\xf4Y\xff%\xaf\xed\xa7\xa6\x00\xdf\xbfE\xb7\xac\
+\x99aE\x99\xee\x87ponYd\x80\x9aA\x8fd\
+qN\xd6w\xb4\xfc1\x0f\x0a\x01o\x1b\xbd\x16\xa7\xbd\
+\x95\xfe\xef\xa5\xab./\x10h\xd8\xcb\x8f\xc7\x18{\xe9\
+\xbb\xf9\x17\xb6{\xfe\xe1\xae\xb5\xb0\xed\x5c6\x12A\x92\
+\x84\x9e\x8a\xe9\x88GI\x8c$\xdcB\xdd\xc3\xc2s\x05\
+\xf4\xf6\xc4\x80\x86\x0bf\x93\x84\x1d\xbaV\x12^\xf3\x8c\
+B\x19\x8a|\xeez`&}\xa6z0Rm\x1f\x10\
+\x1e\xe2\x07^\xc2u\xa5\x90\xe5k\x11\x03\x91(\x1d#\
+\xa6t\xfe\xab+\xe0\xc9'?\xa0o\xce\xef\xfb\xf7\xce\
+\xd37\x7fH\xd1\xdd\x1e\x85\xd1\x95s\x7f\xd7H\xf8\xf4\
+\x87xN\xf8K\xbb\x1fQ\x18\x850\x85\x9b\x8d\xc0L\
+\x9f\xb0\xd3\xe5(\xc1\xfcE\xc6\xfe\xc1\xf6\x19wc\x9d\
+v\xa5\xe4V\xdfr\x1aJ\xdc\xa2\xcf\x1e\xf2#\x9dO\
+\xaax\xdd\xdd\x8c\xfdf\xf5\xe5\x5c\xd3\xdc\xfc\xdc\x05Q\
+\x12\xbe\xeb\xb9\x98\xaa\xb88Ur`)d\x08z\x04\
+\xd1X\x12\xe59\x06?F\xd7Q#\xa1Y$L\x9b\
+\x84\xefxB\x09tQ\x12\x86|\xf9\xb7O\x0ap\x1b\
+\x0e\xea\xd6\x9cRb\xb3\xf4\x96+\x15\xe0\xf3\xcb\xa4[\
+%\xef2b\x09\xb8i\x17\xaa\x11_W*\xcd\xafW\
+|k%)g%\x1d\x9d\xa5\xd3=\x9f\xfe\xa9*`\
+\xed\xfd\x0f~T\xe9\xaf\xfd\x99\xe2FI\xc2\x1c7)\
+\xec\x09\xc1\xbbB\x01\x8c\x84\xef\xf3@\xa5\xf0?h\x13\
+\x0a@3x\x09\x83ch\xa3\xbf\xa4\xfb\xd3N\x9f\xef\
+\xa6\xef\xae\x85R\xa1\xe3\xa9oG\xbc\xe0{\x89\xe9#\
+\x96\xf5\x91\x1b#\x91\x8f\xed}\xb1\xeb!\xe1\xb0\xbf\xff\
+\xfd\xddk\xeaF\x0e\xa6\x17A\x96\x0en\x99\x0dTj\
+UX\xae#\x84\xebz\x5c\xc8\xa4hzd\xae+<\
+\x80\x0b\xda\x13\x90\xe4\xd3\xa3\xdc}\x97\xc1\xa1\xb8l\x9a\
+\x0a\xf2\xc4\x90\xf2\xea4}\xdd\x83nD\x11Oea\
+$3HdZ\x90\xcc\xb6\x22\x96\xce\x92\x17\xc4\xae\x81\
+W\xbd\x86\xdf\x03w(\xda\x1e\xa1K\xfa\xe9)\xe0\xe8\
+\x7f\xfb\xedv\xcd\xbc\xeb\x83\x0aK(\x9c8\x08\xd4\xe0\
+.\xbb\xdc\xf2\x99\x0b)t_\x0aW\xf1\x02A+\x12\
+|YH\xcd\xe4kM\x1cf\xd2S\xf8\xf7\x98\xe50\
+\xd4\x8b\xeb\x90\xdf\xfb\xd5\xb9\x87>\xbe\xa5\xfd\xd2?+\
+/\x17\xf8\xd1}\xf7\xf5\x14\xe6\xe6__\xab\xe4/\xbb\
+\xf3s\xff\xed\xb2\x96\x15;\xd7\xb2t\x1e\xf3\xb3\xb3X\
+\x9c\x9f\x87Y#\x8aI\xde\xc0w\xeeu\x8a\xc6\x83\xa6\
+N\xfcH^\xa3K\xbbG\x82\xa5w\x05\x07\xe2\xff\xbb\
+\xa4(\x8f\xae\xcf\xa6\xeb7\xe9\xa2\xb4\xd6^\xac\xdf\xb5\
+\x87\x04\x9f\x81J\x9e\xc4\xafW\x5c\xb7py&\xee\x99\
+_\x0bi\x0e\x1e\xf7p\xf6\xc2\x84\xf3UU\x80~\xf4\
+\xfe+#[XV\x08\x8f\xbb/\xb7\x1a\x1e\xb8\x84\x1b\
+3\xc9\xe8\xb82H\xe8\xe2Q\xd05\x04\x12\xf7$\x88\
+\x0a\xd9\x07x\x8bP9\xf2\xb9\xcf\x85\xcf\x15G\x1f\xf5\
+m\x1bj\xcdZ\xe5\x8d=\xf4\xde\xd1g\x1e\xb9\xb3\x5c\
+\x9f\xdb\xe5Z\xe6\xe5\xfb\xee\xfb\xf2n\xb3Q\x1b6k\
+5\xbdZ*\xb3z\xb1\x84z\xb5\x82z\xa5\x02\xab^\
+'\x9ao\xc1\xe3VN\x82\x91\x18\xef#\x12#\x01j\
+\x11B;\x12\xbc\xe7\x90\xa05\x12\x9a/<\xc0s\x03\
+\x0f\xa0Kr(\x02;\xae\x0d\x9b#h\xaa\xddK\xa6\
+s\xd2\x88\xb8\x91A\x06m!s~\x9b>\x17\xba'\
+\x822\x13\xcf\x15\x1e\x1f~\x22\x91{U\x15\x90L\xbb\
+\xefF,\xb0d\xbax\x02tya\xfc%aJ\x9e\
+\xb0\x13\x9f\xbf\xea\x07\x9f\x0b\x03\x9d\xb0~%P\x82\x8f\
+f\x04\x0c>\x17\x849! \xdb\x8e\xa1bw\xa1j\
+\xf7\xa0\x9c^\xf5\xf7\xf6\xf4\xa1\xbf#a\xe9.A\x07\
+\x87\x97F\xbd\x81z\xad\x86Z\xa5\x8aj\xb5\x8az\xb9\
+,\xf6\x06\xbd\xe6\x10\xec$RI$\xd2)X\x94p\
+\x99V\x1d\x99\xb4.\xbd\x8b\xd3G=\xb0e~\xc1$\
+|\x1e\x92\x84!\xf1\x98@\xd6/B\x81J!9\x92\
+\xf2\x1d\xc7A\xf3\x06\x18\x0b\xbe'\xb0Fx\x16\xf7\x02\
+\x8f\x1eU\x8ao|\xa7\xaf\x1e\xf9\xa9)`\xfc\xe3\xbf\
+\xba6\x91\xff\xc1[\x181\x00\x16\xc4-\x0e?\xe2v\
+\xf8sE:A`\xd8\x81\xc0=i\xdd\x12\xe7\x85j\
+\xf8\x0b\xe2s\xbe\xfc\x9eo\x9bhX\x06Jf;\x8a\
+N\x17\xca^/L\xa4!l\xce\xe7n^\xd3\x5c\xb7\
+B\x96\xea\xc0!\xaf\xb0)\x83\xad\x9b\x94\xc9\x92\xe4\x22\
+\xb18\xe2\xd9\x16\xf4\x0cF\x11\x89\xc7\x11\xa5]%\xa8\
+\x99\x99\x9a\xc4\xc9\xc3\xfb1r\xf4\x00\x8a\x8be\xc4\x13\
+\x11y\x81\xdc\xbbT\xf9\xe0\x8b\xab\xf1\x85\xfe9\x81\x13\
+\xc1\x96^S\x85y\xdb0\x1dO\xad\x95\xf2\x81Y\xc8\
+\xcf\x0a\xf0a2\x18+B\x01<\xd9S\xe1rZJ\
+$\x80\xf4f\x9f-\xb7WE\x01\x85\x07\xfe|u\xe4\
+\xd1[\xef0z\x958\xa5\x98\x92\x1b\xfb\x12*\xc4S\
+\x05A\x92\x12B\x0c\x13\xd6\xb4\x0c\xf0\xc5\xc5s6\xe1\
+\x93\x157L\x03y\xb3\x0dy\xab\x03y\xb7\x9b\xf2\xd3\
+4Y\x9e\x0c\x88\x92u,\x0aXP\xe9\xa6b\xa94\
+\xa2\xe9\x0c\x22\x89\x04\x09<\x09#J\x97`\x18\x228\
+rop\xf8n5H1\x16\xccz\x15\xf9B\x01\xf3\
+\x93S(\xccL\xa3R(\x91pM\xfa\x1e\x89\xc1D\
+\xd3j}\xd5_rH'H\xdc\x84a\xb8\x02=U\
+\xa2\x9a\xf9\xb9I/\x8f\xa7\xec\xc0~\xc4}\xa8\x8c\xd9\
+\x94]\xbb*\xc5\x10\x95\xbcI\xd5)\xdf\xa0|\xc0\x88\
+\xd3\xb5\xa5Z\xfcH\xb2\xcb;[v\xe7]\x8a\xe0<\
+\x1fO}}\x9d52\xf2n\x96/\xff\x9e\xea\xb9\x1d\
+\xa0\x13\x22\x12\xd0M\xe5\xecC\xf3\x9b\x92P\xc2\xa4\xa1\
+\x0b\xbc\xe4B\xadYQ\xe4\xed6,\xda\x9dX\xf0\xba\
+P\xf3\xd32\x08z\x1cC)YJ\xa5\x10'\x86\x11\
+'f\x11\xcdd\x05\xe3\x88Q\xf0\xd3I\x01\x5c1\x0e\
+\xc1\x92k\x114\x99uX\x0db7\x95\x12\xaa\xa5\x02\
+j\xc5\x02\xc1N\x89 \xa7\x86\x5c\xa2\x80\xa4^#\xfb\
+\xb0HP6\x5c\xc7\xc4W>\xfe(\xa6\x8a.\xfe\xfa\
+k\xef\x10\x89\xb0o\x91_\xb9\xbe\xe0\xfc\x1egA\x9c\
+7\xd25:\x1ey\x96\xcd\x99\x0c\xc5\x02\x8a\xc0\xa5b\
+\x0d^\xb9b\xa72\x9a\xcb!\x89\xb3#\x8e\xb8\xc2\x80\
+@\xfcV`\x91J\xd7\xaeBb\x18G3\xe68\x9e\
+2\xed\xeb\x1d\xffn\xf0\xc6\xcf\xde\xf6\xb2=\xa0\xbc0\
+r\x81kUo\xe2\xd8\xcb\xad\xd3\xa5 \xe4z\x95\xdc\
+\xcc\xbe#\x1bY\xe5\xe2\x0e/}\x91\xe2\xc7mx\x0e\
+\xbf)K<\xfa\xf4\x19\x8f\xe0\x80\xc3\x82\xe7I\xc6\xc1\
+-\x92>@\x8f\x0e\xdd\x14\xdd\x1c%<\x15\x12\xfc<\
+\x17\xb8J\x82M\x92\x90[\xb2H\x91p;I\xc81\
+\xda\x13\x99\x1c\xc1FB\xc2\x12\x82\x1b\xe4\xdf\xf5%\xbb\
+\xe2\x90\xc3\xaf\xc7\x22\xeb\xb6j\x14h\xcb\x8b(\xceM\
+\x0b\xebnT\x16\xb1jU\x09\xdb6\x94\x91d\x16\x1d\
+A#\x8b\xd6\x84@D~AI\x97O|\xdeq\x99\
+\xc0\x7f\xa7Lq\x83\xe0)\xdaE\x14\xf3\x99<\xec\xd7\
+\xdd\x88\xf4\xf4S\x989~\x18\xf1K\xdf\x0f<\xf1M\
+\x8c\xbb1\xf4m\xd8\x85\xfaC\xb7A\xd7]\xddT\x22\
+\xba@Z\xee\xf3a\xba\x10\xe0,\x0f\xba\x22\xc7\xe1\xe7\
+\xe3\xd7\xefA\xb3=\xb7\xaf\xb60\xf3_\xe8\xed\x97\xaf\
+\x00G\xf1\xaa\xbeg\xbf\xcb\xb5m\xc5\xb1k\xe4\xb1&\
+l\xe1\xd2\x1d\xc4\x0a\xb2 \xc7&Y\xd0k$|\x87\
+\xf0\xda&\xa1\x08\xc1\xf0\x9d\x82\x94KBw\x85\xe2<\
+r\xf5\x84\xa0m1\x0a\x80\x89t\x0b2$\xe4^\x12\
+2\xb7pE\xd1\x83p\x16\xfc\x1fd\x97B\xd8\xf0\x03\
+\xe1\xfb\xc22}R\xa8\xc0|b4\x8dF\x0d\x8dr\
+\x11\xa5\xf9)\xcc\x8f\x8fc~z\x02}]E\x5cv\
+\x09\x09>\xc2\xf3\x0eb7\x0ae\xb9B\xf8\x5c \x9a\
+p{\xafj\xa1T\xf5\x10\x8b\x13\x5cQ\xe2u\xf8`\
+\x1ew=6\x05\xad:\x8d\xb2\xb1\x01\x13\xb7|\x12\x97\
+\xdf\xf0N\xfc\xf0\xbe1\xf8\x9f\xfa\xcf\xb8\xf8}\xef\xc3\
+\xfd{\x0fb\xf0\xbb\xdf\xc1\xf0`\x0b.[I\x86D\
+\xf1\x8e{ \x0fe\x02\x1e=\x89\xb7B\x19<\xa6p\
+H\x0b2h\xae\x04Nc-\xd7\xce.\x97\xefK*\
+ \x9b\x8d\xce\xcd\xccO\x96\xedF-\xc3o\xd6\x22&\
+a\xd5+\xb0\x1b\xa6`\x11\xb6P\x88E\x82\xb7\x84\xa0\
+y\x11*\x9aL\x22\x95mG\x94\xac9A\xf8\x9c\xa0\
+\xc7x6+j$\x08a(\x14\xb5\xef\x0b\xde\xec\xbb\
+\xae\x0czM\x88\xc3\x19\x82G\x80\xff.}\xceql\
+q^\x93\xe8e5\xbf\x80\x85\xa9Q\xcc\x8d\x8d\xa2^\
+\x9f\xc2\x1bv\x14\xb1\xba\x9bn\xdb \xcf\xd1\xa4\xc5s\
+\x0b\x97g\x91\x9cW:\xa3\x03\xb3\xe1!\xd7\x1b\x15\xb0\
+2U\xb416\xbd\x88c\xa7+\xb8\xe4\xed=\x88F\
+U\xa4.\xbd\x16G\x7fT\xc3E\xdb\xd3\x88\xad\xdf\x81\
+\x89gL\xec\xdc\x9aD\xcc\x1d\x83f\xe4I\x97\x9a\xa8\
+\xf7p\xd8\xe2\xc6.\xaf1\x88g\x9cX\xf0G~>\
+\x91\x0e\xc8|\xc0\xe7\x19\xf8\xb9(\xa0<Y\x8c\x91\xf5\
+\xaa\x1c\x8f\xf9E\xd7\xabeD\x08.l:)\x17\xac\
+\xa6\xeb\xd0\xc9\xb2c\xc9\xb4\x08\x88<+\x94n\x18Z\
+\xf2R\xdcq\x9d3I\x00\x17,\x93\xd7\xdd\xac:\x06\
+\xf6\x1e\xd4_$\xe4p+\xf3\xc4\xf9I\x01\x161\x10\
+\xc2\xf9z\xa5@p3CVO\xc2\x9f\x18Gw\xc7\
+<\xae\xdd\xdd \xd8J\xc07b\x14H5\x19\xf4}\
+\x19!e.\xc2]\x9a\xae\x87\x8e\xe1\x94(\xab&\x85\
+v\xb5\xea\x04?5,.602A\x8c\x88\x83U\
+<\x0a\xa3\xa6@\xf7\x09>cQ\xa2\xd7Y\x98\xc5\x0a\
+\x09\xcbFgO/\xfc\xa3\xfb\xa0E\x0d\x11\xb0e\x9a\
+\x22\x8bx\x92~C\x9e\x0fJ\x80\xff,(S\x04\xac\
+JSg\xceI\x01\xe3{\xbf|A\xfb\xb6_I\x80\
+%\xc8\xc2j(\x95J0\xe8\x80E\xca(\xb7\xee\xbe\
+\x1a\xb1D2\x10\x94\xdc\xb9\x92B\xf8\xf0\x9b\xa5\xdc\x17\
+~\xbe\xfcQV~\xfd\xa6W\x08\xb8\xf1e>!a\
+\x8c\x07\xd9\x1ae\xb1\xc4\xed\x0b\x0b\xc8\xcf\x10\xe4LN\
+\x10\xe7\x9f\xc5\xee\x1d\x05\xac\x1d\x22\xe6\x91j\x81O\xac\
+C\x09\x02_\x13\x98=\xf9\xc8c\x18#oE\xb1\x0a\
+{\xae\x8c\x14\xf1\xcd\x15Ir\x90\xb1\x09\x9cx\xf6\x14\
+R\xf4\xfe\x05\xdd\x09\xa4b\x1czmd\x1b\x13h\xc5\
+it\xb4)h\xf5\x0ea[\xd7I\xacl\x8d\xa0e\
+\xbb\x85d&\x8a\xfatp\xafa2\xe9I\x83\x92\x06\
+(_\x149\x81\xb8\x14\xe9\xf7\xa4\xff\x83\xe7\xa4\x80\xda\
+\xd8\xc3\x8a=|\x09\xb3|\x83h\x5c\x03\xe5R\x19\xd5\
+\xba\x89j\xb1\x88\xa9\xd1\xd3\x18X\xb3.\xa0\x88^S\
+\x09~h\xf9M+\xf6\x97\xca\xea\x81G4\xa1\xc5\x97\
+\xc0\xe3{\x81\xeds:\xc1-\xde\x97q\x83\x07u\x87\
+\xe0\xcd\xaas\xac/\xa1\x94\x9fG~v\x06\xe5\xc2<\
+\xd6\x0c\x95\xb1sS\x15\xf1\x5c\x1aH\x90\xd4\xb8\xd5C\
+m\xe6q~\x00\x09\xa2\x10\xcb\x85\xcf\xff&\xebG\xa5\
+F\xd0\xc5\x833\xd0\x12\xf10\xf5\xdc\x09\xf4\x93\x85\xaf\
+l\xf3\xb1y\x0b\xd0\xbba\x1c\xd1kW\xc3\xe8\xbc\x0f\
+\xdf\xf8#\xca1\x0a\x158\xb5\xd3x\xd3N2\x86\x85\
+\x87\x09\x02\x89\xb9\xcdx(W\x1d\xc4;\xdb\x10\xe6:\
+\xdc\xcbx\xdd\x8b\x09\x9f\x90J\x08\x020)\x80\xee\x85\
+\xff\xed\xb8\xe7\xa6\x00J\x5cf\x1b\xa5I\xcf\x89v+\
+\x1c\xe7Mb\x1cv\x8dRzz\x1c;y\x1c\xdd\xfd\
+\xfd\x22\xb5\xf7x`\xf4\xbd \x10\xf9\xc1\xcd{M\x08\
+\x11\x02\x17\xc1J2\x22\xfe\x1di\xe5AP\x15<\xce\
+\x0b\xe8\x9f\x0c\xde\x5c\xf0<\xd6\x98\x14w\xeaD-\xcb\
+\xa4t#jb\xd5@\x11\x17\x5c\xcd\xe1\x86p=\xd5\
+\x1dTZ\xd5\xa0\xdc!K\x1ea\xdc`^\xa8w?\
+\x08\x8a\x8c\x8e\xedS\xb2&\x93\x14]'\xd6\xb3\xe8\xc0\
+`\x0e\xda:\x22D[\x1b8}\xdf\x13\xc8\x1c<\x86\
+\x95\xefy\x1b\xf1\xfe\x18\x18\xe5\x15P\xe9zb\x9cr\
+\x12\xb2\x13\x83\xf3\xeb.e\xda\x05$\x18k&\x9e2\
+\xcd\x91\x99\xbe\xac\x01\x04#d~P\xd7\x22\x06h{\
+\xda\x91sR\x80n\xa4\xa7\xcc\xe2\x8c\xcb\xd4v\xc5\xb1\
+l\x11\x04\xab\x95\x0a\xe8\xba1~\xea\x18\xb6l\xdf\x22\
+\x18\x0fO\xcb9L\x08ep\xe1q\x01\x93\xd5\xf1\xd4\
+\x9f\x07X7\xd8e\x951\xfc\x9c\x1b\x08\xdc\x15\xa5b\
+?\xa4\xa9dN\xbcl\xa2\x12g74\x13\xb9\xa4\x89\
+\x15}\x1c\x7f\x81d\xca\x84\xcak7F\x8b\x1cu\x0a\
+(\xaa\xcc\x9c\x99(\x7f 0\x028\xcb\x87\x10d0\
+\xe4\x98\xce\x88\x851\x8aUu\xd2\x81FP\xa2G\x5c\
+\xe2ruQ\xffQu\xfe}\x07\x99\x0dd\xd9\xc9\x84\
+x\xae\xf0\xf4\xd7\xd5E\x12\xe6y\x14\x1b\xc8\xa3l\xd6\
+@<c\xc9\xe1G\x9ed*\xa2Z\x15\xc0\x9eT\x00\
+O\xecB\xfc\xe7\xf1\xc0%\xafv\xa0\x9f\x9b\x02.\xf8\
+\xdd\x0d\x85\xe7\xbfU\x98V\x1d\xbb\xdfu-aY\x0d\
+\xe2\xdcz,\x86\xd9\xa9\x09\xcc\x8e\x1d\x17\x81\xd1j\xd4\
+\x05\x13\xe2\xc2\xe6fGI\xa1Hx\x14\xba5\x95x\
+\xb8N\x16\x14\xd5l\xbaY\xb2:r{\xcdp\xa1G\
+\xe5\xf3H\x94\xd1N\xca\xa6\x9d\xa88\x09?\xc0U\xca\
+(\x15]\x17\x8fL\x89\x04\x05\xbc(\x9au\x0d\x81Z\
+J\x007\x90\xd6/8\xb9\x12$}2(\xb2\xa0\xce\
+\xe73\x99\x18q\x98\xf2\x22\xd3\x982\x09\x93;3\xc8\
+\xc6\xfb\xf0\xado<\x82\xbe:\xc3\x9b\xf9\xa8\x99\x91\x86\
+5\xbd\x12\x1d\x13i>\xac\x88L\xba\x15GF(\x08\
+S\xfcIf\xbb\x11\x19}\x94\x08H\x04\xe9l\x5cz\
+.?Ix\x0eY\x0b\x95\xd7(*\xb8Lx\x0d\x7f\
+\x8f>Z\xef\xdf\xf8\xbaq\xe0\x0b/_\x01\x8c}\xd4\
+{\xf6\xab\x1f\x9c$\xea\xd7\xef\xd8\x0e4\xca \x071\
+\x8e\xde\x1c\xc3\xd6\x5c\x19\xed\xd6\xb7\x88\xb2\x91@3.\
+\x22\xdcSI\xb0\xd0H\x01:/X\xd1\x0dS\xb6\xca\
+\x0c:\x8d\xce\xc7\x06T>$\x1e@FP\xa2\x0d\xb2\
+E\x9f\x85\x81K\x09\xec5p\xe1\xa6+\x871\x84-\
++\xe8\xa1\x099\xb2\x80\x1a0\x1e\xc6\x9a\x01QhG\
+d\xe6\x81%\x0av\xa4\xd1\xd7TL\xd6\xc9\xb0[r\
+H\xf5u\x81%\xe3x\xaeL\x0ck$\x8du7~\
+\x08\xfd\x9d\x1bq\xd7\x03eL\x8e\x1f\xc5\x87\xfe\xfd\x0d\
+\xf8\xff\xbe\x7f/v$N\xe3\xa2K\xd6b\xb5\xff\x08\
+\xdd\xab&\xa0\x8c{\x1d\x0bK\xe9\x1c\xff=\x16`\x91\
+,,\x8a\xabPd\x99\x83\x12\xc0\x85M\xb5\xb6\xd29\
+y\x00\xdf\x9c\xca\xfc!J\xa4w\xf2L\xb7\xadr\x14\
+\xbb\xd6\x9f\x866@\xf4\x81W\x11\x8d*\x09Y\x0aX\
+\x08V\x8b\x04\x8fA\xfd^\x95\x99\xa6\xb8(5HN\
+\x02,\x16\x17(\x18\x83\xda\xfc\x1b\x81\xf54\xc7\x04\x9a\
+\x9b\x12`\xeb\x92\xa0\xc5\x83*oP\xc0\x8e\xa2H\x1a\
+\xe8\xb1@ \xc1\xeb\xbe\x84\x02\xf1\xbe/+\xb1<X\
+\x96\xeb\xf4\x22A\x91\x1a\xd1\xf1\xa67\xae\xc5\xdd\xf7>\
+G\xf9\x0b\xe5\x05\x96\x8bt[\x1b\x0a\x07JHE\x5c\
+\x91As\x19\xa7\x89~\xa3^$o\xd5\xa0\x88z?\
+\x10\x96\xbd\x94\xa0\x04/\x06\x9f\x96\xe1\xbf8_\x18\x1b\
+\x98r\x84]\x7f\xbd\xbb\x5c\xb6/K\x01vu\xee\xb4\
+\xeaJ\x9c\xd7c*\x94\xa4NH\xa0\xca\xba\x0f/\xbe\
+\xe9r\xe4K\x08]]\xda\x05#P\x82\xbf\x99\xb4\xcc\
+p\x94+\x14\xf4\xd2\x1eXo\xd3\xea\x97\x84\x1eZ\xfd\
+\xd2\xf7XxO\xcd\xcdW\xb1t\xb3\x8c5K\xdd\xe2\
+\xa5p,\x22h\x8a\xe0\xa5e\xcd\xe0#`\x0a\x11$\
+M^'/\xc0Q\xe6\x1c\xcf\xa5(1\xb3I\x01\xed\
+\xa8\xba\xa7\xd0m\xd0\xb5\x11\xb42Rt\x9c\xf2\x1c\xb7\
+\xb2\x88T{L\x9cC\x09\x18\x1e\x87\xbb\xb0\xd8(I\
+^p?A\x0c\x90\x05I\x9e\x8c\xb1\xf3+G+v\
+\xe5\x88kU(\xa6\xba\xcc\xf1(\xfdv\xfc\xa5\x1bU\
+\x96nZT=U9\xfa\xc5\xeb |\xf8Q\xba\x7f\
+8\x22\x14R\xb3@\xe8\xbe\xd2t\xd5\xe5\x90\xe3\x07\x18\
+\xcf\x82\xf7Bi\xcb\x87\xe5\xd0\xd4\xc4\xc9\xa5\xccZ\x0d\
+\xbcB\x0c!\xca\xe0(=\x02M\x96\xc4\xaf+\xd9\x92\
+D\x82`\xb2R\xf2\x84\x92m\xdb\x85M\xf7\x15K\xc5\
+\xe9\xfe(^e20\xe9\xcbqR\x94S\xaf\xd3m\
+\xf8\xc4\xfd)\xd9T&\x84\xf2DI\x04r\xb4O(\
+\xc2\x95JP\xd4\xd0h\x94e\x0a\x90n\xe2)\xec\xf0\
+O\xc8\xf6e)@\x89\x1fpk\x8b\x82\x1a\xd6\x958\
+\x1c+\x18\xd8\x11\xf2\x0c\x94\x10\xdex\x00\x09,\x1c\x82\
+\x0c\x85\xcf\xd8R!L\xe8=\x08\x88a\xbd\x84L\xd8\
+\x17;y\x97/q:\x0c\x98,\xfc|\xf3Q\x0d.\
+}\xf9\xf3\x00\xdaX\x18[\x98\xf4Je\xc9\x08\x9a;\
+]W\xba/\x87\xc1N\x1d#'\xaa$\x18\x15\x16\xaf\
+\xa6\x92g\x18\x043|$K#F\xe0r\x05\x10\xe3\
+rx\xc9\xc5\xaa\x93Wt\xd2\x15T\xe4\xb1\x83F\x02\
+E\x95u\x7f\xa6.\x9d\x8b\x05\xef\x8b\xf7\x02\xe3\xe2P\
+\xeb(\xc6\xc9\xf3R@\xd7\xe6M\x93^\xa3`z|\
+@[\x89\xc22\x83\x81\x14q\xef\x8a\x10\xb6O7\xcb\
+\xb40\x0eph\x0a\x85\xaf\x08\xf6\xe1sW\x87\xbeL\
+\x88z\x904ib@\xdc\x17\x7f\xeb\xa2\xb1I\xa6\xf0\
+\xca2!/=\x12Q\x5c\xb6KO\xf1|\x99\xf8\x84\
+\x834\xc2{B\xcfiB\x12\xd0\xa4K\xe4\x1dF&\
+\x8e=W\xad\xc0\xf3?\xd8/2\xee\x06%\x97\xbc\xfc\
+\xcc\x0d\x84\x05\xc4\x9e[x<\x95\xa4\xfc\xa3\x0a\xd5\xab\
+\x91\x02:\xa0{\x15\x81\xff\xd2\xd0\xa4\xa7\xf3\xe7\x5c\x01\
+\x5c\xe0J\xa0\x18\x16>W%\xe1px\xca\xa3\xb5\x9e\
+>/\x05\xf4>\xd4\x96'\xa7[\xe4\xc9L\xdd\xd5\x88\
+\xdbk\x92\xb5pw\xd3\xe8\x22\x22\xeaY\xc2W\x03f\
+\x10Z|(\xf8\xc0R\x83\xa0\xeb\x8bn>-\x08\xcc\
+/\x14\x1bB\x98\x09\x1e\x03\xea\x19\xd4\xe9\xe4\x88X\x18\
+\xd0\xfdp\x5c*H\x00\xf9h\x9c\xcd\xdbL\xc8[)\
+i\x04%t\xa0$\x0b\xd5\x06|\xday=h\xf8u\
++\x90\xa5t\xf8\x1f\xff\xdf\xefcq\xaa@\x0c\x8f\x14\
+AI\x16\x1fH\xe1\x95V~l>\x8a6\xbfXC\
+T\xb5\x11\xcb\xe6`x\x0b\x88\xf8UD\x04\xbd\xf6\x84\
+2\x84\xb5\x87\xbb\x1a>\xaa\x81\x97\x04T\xd4gfk\
+\xf7\xf0O(\xe0e\xc5\x00\xf6\xd1\x8fz\x8f~\xe9\xf7\
+\x0f\x91\xd0{\x5c\x12L\xdd\xd1\xd1\xc21_\x8c\xa1\xaa\
+\xbc\xc0$\x04\xef\xeb\x81+\x06\x16\x1a\x04\x05)L_\
+]V\x1cS\x9bY\xe9\x99x\xbe<\x0eH!7\xb1\
+\x9d5\xa5.\x82^\xa0\x11A\xae\xe5X\x83\xdc}\x9b\
+\xd7{do\x8f\xa8\xfd8\x812\xf8\xc09O\xd2\xe8\
+o\xfe\xbe\x9d\xa7\xd4\xabb\x22\x92\x8e\xe2\x81}\x93\xa8\
+X\x1ebdH\x0d\xd2W*\x12\x83\xcf\x1bt)1\
+\x8bD\xe3\x98+4\x103<1\x12\x96YS\x83B\
+I\xa1R\xa5\xf0]pa\x95\x0c\x98~\x9a\xe0%B\
+\x1f'\x98\x09\x0a\x7f\xa2\x1c\x11&i\x0e7\x14ut\
+\xeb\x9b\xdeW\x03~\xf3\xdc\x15 6\xc7>L\xaa\xbd\
+\x92[i\xd9\x8eH\x01\x068/ Hg\xd2\xdd\x02\
+\xcc\xf6D\x80\xd5\x82\x12\xb0\x12\x8c\xb5\xab\xcb,<`\
+\x09?\xa1\x00A\xee\x83\xea\xa8\x17TF]QJ\xe0\
+\x039\x5c\xa8\xa2\xa2\xc9\x89\x80\xb0p.pG<\xf7\
+\xc5\xa3/\xde\xe7A\x91\x0f\xaa\x8bGQu\xf0\x97<\
+\x88+\xa1BA\xb7PB\x89\xac\xbbV'\xb3\xa2\xaf\
+\xc6\xe9>L?B\xb4\xd4\x10C\x98nu\x1a\xd1\xc4\
+0f\x0e\x1dD}f\x14^\xad\x88g\x1e\x99\xc0\xc0\
+ouRnC^\x9d\xd0`\xe4\x08<\x17\x17Q\x9b\
+\xa7\x94\xd3M\xf3f,:\x95\x0c\xc0\xfc_\x98\x84\xd1\
+Y\x0f\xbePw\xdf\xcbV\x80\xe6\xd9c\x02\xdb\xe8\xa0\
+U;*\x19\x80\x1aPO-\xa0\xa1A\xf6'R~\
+h\xcb\x06$\x02f\x03u\x19\x1b:s\x97\x82\xe6\x92\
+\xe2\xe3\x02D\xfbxU\x95C\x07QB>z\x05\xd3\
+\x91\x823\xe9};\x80\x17[*\xc3\x0f\xdb\x09\xf9\xce\
+\xbd\x803m\xae,~hN\x97y\xa7FD\x91\xfa\
+\xa7\xcf\xb2r\x03\xf9#%<\xfa`\x1eG\x8eVa\
+\x90\xd2\xf8\xad,\xda\x0c\xb5\x93\x93H\xf7.b\xe2\xf9\
+\xbdx\xfe\x7f\x7f\x1c\x0b\xf1\xf7\xc2\xd9\xff\x1c:\x16N\
+\x22;\xe1\xe1-\xd7\xad\x80\x9b\xa7L\xda\x22#l\x90\
+\xa7W-x\x15\xbaF-\x0a=\x97EalN\x16\
+\x07\x99\x8cOJ\x90 2\x16\x99zA\xb9\xbe\x5c\x05\
+0f\x8dK\x98\xe6\x1e\xc0\x07\x15\xea\x22\xab\x15V\xaf\
+\xa9\xc1\x09\x83\xa0\x8a\x80\xc1\xf8Kx\xbe\xc4\xe3\xcf\xb6\
+z`\xa9di\x92\x15\x13>\x17j\xf0\x0b\x94\xa6\x96\
+\xb9\xf0I\x19\x5c\xf8\xc2\xb2]\x091MX\x09\x0a{\
+$\x5c$\xe9|Y:oJ\xee\x8c?\x12\x83\x11q\
+\xb7n\x83\x95\xe88\xf3t\xfc\x99\x1a\x0a\x87Jx\xf8\
+\xf1\x0aF\xc6\xebX\x9b\xd5\xb1H\xde5K\xb0\xb4z\
+x\x10\xf1\xf6(6T\x1e\xc6\x1ag\x04\x9f\xff\xd8\x0e\
+l\xdcT\x86\xfa\xf6aD\x8d\xb5\xf0\xaae\xf8'\xeb\
+\x94\x98\x16H\xe8\x8b\xf0x\xed\x8b\xe0\x05z\x92\xec \
+F^\x94C\xc7\x8e\x8b\xb1x\xf0\x04\xa21=H4\
+eg\x88\xed+\xc7^\x91\x02\x8c\x18\xf6\xab\x14\xa1(\
+\xc0(\xd5\x06i\x9fOfP\x96\xa8\xa6<\xd4\x12\xc5\
+dM\x9a\x14\xc0\xce\x19\x01v\xb9\x02$\x9f&)\xc1\
+/\x97\x81)\xca\xd4g*\xf0\xf3u\xbaIS\x08_\
+\xe0</\xe8\xe4H\xf1$0F\xc2\xf6\xd3$\x5c\xca\
+\xc4YJ'\xb7We\x99!\xccB\xc3X\xc3\xe1\x87\
+@](\xacFJ\x9c\xaf\xc2:U\xc4\xc9cu\xc2\
+|\x86m\x17\xf5 9\x90\x85\xda\xd3\x86\xae5\xdd\xe8\
+\x1b\xeaF\x8a\x8e\xc7\xec:\xdcr\x01~E\x83[x\
+\x0e\x98\xac\x12\xbc\xf0\xac9\x01-\xd1\x02\xd6Bt\xb4\
+w\x1d\xdd\xb6A\x818\x22\xee\xd1\xa7\xc0]\xe5\xa4\xc0\
+\x99\x83\xa2i\xa2\xc2\x22H\x82'\x12\x11\xb0z#\xf2\
+\xf5\xff\xb0m\xf7\x9b\xff\xf0\x86|\xaa\xfb\xc3\xfb\xcfY\
+\x01m\xb9-\xc7G'\x8b&\xd1\xc4X\xd5%\x08r\
+\x8b\x22\xda\x0b\x05\x04I\x95/ &\x10\xbe\x1f\xd2I\
+\xf6\x22{8\x08I\x96Y*\x83\x9d\xca\xc3\x1d)\xc0\
+\x9c)\xc3\xcc\x13?o\xd80\xc8\xba#\xab\x93P\xb7\
+\xb4\x81\xf5\x90\xd0\xe3\xfa\x19\x19\xa6\xf4N\x04F \xdd\
+=\xe8g\x14\x83 <\xb7\x80+3^\xaf\xbd\x05V\
+w\x06\xeb~\xb5\x13\x9byY\xc1\xb3\xe1\x95I\xe1\x95\
+\x12)h\x16\xde\x91\x83\x84P\x04)\xcc\x80\x96i%\
+\xafj\x81>t!X,\xcbs!I\x919\xcc\xf1\
+1\x05\xbe\x13\xb3\x9a\x1a\x9d\x87\xb2\xf1\x03\xc8\xe9\x0bP\
+\x1aO\xc1.\xe5\xa1k1Y\x89\xe1^m7`.\
+\x16q\xcfg\xee\xfcxz\xa0\x15\x8f\xff\xd3\x8f\x8f\xd3\
+\xd5\xad9g\x05t\xbd\xa9Rg\xff\xa8\x8c\x12\xadZ\
+[G\x1c.Y\xe6\x19\x0a\xe0\x01\xb7I\x09C\xde\xbe\
+\xdc\xea\x11\xbc\x1ezC\x08?\x04#&\xc1\xcdd\x09\
+\xee\xe9\x02\x8a\xa7\x17Q\x9a$\x05\x14\x89iD\x18\x12\
+\xb9\x082S\xbc\x95\x84\x14T\x8c\x03\xfd\xf4\xf5\x16C\
+\xd6\x9f\x96*t2\xc7\xf0\x22pm\x0e\x831z'\
+A\xd6\x97\x14T\xd7\x8b\x90\x82\xe3U8\x8dE\xb0\xfc\
+\x02\xbc\xd3\x07\xc91\xea`\x11\x9d\x04\x9d%\xe8j\x83\
+\xd2\xd1\x07\xb7w\x0b\x1aUMX\xadO^\x95\xec\xe0\
+=FZ\x93\xd22^\xed\xe5\xcc\x8a7\xf5R\xd2`\
+\x96\xea\xf8\xfa\xa3u\x9c\xfa\xcc\xbf\xc3u\xef\x7f?t\
+\xab\x88M\xc3Da\x0f\xeeGif\x11\x0a\xc1\x90\x1f\
+M\xa1\x11\xcd\xe2]\x7ft=\xb1G\x05'\x9e\x1d=\
+q^\x10\xc4\xab\xa2\xdf\xfb\xca\xc7f\x15\xd5\x5c[\xf3\
+\x0d8&\xddr\x98\xdc\x88\x1a\xcb\xd9\xc9\xd3rKW\
+\x9b\xd6\xe9/+\xa7\xc9!I\x82\x882a\xfeL\x15\
+\x15\x82\x9f\x85\xb12\x0aS\xa6\x08\x9c\x11R\x80S\xf5\
+y\xdf\x05\xe2\x8e\x8dL\xc3C\xa4J\xdf\xec'a\xf7\
+\xa4)\x83%\xba\xe8\xf1\xd9-i\x12\x92.\xac\xcd\xa7\
+cY\xd3\xf3\x04a\x13\xf0\xe6g\x88\xfb\x93\xa7\xea\xe4\
+9\xa9\x04\xf46\xb2\xea\xce\x0e(\x1b6Q\x9ch%\
+\x05'\xc8\xe2\xe3\x98-\xb7\xa3\x5cKbqd\x0c\xc5\
+\xfb\xbf\x89\xca=?D92\x88\xae7\xae\xa3\x80\x1c\
+\xc3\xfa\xcbW\xa2\xad3\x19\x94W8\xac\x04e\x92x\
+\x0c{\xcd~\xf4\xec\xbe\x18\x89\xad{\xa0\x1e\x1b\x11\xd5\
+\xe0\xb9\xa99\x0c\xed\xd9E\xe1+\x82\xbb\xee>\x84+\
+\xf7\x0c\x91\xb3\xb9h\xcc\x13\x85U\xf5\xd3\xe7\xa5\x00\xbe\
+\x91\xd7=\xa4\xaa\xean\x8b\xac\xca4\x19\xa2\xc2\xe2\xb5\
+@\xf8j\xd0\xdd\xb6\xac$|v2\xc5\x96*\x9a\x12\
+=x\xea\xc9\x87\x08-8%\x13\xa5|\x03\x85\x05\x07\
+\xa6\xce\xc7\x07\x14\x8e\x1cpH\xc1\x0d^\xd7\xe1\x8dQ\
+\xc4:\xd2\x95(\xd4q\x15\x0a\x09\x90\x91\xa5[\xa7G\
+\xe1O>\x06oaNPS%\x16\x87\xd2\x9e\x03\xcb\
+\xb5B\x1d\xba\x04jk7yK\x0a\x8a\x91\x0aZS\
+\x5c\x1e\x12E\xedg\xda\xd9\x86\x86~\x11\xecv\xb2r\
+\xa7\x88l\xa2\x93\x98\xce,\xe6\x8f\xecGy\xef\x11\xec\
+\xfbJ\x1e\xab\xaf\xd9\x81\xa9\x13\xcfb\xc7\xdb\xd6cp\
+S\x9b\xccg\x82\xf9\x00\x91t\x0c7\x5c\x91\xc6\xc1\xf9\
+\x164N~\x1b\x9b\xbb(\x86Q>0\xbc\xa7\x0fZ\
+r\x14\xf6A\x0f?\xfc\xe6\x8fp\xd1\xd6~d\xba\xda\
+\x05i\xf3=\xe7\xdc\x86$\xcf\xf8\xb0\xe6\x8e\xf1\xfe\x1d\
+\x0e5\xd5\xba\x8eL\xb3$\x19d\xb2!\xf4,\xa7\x9a\
+!\xf7\x0f8\x7fXP\xf6C_\xe07C\xd4\xd2!\
+\xbc\xb7\x1b|\xc8\x8e\xb2\xcb$'S\xbe(ox\x1a\
+\x0fa\x1elb\x1c*a\xee\xec\xc9\x1a:\xdf\xba\x19\
+\xc5[\x1f\x862q\x1c\x89-=\xd0\xd6\xae\x05\xdbu\
+\x05\x94D\x8e\xee?M\x94\xd8h\xc6\x1f\x16\xe6\x15b\
+'\xcfB\x03\xc7\x17c\x185\xae\xc3E\xf1\x1etr\
+VG\xaf.\xe8Y\xd43\x14\xac\xdf\xf0&d\xe7\x8b\
+\xe8\x8b\xdd\x89\xe2\xde\x02~\xf4\xb5G\xb1b\xf7\x06d\
+\x1f\x99$\xa3\x88\xa0ou&\x18\x7fpDI\xe3W\
+\x86\xa6\xf1\x96\x15S\x22\xfb\xaf\xf3\xc1(5\x8aS\xf7\
+\x1c\x81yx\x94\xe2\x95\x82O~\xea\x02D\xb7\xd2\x99\
+\xc7\xe70y\xb0D\xa2\x89\x9e:o\x054|\xfd0\
+\x9d\xd8W\x88r\x94j*z\x9a)\xeaR\xe9 \x1c\
+\x0d\xf2}\xb5\xf9\xb7\x8f\x10\xaf\x97\xb3\x9f\xb0c7(\
+\x1b\x07\xf5\x1c%\x1a\xf4f\x06c5\xc2hy\x83\x15\
+)\xa4X\x00V\xde\xb0\x0bO\xff\x87\x7fD\x8e\xd5\xb1\
+\xf2\x8f\xdf\x0cc\xfbE\xf4^\xaaY\xf4\x12G\x16.\
+\xe66\xd5\x1c*\xc1\xf3-|\xeb\xb9\x14\xfe\x8by\x03\
+v]\x90\x12\xe5\x9cK\xe8\x1d\x8a\x02\x88\xd1\xf5\xce\xa9\
+9\xdc\xb70\x8b\xfd\x83\xefF\xfaD\x07\x9e\xfd\xd3\xb7\
+@uH\xe9\xb3\xa71\xb2x\x08s\x0fL\xe1\xba\xee\
+\x14!\x8f\x16\x0c\x81*r\x9e\x81\xc2\xa90)\xbdN\
+I\xddl\x01\xe3\xb3\x0a\xe6\x1b\xdd\x88UU<\xf5O\
+y\x5cq\xfcn\xa4\xba7#\xdb\xd9\xe7O\x8c\x94\xce\
+mHr\xf9\x96\xe9\xed9T9x\xd2\xa3\x9bU\xcb\
+U5\xe0\xefA\xe9\xc1\x0f\x92.\xb6\xbc\x80\xa6\xc8q\
+\xd1\xe5\x09\x97\xaf\x04\xf51Y\x06\xe6\xccB\x944\x88\
+B\xaa\x11\x15z\x8c\xde\xd5dEQ!\x09)\x1a\x1f\
+\x96T\xc5X\xed\xc0;\xaf\xc6\xf3\x9f\xb8\x13\xacQB\
+\xee\xf7\xde\x06\xad;\x8b\xb9#6\xda\x86\xd7RV\xfb\
+,\xa2\xed\xba\xa8\xa2.\x8d\x15\x84\x03>\x9c\x0dY\xf8\
+\xf2\x83\xc0\x1f\x1f\xba\x0cV\xd6E\x9e\xbc\xae\xbaYE\
+\x8dr\xa6]\xf4\xfecS\x15|\xf3T\x19VI\xc7\
+\x05\xf9\xa7\xd0o<\x80\xe1c\x0f\xa2PU0\xe2\x0e\
+`|h\x0f\xee\xd5wC\xbf\xef~\xfc\xea\xb5i9\
+\xd8\xbf,\xe4\xf11f\xd6`\xa8\x9c\xaeP|L\xa3\
+\x96\x8bc\x91SUs\x06\xdf{\xee\x10\xae\xdf\xba\x12\
+\x91ZKu\xe0\xf5;\xc6\x81\xa5\x99\xab\xe7\xa4\x80\xcb\
+/_9\xff\xa5\x83'g\xc8\xbd{\x84\x02\x5c\xe0\x0c\
+\xa6s\x96\xb0\x7f\x82\xf7\xfbJ\xd3J\x97\xc6\x02d\xe5\
+P\xa5dNv\x14\x07\x95F&\x95 \xce\xc0\x07C\
+\x06:H/\x1aJ\x87Na\xf5\x9eAt\xf4\xa5p\
+\xd77\xf2\x98Mn\xc0\xb5\xc9VD\xddU\xa8\x9bG\
+\xd0\xd2\x9f^:\xaf\x1f\xf6\xe98\xf8\xee\x83\xd3\xf8\xf0\
+\x1d\x94\xc1\xc6\xf7B\xad\x0fS\xd8\x19\xc0\xf7\x1b\xad\x98\
+]\xa3\xe2\x8b\xf5:\x0c\xa2\x8ao\xca\x7f\x11\xbb\xc6\xbe\
+\x8e\xf9\xa3yT(\xde\xf0\x898Q\x97\xe2\xd1\xd4c\
+\xe8\xdc{+\x8em\x7f\x1f\xbe\xbb\xed\x9dX}\xe8a\
+l_\xab\xca9\x10^@\x89uC\x04\xe9\xbd\x8d>\
+\x1c\xde\xb2\x0d\xed-),\x8e\x1d\xc6T\xde\xc5\xf6\xb6\
+!\xc4\xfa\x87\xb0x\xb4>\xb1\xfd\xa9\xc9\xc6y{\x00\
+\x9f\xaa\xff\x95\xff\xff\xa3%\xc6\xfc\x9er][R\x80\
+\x18\x04?s\x84K\xba\xfeY\xb5\x1f,\x9b\x07&\xbc\
+G\x06oQ\xcc\xa3D\x86Ex_=\x13]\xd1\xa2\
+\xa9\x81\xcf\x93\xa6`o\xd0\xf7\x93+\xfaP>5\x89\
+T\x9a\xa1}\xc7J\xe4\xc7\x16q4r\x01F\x1e\xba\
+\x173O\xed\xc5\x85\xbf\xf1~\xb4E\xd3\xb8\xa4\xff\xac\
+\xda\x12\x05\xf9C\x07\xc7\xf1'\x1f\xfd:\xc1\xc9\x18\x22\
+=k\xe0\xd6\xae\x83W\xdf\x09+\x9f\xc3\xbc2\x88\x1d\
+\x89\x09\xbc7\xf5I\xf8\xe3G`\x10\xdb\x1ah\xf1q\
+z\xce\x15\x13\xb9\x15\x97\x08G\x8a\x1e\xf3s\xd8\xf0\xf8\
+gp\xd8\x88\xe3\xab\xfa\xebq\xc1\xd0!\x18b\xa8\xd2\
+\x0dXxD\xdc\xdbD>\x8eS\x93u\x1c\xfd\xf1=\
+\xa8.\x8e\xa3w\xf5\x10\xc5\x93\x05\x8a\xd8I\xd2W\xf5\
+\x19^\xd8<o\x05\xf0\xcdq\xec#$\xc6u<\x06\
+\xf8\xbc\x10\xb6|\xfc\xb39\x12$\xa1\x05a}>\x0c\
+\xd2\x0c\xcd\xe6\xd5`\xbe\x92\xecT\xd0%\xcc\xf0\xc9\x0c\
+BA\xa2!\xcb\x07\xefd\xe4MPf\xa3\x015\x91\
+\x80;kR\x8cS\xa0g(Jg3\xe8\xc0 \xd1\
+\xcb.\xb2\xfa\xad\xd0\x07Vc\xf1\xf4\xe3\xe0S]\x9b\
+5k\xdfC\xadR\xc4\xef\x7f\xe06T\x1f\x1b\x01\x8b\
+\x12K\x9a;\x0c\xb6\xf07p\xb3k\xb1\xea\xd7\xfe\x12\
+\xef\xd4\x0f\xe07\xbbnE\xa1PEl0\x87\x94\xee\
+\x12e4\x91\xa9\xd9\x98\xaf@\x8c5\x18D7\xcd\x98\
+\x8aX\xdd\xc6\xfa\xc7n\xc1\xe3\xc3\xaf\xc7\x93\xa7b\xd8\
+5To\x0eH9\x94m\xab\x14\xfc\xad\xa9S\x18\xa4\
+<!\xb2};\x92\xed\xd7`\xe2\xbe\xbf\xc7\x9a\xc1,\
+\xafA\x91\x1fF\x9f>[\x9e\xe7>A\xc3\xc5(\xbf\
+\xbb\xb2E\xee\x5c\xb3\x82\xe1\xf3\xe5E\xb5e\x9e\xe0\x9f\
+\x19\xa0\x97w=\xc8\xfa\x90+\x8btA\x19\x9bO\xf1\
+\xe4\x19\xadK9\x86#\x96l\xa0G\xb1b\x80\x14(\
+\x9f\x83+aIAz\xd3\x10\xbafgp\x9a\xad@\
+\x852\xe7\x85\xa9;\xf0\x87\xef\xce\xa29\x10,\x9e\xd9\
+\xf8\xab\xbf\xdb\x87'\xf6\x8eC%\x97\xd2H^\xfa1\
+\x1f\xde\x84\x85\xee\xdf\x7f\x07\xae\xcb\xe8xO\xeb\x17`\
+\xda\x06\xd6m\xed\x22m\xe7a\xab6\x18\xd1b\xbdX\
+\xc1s\xd3\x1a\xfa\xf940]\x87\x9a\x8c\x12uu\x10\
++-\xa2\xfb\xf0w\xb1\xb7\xf7*\xecZs:\xb8-\
+:S\xadJ\xb1,\x01o\xe56\x0cv\xb5![:\
+\x89V\xfbq\x5c\xb0\xca\x81\x9e\xeb\xf1\x09\xe5N\xf8\xc9\
+\xae\xcf\xbdb\x05\xb8Vi\x8e7(\xf11\x0d\xa7\xe6\
+A\xfb\x89\x01\x940\xd8\x86\x10\x14f\xc7A\xc1\xae9\
+~+!H|F\xd3EV\xca(\xbb\xe5%\x5c\xd7\
+\x96\xc2o\xd4\xe9\xc6H\xf8\x9c\x09q\x8f\x10\x15W\x16\
+\xf4\x92*Q\x5cM\x1c\xfc\x82\xc9\x05\x18\xd1*\xda)\
+\x007\xab\x11\xe2\x0c\x1e\x8e\x9f\xca\xe3\xaf\x9fZ\x83Z\
+\xf76\xe8\xd3\xcfAw\x1b\xa4K\x86\xe4\xe67`\xcf\
+\x9b\xaf\xc3\xb5\xf5?\xc2\xd4\xbc\x81\x8d;\x06\xe8\x1b\xbc\
+\x9b#\x0b}\x88N^0\x91\x9a\xb7\xd1\x91v\xc5\xec\
+H_%\x05$b\x986#h\xa9\xcd\xa3{l/\
+\x0e\x96\xaf#GU(.y\x82D\xf8\xa6I9\x8b\
+\x81\x7f\xb3G\x83}\xe8\x07\x94\x1b\xd6\xe0e\xbaQ\xea\
+\xba\xfe[\x95\x96\xa1\xffj\xc38\xb1a\xe7\xf5\xc5W\
+\xac\x80\x88CL\xc1\xd3\xc9\x1a|\xd4\xcb\x1e\xe1\xb3\xdf\
+D\x5c\x04v\x17N\xa8k&d\xcd,y\xa9,\xc1\
+\xc2:\x0d\x14YU\xd5\xe4\xb4\x1e\xce=\x1b\x16C\x8d\
+\x94[\xad\xb8\x22\xe3\xe6\xb4^\xf4\xe0\x88N89Y\
+Z\x5c<\xc5\x8d\x81\x15)\x84i\x1d\x0b;!\xf8\x0c\
+\x17\xa2\xa1\xff\xfd\xee\x0c\xaa+\xfa)\xc6\xe4`\x9d\x1c\
+\x82K\xacFq\xcbx\xdbG\xfe\x12\xd7\xdc\xff\x87\xd0\
+7\xce\xe0\xc2\xcd\xadX\xcc/\x08\xc8|\xe6\xb1\x02.\
+\xbe\xbc\x05l\x88\x140\xdb\xc0\xd0\x5c\x09\x13\x8b\x94\xc1\
+\xf2\xa9c\xf18\xfax\x15\x94 \xd0\x98\x19A\xcdt\
+\x88!1\xb4\xc5\xa5\xf72\xb3A\xc7\x8e Z\x1d\xa3\
+\xe4\xaf\x95\xee-\x07\x97\x82\xb8g;\xdf\xd8\xb4\xe3}\
+O\xffK\xf2<g\x05d\xfc\x85\xbe\xbc\x95\x15\xfd\x9c\
+E\xcaZs\xcdY\x8e^\xd0\x80\xeb5\xa7\x22IO\
+\x08J\xcd\x82\xef\xf3\x81\x1c#\x10\xd6\x99J\x0a?o\
+\x93\x85\x16k@\x89l\xa5Z\xf6\xc54Q\x83\xe2\x86\
+\xc7k0Zt)y[\xae\xe0\xb0*\xe7\x87\xe9\x9d\
+\x8a\x13\xa3\x8b\xb8-\xbf\x15~g\x9cO\xdf\xa4\xd0\xd0\
+E\xc2K`\xf3\xa5\x9d\xd8p\xe7g\xa1\xd7\x9fC{\
+\x96,\xf89\x07-\x1b\x80o\xdf6\x8f'\x1f\xaa\xa1\
+\xb5s\x0b\x86\x87\xdb\x10Y\xd5@r\x8e\xe2M<\x8a\
+\xb6\xae\x0e8u\x0b\xf9\xc7\x1fA}\xa1\x86:\xe1}\
+\x8c9\x04\xc3\x1aZ\x13\x9e\xc8~\xc5\xd5\x13c\xd2x\
+H0T\x01\x9d\xf5\x86\xed\xd7]\xed\xc8\x8b\xc9\xf3\x9c\
+\x14\xb0\xff\xb6\x9b\x22\xa7\xf6~\xeb\x0aW\xd9 \xea\xdc\
+yR\xc0J\x04\x83(\x14b|\xcf\x96\xeb\xed4x\
+\xe9\xb7\x06\xf7\xd4\x22*\xc7\xe6Q:U\xa2,\xd7#\
+\x9e\x9eD\xf2\xa2UH]\xb1+\x98\xaca\xd2\xf7(\
+;-Z0\xc9\xda\x8b%\xb2\xaa\x8a\x8f\x89\x05\x8f\x92\
+.\x07&Y\x99J\x98\x9fM\x18\xe0\x93\xb1\xc4\x84\x08\
+\x166D\x85A?T\x06\x02\xe1\xeb\xe2\xd9\xe7\x9e\x8c\
+\xa1N\xacH\xe0\x12\x1f\xbd\x22\x0b6\x16\x0eb\xf3\xf6\
+\x8b\xb1\xe9oo\x81\xddja\xe1\xb0C\x8c\xc8\xc6\xd8\
+s\x0d<\xfc\x84\x8e\xb7\xfc\xc6\x1a\xac\xde\x90\x12\xc7*\
+\xc4\x1d<9K\xd9-b\xc8\x9f\xa4\xeb\xe8\x5c\x85\xe8\
+U\x1b\xa1\xcd\xdd\x82\xaa\x9e\xa4\xc3\xf2\x86b.>\xba\
+W5\x22,\xca\xa3\xa4\x8d\x05\xf6\xc1g\xdf[\x96\xe7\
+\x18\xd9\xc1\x13/&\xd3\x97\xad\x00\xff\x81\x9b\xa2\xcf\x7f\
+\xf3\x0b\x7f95Y\x19\xc2\x00\xb1\x0f\xcf\xc2\x22\xe1\xa4\
+_\xe7\x02\x9f\x87sr\x0e\x8d\xfd\xd3\xa8\xec/\xa28\
+\xde\x80\x1b\x8d\xc2o5\x10\x1fnA\xe6\xbaUH\xaf\
+l\x81\x12\xe3c\xad\x14\xc0\x0f\x1fBrM\x1b\x94\x06\
+\x05\xae\xa9\x22j\xa4\xa0\xa9\x93\x05\x1c:Z\xc2\xd8X\
+\x1d#\xb3\x16\xf1pG\x84\xf4\x1c\x05?5\x9b\x12C\
+\x9c\x8a\x1a\xce!\x0d3\xdc3\x07v\x98\xe8\xbc\xd0\xc4\
+\xcc\x9d\xaf\x1e\xef\x08*\xb5\x01M\x8e\xf8\xd8z\xd5\x85\
+\x18\xfa\xe6\xcdh\xcb\xd5\xe1\x90g-N\x12\xcb\xad\x9b\
+h\xe9+\xe2\xdf\xecHc\x0d\x1f\xefu\xe7\xf0\xc4\x83\
+*\x1e\x7f2\x8a\xb5;\xaf\xc6\xc8B\x1c\x0f\x1d)`\
+g_'\xf6\x1d\x9f\x83\xb9\xf1\xf7\xd0e\x9f\x80\xab\xe8\
+\xc4\x9c\x03\xbf\xa5\x18!@Q0\x06\xd6\xec\x08w=\
+ul\xeb\x957\x96\x80\xdf>?\x05\xfc\xe3M\xd7u\
+\xf4\x97\x0f]\xd9\x17\xa9\xec|\xe2\x8b\x9f\xf8\x95q\x12\
+\xfetQe\xd1\x8e\x9a\x98.4q0\x8fg>t\
+?\x0a\x93\x96h\xd7K\xf7\xc7\xd0\xb6\xbd\x1d+\xaf\xe1\
+\x03\x17\x1a\xd4\xb6\x14)\xa1\x0d\x9e\xdeF\xcc&NL\
+\x22-\x0c2\x99\xada\xf1\x81\x87\xa17L\xccM\x94\
+11^\xc5\xc9\x912\x0e\x9e\xaac\xbe`\xf3\x19\x85\
+X\xa0\xacr(\x13A\xe7\xeand\xfb\x82\x1e|M\
+\x0f\xcb\xa8gL\xfd\x0f'\x92\xcaf\x00\x0d\x8f\x1f]\
+\xc4$[\xbdl\xd8\xc1\x87^\x98\xc2\xaa\xcd\x83x\xf3\
+\xf1C\xe8\x88\xebH\xd4\xea\xa8\xe4}\x8a5>\x19\x8c\
+\x85\x98YB\xe3\xd11<\xf1\x10%mOu\xa2\xf5\
+\xd7\xff\x00\x9f9\x11G\xf1\xd8\x01\xec\xba\xe17\xf0\xcc\
+x\x09\xd5~\x0bN\x97\x839\xbbNYm\x11\xa9\x98\
+\x1b\x90.9/\x98\xcf\xbc\x84\x18\x17\x97\xed\xf9\xa4\xe3\
+Q\xc6\x98\xf7b2>C\x01w|\xfc\xc3\xa9\xdb\xee\
+\xb9k\xb8^.\xeeI\xb8\xb5\xb7~\xef\xd6\xbb\xb6u\
+j^l(\xe6\x0bfR'\x05\x97\xe9\xc0\xd1Z\x01\
+})\x0b\xbdq\x15\xd9\xceV\xac{O\x1a\xc6@\x0a\
+J\xdc\x80wt\x01\xee\xa1)(6\x019a,\xba\
+\xc9\xd2\xbb\xfaa\xcd\xd9\xf8\xd2\xb7\xe6q\xe3_]\x06\
+\xc5\xaaba\xb4\x84\xc3\xfbF1:n\xe2\xf44)\
+\x82\x02z\xc9\x92\x0d\xae\x03\xb9$\xec\x5c\x0a\xfb\xc8v\
+\xa6\xa7\x14\xbc{\x05\x13\x93+\xf8H\x93\xb0\xb0`\x1a\
+Ph\xf7\x12\x96de\x967v\xfd\xe0t\x94w\xa1\
+A\xd6\x0b\xa4\x16\xfaW\xa6\xb0n\xe4G\x88_\x9eD\
+\xf7\xca\x18\xb4\xf9:\xb2354f\x1a\xa8\xce\x12\x9e\
+W<\x9c:e\xe1sw\x8c\xe1\xd8\x8e\xcb0\xf7?\
+\xefD\xb6]A\xf6\x9d\xef\xc5\xfc8\x9fc\xac\x88\x09\
+\x16b-\xadh\x06E\x0a\xc01\xf5\x948\xbac\xbb\
+\x81w*\xcd\xfe$nD\x14\xbf\x8e\xbf\x14\xb2\x9c\xa1\
+\x80\xef\xfc\xf0\x9b\x9fn\xd4\x0b\xef\xd1}[\xd1\x09\xe3\
+\x12\x09\x1dq\xbe\xb4\x97N\xd9gNEW\xaf\x81\xc1\
+-\x19\xb4\xac\xb5\x89\xaee\xc1\xbaW\x00\xd1\x88\xec)\
+7\xc9:\x1e\x1f\xc7\xcc\xc3c\xf0'\x8aH\xc6\x14\xc4\
+VDH\x11\x05\x94\xc6|\x9c\x9c\xb6p\xe4\x89Y<\
+s{\x16\xeb\xfa\x15\x1c}v\x0aw>\x98\x87J\xf8\
+\xbc\xb2?\x8b\x0d\x1b[y}\x17\x04\x9a\x88\xb6\xf6\xc2\
+ Z:~r\x0a\xb7~\xefaD.\xef\x10\xdc\x8a\
+/\xaa!kw\xe1\xba\x12\xca2\x04brD\x8e^\
+{b>J\x91\xc0\x15#\x92\x1e\x93\x1d\xcb\xabW\xb5\
+bK~?*Ib9\xc3\x84\xf3\xeb\x1c|\xe7\xcb\
+S0\xd26\xf6\x5cI\xf4r\xba\x86\x8f~\xd6\xc53\
+\x03\x9b\x906\xebHWF\xe0\xf5\xac\xc6\x1abP\xbc\
+J\x1b\xceS\xe3\x0c,a\xb88\xea%0^\x89a\
+u\xba.\xa6Nqr\xa1k\x8e\x98\xd5\xe3\x87\xf9\x90\
+\xa2\x1f>'\x05\xdc\xfc\xc5+\xbf\x83\xd3\xfb\xdf\xeb\xcf\
+\xcc\xc1\x9e\xab\xa18AnZp\x05\xfeFs\xc4\x06\
+\x86Z\x10\xdd\xd8\x02\xf0zK:F2H\x89C\xf8\
+~\x1d\xac`\xa1\xb1\xe0\xe3\x99\xc3\x0d\xe4\xc8[\xd4\x9a\
+\x8b\x96\xd1\x1abQ\x0a\xc6\x91\xa2\xb0\x98I\x0a\xda\xff\
+\xfc\xa5\x03\xb0.mC\xe7\xda\x0d\xf8\xc8\xb5\xbf\x85\xde\
+\xf5\x17Co\xbd@\xbc_\xa6\xccz\x81\xdcl\xceR\
+`kI\xf4\xa42\xb07|\x06\x09\xe5\x01!L\xa9\
+\x00_\x16\xd8\xfc\xe5\xe3\xccr\x99\x00N?\x1d\x12\xc0\
+Q\xd6\x8ah\x1bA\x02\x05~\x87\x8e\xe5\x95\x8bhM\
+\xad\xc6\xba\xe8\x0c\x92}]\x98\x1ce\xe8[\x95\xc6(\
+y^\x22E\xc6\xb3\xbe\x17\x95\x0e\x86}\xb5#P\xb7\
+\xbe\x13'\x1e\xddK\xc9S'\xae\xb8\xe2:>\x91\xbe\
+9\x05+\x98\x8d-\x1a\xc1M\x9b\xa1A\xd7H\xfc\x13\
+>\x87\x1e\xc6\xe7g\xd7\xa4)\x04]\xdf\xb6\xa7\x1c=\
+'\x05\xa8\xe9\x8e\xb2\x97\xa5\x08_/\x13L\xb80x\
+\xbf\xbc\xcdg\xaf\xa8Pc\x94\xe8\x18\xbc^\x13\x81\x1f\
+\xe5U\xc7\x88\xfc\xbaSGm\xdf\x18*\xa7)\xf02\
+\x0d\xf7\x1d\xae\xa3\x8d<f\x05]\xec\xce5\x1a\xba\xd7\
+\xe9\xd0\xd6\x18X\xb1.\x8b\x15\xdfw\xd1\xf1\xae\xbfF\
+z\xd5\x85d\xc3Y\xcc\x17\xab8L\x02\x9f8m\xa3\
+A\xc7Kg:\x10\xcfi\xd0k\x15\xe4\xa7\xa7\xf0\xe3\
+\xbbn\xc7\xed\x9f\xb9\x19\xb1\xcbs\xd8\xb4y@6\x7f\
+!\xa8#\x85\x13\xf1\xc4\xdf\xe1\x5c\x5cP\x0c\xa9\xa1\x94\
+\x5c'\xc0BIZ\xd0,\xda\xc9\x93W\xd5\xa6\x11\xed\
+\xd2\xd0\xd1c\x90GG\xf0\xe4c\x8bx\xe8\xc1)\xdc\
+\xf8\xffl\xa2ou\x89\xe7^_\x0f\xec\x99Q\xb4\x0c\
+\xf5 \xb7f\x00\xd1D71\x1bOL\xbf\x22)\x8b\
+G~\xee8\xc5;\xbb\xbc\x88(\xb3\x83j\xaf%\x06\
+\x83\xa4\xd5+b\x9c\xc0\xe3_T\x92\x87\xceI\x010\
+\xe2G\xfdX\xc2GDc\xcdvC\x855\x97l\xe1\
+\xc9P\x88\xbf\xb2%\x90\xe8\xd6\x5c\x01\x8f\xdc1\x82\xe3\
+S\x04Kv\x03\xa7(x&SQ\x1c\xe7\x85\xb1\x1d\
+9\x14\xd4:2)\x82\xa2\x9e\x15H\x0e\x8e\x10\x14\x11\
+\xae\xd3\xfd\x14\x5c\x0ab\x99\x9cX>,\xa6\x99\x84\xc3\
+\xf38~\xe4\x18\x8eS\x00\x1d\x9bWPt\x1d\x1c\xbd\
+\xed+\x98<v\x1a\xa9\xab\x12b.\x97\xaa\x04#n\
+Ac\xfe\x0b-\xc1\xb3H\xe7w\xa3-\xf0\xc4\x8c|\
+\x12\x18\x9f\xe2\x946\xd0a\x1d\x14\xfd\x17\x8a\xea\x088\
+\xdbvQ\x06\x1f\xfb\x9b\x1d\xe8\xe9\xe5\xab\xeb\x90\x11\xcc\
+\xd4\x89\xcdEPr[\xe0\xa7<\x5c\xb8z\xbd\x84\x13\
+O\x8e\xff\xfa\x81\xf5\xf3=\x95#\x03\x9c\xbb\x1dm\xca\
+:1`\xc1\x01\x87\xe7)\xb2\x07Fz\xa5\xeb\xab\xb5\
+\x81\x15C3\xe7\xa6\x00t\x8f\xb3H\xbc\x02MK\x89\
+\xa6+U&H<\x1d\xe7\x17#j!\x8e\xbb4\x1f\
+\x8b\xbb\x9a\xa3\x80\xfc\x05\x07\x8f,\xa0#\xd6\x87\x8f}\
+\xe2/\xb0\xe6\x92\xab16g\xe1\x89/}\x10\xdbX\
+\x1e\xf9\x83\x06V_\xb5\x1e]\xd7\xbe\x0e'\x1f\x9bB\
+\xac\xe5Jb\xae\x0b\x84\xf1'1>Q\xc1\xa9\xd3\xc4\
+\xc9\xdd4\x09\xce\xc0\x96u\xab\xf1\x8e\x9d\x0d$Jc\
+\x98\x1e\xfc#\xdcw\xfb\xadX\xb5\xa6B\x0a`rY\
+\xb3f\xe6\xed7'\xc6-\xcf\xc5\x1a\xbeFy\x11_\
+\xac#&?C\x02L\xc5\x22\xc8\x98\x8b\x98\x1e1\x05\
+<\xf4\xf4Q\x10\x8ey\x18^\xcbo\xdf\x14G<x\
+\xaaF\xde\xba\x09\x13\x13:j\xbd-H\x91\x01\xd9u\
+WN \xf7\xbc`\x86\xbe\x98\xef\x0ek\xf2\x10\xb6\xc6\
+=d\x22\x16\xe5\x00\x86l@\xb6m\xd9\xa9\x1f,2\
+\x05\xa6O\xb5\xaf\x7fG\xf9\x1c\x15@\x92\xd0\xe3sD\
+\xf7R>\xaf\xcf\xa8r\x19\x19\xd7\xf3E\xb5\xcf\xb1<\
+Y\x18k\xce\xf1 \xab\xec\xc8a\xdd\xa66LO\xba\
+\x98\xec\xba\x02\xdf\xf9\xca\xc3\xd8\xb9\xf2\x1aL\xd4u<\
+u\xcc\xc6\x1b.\xd5\xd1\xf5\x9bWQ\x0e\xc0\xab\x94Q\
+\xa4R\x05\xfc\xf5\x17\xf6b\xba\x9aBY\xa5\xf4\xbe\xa7\
+\x1b\xbb\xaf\x88`\x98\x82\x19ob+\xd2\x8dD\x92m\
+H\xf5\x0e =P\xc2\xe8\xc4\x09t\xb6>\xc4W\xd2\
+\x90]\xc9\xc1\x8c\x14\xb6\x94\x7f5\xe1\x87g\xe1<\x13\
+H\x93\xb2\x1aBT\xbc+Y\x81\xa1F\xa1\x91G\xa5\
+\x98\x8ev\x8f\xaey\x91n \xc2\x13sOL\xa7\xe2\
+\xdd\x05\xe9\xee~LV2\x98\x9c5\xb0\xee\xe2>B\
+V\x099|\xc2\xa1\x1f,a\xc6\xdd\x7f\xc5\x8a,\xee\
+\xfb\xd4_\xe1?\xfe\xc5\xdb\x89\xfd\x90\xad\xc6\xe5r\xa1\
+|}\x0cN\x02<\x91\x84\x91\xc1B}\xc9\x00\xfc\x13\
+\x0a\xe0\x9d\x0fn\xf1C\xfb\xc8\xdc\x06\xc5\xda\x97\xb2\xb9\
+E\xe0\x9e#\x16\xc7\xf0D\xff\xa5\xe2,\xad\xeb\xc8\x8b\
+h]\x9d1\xac\xbc`=\x22\x9bvc\xdf\xad?\x00\
+k\xef@O\xa3\x86\xbb\xd1\x82\xc4\x0a\x95\xe8i\x14\xe1\
+\x04\x8b\x5c\x8e\xa1{\xf3F\xec\xe9\xb5\xd0e\x10\xfd\xa3\
+c\xf2N\x12=\xd7G\xc1\xcd\xa3lu\x01S\x87\x9f\
+\xc2\xc4\xe8#\xc8\xce?\x81'\xbe\xf6$\xae\xbb!\x0d\
+\x7fpC\xb0\xe4\xc0R?\xd1\x99\x99\x80+\x14\x90\xd2\
+}\xb4\xd3q\xea\x14\x8f\x5c2\x1en/*\x09\xa4a\
+2\xd11\xef\x11\xb5\xadU(\xd0S\xa6\xfe\xf4\xa1\x0a\
+\xae\xde\xdd\x09U\xb3\xd0\x9e\xcc\xe2$\xa1\xd0\xea\x81\x08\
+\x22j\x96 \xc5\x22A:rZ\xad\x17\xf4\xa6\x92\x01\
+\x94f\x8f\x0a\x0f\xcb`\x05L\x96\xc0\xec\xc8\x13\xc8\xb5\
+\xc8\x95\xb5\x84\xb1:\x90\xbb\xab=w\xce\x0a\x10\x9b\x1e\
+\x1f\xf7\xf9\xc4:M\xaew\xc3\xdb\xad\xf9\xf8*\xa7`\
+6_*\xc0\x94\xad\x81rZ\x8e'.t\xf28%\
+dO\x1eG\xe7\x00e\xb6\x17^\x85{\xfe\xf9i<\
+\xf2\xf5\xcf\xe3\xf9\x07\x1fG\xed=\x9b\xe9b\x97\xb6l\
+\xc2\xc5\xe6\xee\x12\x92\xe9\x0e\xb1$@\x8er\x82\xc9\xf1\
+)\x1cx\xee\xc7h\xad>\x8b\x15\xf5\x03\xd82\x7f\x80\
+\x8c\xb2A1W\xc1'\xde\x1b\x153(\xfd\x00o\xc2\
+e\x0c\x02\x8bYf<\xa2\xeb\x16\xedD\xccb\xf33\
+p\xb5\x94\x18\xa1R\x09*]\xa5\x81\x82\x9f\xc1\xe8H\
+\x0d\xaa\x13\x13\x90\xfa\xf4\xa1*f\xc9\x13\x8e\x1e(S\
+\xee\xc40H9\xcc\x5c$\x8f\x09\xb3\x15\xde\xe2\x22|\
+J$=1\xe5UN\xa7\xe5[\xbc\xa7\x0b\xf7|\xf5\
+o\xf0\x9e7]\x8aO\xdf\xfa8~m\xd7\x0att\
+\xc4\x90\xc9T\xe4\x04\x0c>-\xd7V`\x9a|\x00T\
+\x7f\xf4\xbc\x14\xa0D\xe2\x87}]\x17\xf3\xbe\x14=\xe8\
+\x83Q\xe4Dg\x97,\x9f\x97z4+\x08H\xbc,\
+@)\xb9\x91K\x90qN\xe1\xb1\x8f\xfd1\x9e_\xff\
+~$.\xde\x82\xaeu\xeb\xf1\xfc\x03\x16\xe6\x89\xce\xf6\
+\xc8\x15,\x84\xcd\xea\x1aC\x8bJ)\xe2\xd1\x838U\
+<\x8d\xe1\xb6y\x5c\xd4;\x83\xfe\xc1\x19\xe8G\xa70\
+wx\x063N\x95\x0e+;\xab\xc3\x95\xa7\x82e\x07\
+\x97z\xd5_h\x15Q\x0a\xa6\x89D\x04\xed\xf9c\x98\
+)\xb6\x89\xf5\x22\x84\x9fPF\xbd\xd8\xb9J0\x9a\x83\
+\xc7*\xc8&5\xbe\xb8\x12,\xf2\xbe\xe9\x05\x17\xad\xd9\
+\x18:\x9366w\xd50^\x98\xc1d\xbd\x0f\x1e\xc5\
+\x00\xae\x00\x1e\x03\xf8\xf4$%\x9b\xc1CE\x0f\x7f\xf1\
+'\xef\xc5\x05\xca<\xc5\xb1~\xb4\xef\xd8\x89\xb6\x85[\
+a\x12\x85\xe6\xb5.^\x89\xb0H\x09\xa6\xa5\xd4Z\x92\
+}\x8f\x9d\x97\x02\x1c\xbfu\x5c\x8d\xc4D\xd7\xb3\xa8\xcf\
+\x0b&\xe4Hl\xe3\xaee\xba\xa2\xc3X\xce\x08\x14u\
+Z\xac|\xe3\x1a\xec!\xf7\xbdg%a\xe7}\xf7\xe1\
+\xea\x1b.C\xe3\x0d\xef\x809\xfa\x18\xca\xf5q1\x01\
+[0*\xc8\x9e\x9at\xf1.\xec\xe9_\xc0\xc0\xe5\xed\
+t|O^F\x85[j0\xa9\xaf\xd9\xdd G\xd1\
+\xe4x\x82\x17\xac\xc5\x16(\xa0\xd9\x9b\xb8T\x19\x95_\
+r\xb0#v\x0a\xcf\x1d\xaaA\xcb\xb6\x89\xa0X\xa7x\
+\xb40\xb8\x9a\x92\xbcV\xe8~\x09:\x05\xfb\xden\x05\
+\xbd=\xe1\x984_ST\xa78d\xa3sG\x1eO\
+\xd4\xe6q\xcc\xa6\xd7f'\xe0\x98U\xa4\xfa\xdb\xe1\xe8\
+6>\xbe\xa5\x86=-\xa3\xb0\x5c\x05\xf1d\x03\xc9\xc6\
+\xd7\xe8\xd1C9o\x06\xa3w\xa4\x08G\xf1]-v\
+{\xdf\xcew.\x9c\x97\x024\xad}\xdc\x8b\x10\x15\xd5\
+4& \x88{\x82\xca\x9akg:\xa25\x5c\xd2Q\
+\x16\xb4\x06h-\xdd\x18\xde\x93\xc4\xf8\xc0N\x8c\x96\xd2\
+H\xac\xd9\x88\xf6x\x0c\xeb\xb6\x5cH\xd8n\xc1\xab\x99\
+\x94cH\xc1Y\xd5*.\xdaB\xc7i\x18\xa2\xe3!\
+X^D\xcc\x94\x09\x99\xd7\xf2\x091M\xe1zK\xf5\
+\x1f\xbf9\xf5pY\x83h\xa0\x08\xc6\x5c\xec\xd9\x19\xc7\
+m\xd3+\x10\xb3\x8b\xa2\xceo\x11\x84\xceV\x14\x9c\x88\
+n\xc7`\xe3\xc7d8Q\xb2T\x0fQR\x84GF\
+\xf1\xfc\xb1\x12\xd6\x0cgH\x18|\xa1\x8e8\xde\xb5\xb2\
+\x88\x83\xb3&&z\x86\xf1\xc4\xc1\x09l\xea\x8f\xe1\xed\
+\x9b\xc7\xc8K\xaat\x8d\xe4\xed\x95\x05\xac\x8c\xcd\xa1b\
+\xc7\xb18\xdd O\xe21R\xa1t$:\xadD\x12\
+\x9f\xea\xefY\xf5\xc9\x97#\xfc\x17T\x000p\x9c\xf2\
+\xf3\x1a\x05\xe2\x84bP\x12\x15\x8dP,p\x84\x86\xc5\
+J\x94\x1c\x0e\xad`\xf2CP\xff\xe77\x9fl\xcf`\
+]q\x1a\xfb\xc9-\x9f\xbf\xff\xdb\xe88\xf54\x06F\
+\x9f\xc2\xca\xdd\x97\xa1pz\x06-\x9b\xba\x85\xd2\x8as\
+y0\xc2\xfeTk\x8b\xa8\xd5\xc8\xa9J\xc1h\x99\x22\
+\xd7lS\xc4\xd4\xa6`\xb5\xe6p\xb5\x11?\x98\x83\x1b\
+.\xcc \xd7\x86\x5c6sf\xe9q\xd3*\x0d\x97\xc7\
+\x1f\xc7\x91\xca\x90\x5cB\x80>S\x1a\x9b\xc0\xbe\x96\xb7\
+\xa1\xafq\x908\x7f\x19}\xfd\x19QB\xa9P\xf2:\
+[U1J\xf4\xf8\x9do\xefA\xa6\xad\x15\xf7\xdc\x7f\
+\x98H\xc5F\x1c)\xceb\xeb\xb6V\xfc\xce\xceI\xf2\
+\x5c\x0bvaV\xac\xb6R\xb7\x13X\x9c\xd1(\x98\xd7\
+\xf9\xccJ\xcfSc\xcf\x18\xb1\xcc\xa7\xb3\x83[\xbf:\
+0\xf0\xfa\xfa\xcb\x15\xfe\x0b*\x80\xb1K\xcbn\xed\xcf\
+FaD\xd63#B|\x99\x14@lE\x11\x98\xaf\
+\x89:7\x9f\x10!\x16\xb3\xf3\x9b\xb3?\xc0Y\xc8\x9a\
+\xd5y\xfc\xf9`\x19\x1e\xa5\xff\xe5cq\xa2\x9eW\x11\
+\x1bPqlo\x1d\xbd\x98$\xbd\xa6\xd0\xb3e\xad(\
+\x18\x86\x93E\xfcp\x083\x9c\xce\xaa\x84\xf5\x9d\xb3\x9b\
+x\xfd\xa5y\xc6\xcb\xd6#:;\x18\x84>\xf2o\xdf\
+\x1a\xc1\x7f\xfa<1\x96\xdc*\xb2Z\x03\xb6\xb5\x80E\
+k%\xbe\xa7]\x8b\xb7d\xeeF\x81\x98P4\xae\x12\
+-\x8e\xe2\xea\xcb;\xa0\x1bqt\xf4u#\xd9\xd6\x8e\
+u\x97\xf5\xe0\x1b\xa7c\xd8\xb5*\x82w\x0c\x1f\x86\xb7\
+0%\xfaAk\x8d\x04e\xe8@\xbdJV\xef2[\
+\x89$\xef\x8bf[?\xb9a\xd7o\xdf\xcb\x18sq\
+\x1e\xdb\x0b\x97\xa3\xd5\xe4\x01\xa2\x1e\xeb\xf9@\x86\x163\
+D\xd2\xa2\xf2\xa5\xb9(\xa8\xb9\xbc\xab\x81\xb0N\xb1\xe4\
+|+\xe8\xbc>(\x95\xce\xbb\x8a\xf9|(\xa7J\xcc\
+!!\x97\x03`\xd1\x18\xb6\xff\xfa\x1b\xa0E\x96\xfaB\
+\x97J\xc9\xcb\x06\xf4Y\x80\xff\xe1r\xc5\xcb.\xa7\xe9\
+h,PT\xd0\xf1p\xc6\xea\xdagiaE\x9f\x8e\
+\x7f\xfb\xf6:\xbe\xf0\xdd\x83Hv\xaeA\x8chf\xd1\
+\x9c\xc0dd\x0dn\xaf\xbf\x0b\xdb\x1b\x0fb\x80R\xc8\
+,e\xfc\x11\x8f\x8f5D\xf0\xd4H\x03O?o\xa1\
+\xa2\xb7\xe3=\xab\x0e`[\xcf\x14\xbcJ\x0c\x85b\x1a\
+\xc5\xd92\xb1\x9b*\x85?\xbd\xa4\xe8\xc9\xaf\xc5\xdb{\
+oY\xbf\xfd\xd7\x9e\x91\xd3\x8e~\xe7|d\xff/+\
+\xc0W\x95{X4\xfen\x18\x84Dq>;\x9eO\
+\xc5\x22\x05\x13;\xf2(\x99q\xc9\xc2\x95\xba\x1c\x09\x83\
+Z\x83Y\xf6P[\xb4\xe0\xb0\x08%7Q\xc4Z\xb3\
+hY\xd5\x19\xf4\x00\x85+\x87,o\xcb=\xbb\x86\x10\
+\xf4 jr\x86\xa1\x1c]\xf7E\x22\xa5\x04\x0a\xe34\
+8\xccz\xf9;2\x19;\x1b\x82\x96\x9e\xf3\xcf]r\
+a\x92h/p\xc7\xbd\xfb\xd0\x92\x1d\xc2\x95\x9b7\xa3\
+\xec\x18\xb8\xffp\x07~\x5c\xbd\x9er\x82Y$\xeb%\
+\x1e\xee(q\x8b\xa3\xb7?\x87]\xbd\x07q\xf9\xd0\x11\
+1\xbe\xbb0\x93@i\xb1\xce\x07x|W\x89Ni\
+\x91\xe4\xcd\xe9\x5c\xd7\xcd\xc3\xdb\xae\x9f\x93\xe7\xfa\xf5\xf3\
+\x16\xfc\x8b*@Us{]#\xe9\xb3X\x95b\x0e\
+\xd1\xb0\x04\x09\x82\xc0\xdf%!\xf1Il\xc5\x12\xf3\xf4\
+q6=2\x1fq\xf7\x1f\xa9'\xba\x8cY\xf7\x8d\xbf\
+\xbb\xa2\x9dEs\xe0mT\xf2\xb0~\x003,\x98\xed\
+x6l,\xf7\x02U\xac\x86\xe2kA \xfe\x89a\
+~\xc8\xa9>\xe1\xc4\xc0\xf0\xd5p\xe1\xd7\xb3\xbc\xa0\xf9\
+\x09R\xd0\xfa\xe18\x86\x88\x9d\x1d:0\x8b\xf9\xd1\xef\
+\xa2\xaf\xa5\x13\x7fzi\x1fJ\xae\x81\x89b\x84\xf0\xbc\
+E\xac\x01\xb7\x22s\x8a\xde\xa3\x84\xad\x12E~\xd4\x13\
+\xcb\x1d[6\x9f\xdb\x1b{ZO\xb7\xdc\xd2:\xb0\xe9\
+\xcb\xe7\x8a\xef\xe7\xad\x00\xa0\xed\x04\xb4\xfe\xbb<\xdd\xed\
+\xb6\x08\x1b\xad\x94\xeb6<\xeb\x88\xe5\x1b\x93u?v\
+\xb0XnyF\xef{\xfd\xb1\xe7\x9f?\xb5w2\x7f\
+\xaa\x9f\x19s%f\x13\x14E\x03V\xc2\x96\xea5M\
+\xe1\x04\xb3V\xce\x14\xd6\xb2\xe6]\xbe\x98\x1d\x05g%\
+\xa2\x07f.\x83{\xd0\xbb\x1bx\x00k\x0a\x96\x05\xcd\
+]\xe1\x1c\xac\xe6\xf1\x96+$\xd09\xe5\x95\xd8r!\
+%fH\x89\x86Z\x1f\x8b\xe8 \xe6\xb2*>B\xef\
+\xd7\xe8(iT\xf3*&\x0fW(cn\xc0vU\
+\x93i\x99{#\xad\xad7o\xb8\xe8\xb7\xbew\xbe\xf8\
+~\xde\x0a`\xecz\xae\xe9k_\xfc\xab\x9f\xc0\xed_\
+\xf9_Gb\xf1\xf8\xd6r\xd5px\x89\x82\x85K\xe5\
+\x06\xf3\xbed_\xd02x8C\x09\xcb7\x8e\xfd\x84\
+s\xe98\xc1\x9d,n\x89uJ\x9b\xcbP\x85\xdd\x15\
+r-\xa0pmN\xb7\xbe\x80\xf2\x98\x89\xe7\xc6t\xf4\
+\xaeJ`h0v\xc6\xdat\xf2\x94\xa1\x82\x22b\xe6\
+\x8c]-\xc3\xad\x1c\x10\x19\xbe\xed\xe4P\x9e\xf5Q)\
+\x94\xd1\xb0\xe8\x9b\xbe\xb1\x00#s[\xb2\xa5\xfboW\
+o\xbb\xfe\x84\x0cE7\xfe\xb4d\xff/+\xe0\xe5n\
+Q#N\x0a\x88\xa1^I\xaan\xcd\xf1\xf5V7\xc8\
+w\xfd\xe0\xc6%\x96KK<\xdb\xfa\x9b\xea\x96\x15D\
+\x9f< \x99\x83\xde\xbe `H4b\x85T\x1fg\
+t\xa2HET\xcax\xe0\xf6\xfdX j\xb9s\xfb\
+V|\xe1\xfe#\xf8\xc8@\x01\xa2u\xa8y\x0eUL\
+U\xf2\x5c\x0dv\x91\x12Bs\x86\xf2\x9a$\xea\x8d\x16\
+\x94\xa6\x8bhT\xe7\xf9\xc0\x0a\xb1\xe0\xf8)=\x9e\xfd\
+B$1H\xf8\xfe\xd6\xb9\x9f\xaa\xc4_M\x05$\xd3\
+\xe9\x0ay\x00\xf2nDujU\x97\xc2\xb3vF\x8f\
+\x0e\xf3\x03\xafX\xb6\x22B3p\x02\xcb\xb1^\xcc\xb4\
+Q\xb3\xd0\xfa:\xc5j$f\xa3\x16\xc0\x8b,r\x85\
+\xce\xa5\x04\xedo|\x22\xdf3\xd5\x01\x1c\xbb\xfbs(\
+O\xbd\x0d\x9b6]\x04\xcb\x5c@L\x93\xebP\xf0\xca\
+\xab\xdd\xb0\xe1\x16yQ\xb2A\xec\xa9\x15\xe5B\x0e%\
+>\x01\xd0\xa2\xc0\xea\xa8.\xd1\xc8'#\x99\xdc\xa76\
+\xac|\xdd\xed\xacwG\xed_S\xf0\xaf\x8a\x02(S\
+>\x12\xe3S\x824#bU*\xf5\xa8\xeb\xa6\xf8\xf2\
+\xe2g\xceJ\x09\xb3\xdde\x93\xf5\x9a\x01y\xf9\xeb\xb2\
+\xa7\x87\xe5z`t\xb7\xa1\x5c,\xcb\x05]\x11\x96\x7f\
+\xe4\x1a\x10<{\x16\xe4*\x9b\xc1\xe0\xb6aXF\x17\
+\x06.\xbf\x0e)e\x1eF\x8c\xcfR\xa7,\xb74\x03\
+\xaf\xba_,wf\xbbm(N\x02\x95\xfc\x22\x09\x9e\
+\xf9\x8e\xaf\x99j,\xfd\xfdx\xaa\xf5\x7f\xac\xfb\xde\xe4\
+c\xec\xa3\x1f\xf2\xce\xe9\xa6\x7f\x96\x14\x90\x8cg\xc7\x22\
+\xd1\x181\xcfh\xa4X\xf0\xcc\x14\x1f\x14R\x83\xe5\x05\
+\xc2\x9f\x22\x0a\x19\x0f\x0b\x97 P\x96^kBE\xb0\
+\xe6\x98H\x7f\xa3Hl\xd9\x82\xa9\x03c`\xc4\xd15\
+\xbe\xf4\xb0\x16A\xf8k\x1a\x11\xe2\x95|\xf4\xc9HG\
+1\x90\x98\xc7L{'j\xf3\xfbq\xd1\xa6\x06\xcc\x85\
+\x11\xcaT\xe7\xe8\x109\x0a\xa6\x1d\xc8\x9f\xcc\xa3Q\x9e\
+\x120\xe3\xb2\xe8\x82\x1aM|\xa1\xa5s\xf0\x1f\x86\xb6\
+\xde\xf0\x92c\xb5?\x17\x0a\xc8\xc4cSF4\xea\xea\
+FT+\x96`\x0f\xf0Yh\x117\x98\x1e\xa4\x04\xed\
+\x8a\xca\xb2l\x198\xf3G\x1b\x96\x1f\xcdo\xb6+\xb6\
+\xac\x19Fj\xfb\xc5\x98|r?\xd2\x11\x0a\xcc\xf1,\
+\x98\x9e\x12?1\x92\x1cZK\x02\xaf\xa20[\xc2\xe6\
+uYl\x5c9O\x08\xf3\x14\x98X\x02\xb1\x1b\xa5b\
+;\x0a\x87\x0b\x04a\x15a\xf1\x14\xd5O\xab\x89\xd4\xdf\
+\xf6\xf6_\xf0\xd5\xdeu\xd7\xcc\xbf\xd6\x02?{c\xaf\
+\xe4\xcbD\x1b\xd4\x07\xef\xfd\xda\xe4\xd1\xfd\xcfw\xaco\
+9T\xd8\xf5\x8e\x5c\xd6\xe7\x99\x0f\xe3\x8b.\xc9\xe9B\
+K\x13\xf7\xce\x9e=\xa3,\xebl\xc0\xb2 \xad4\xf5\
+\xd3\xa840}d\x1cuJ\xf2\xb2\xe9V\xb0\x0cC\
+\xb6\x9d\x98\xcb\xc1#\x88\xb22\xf4\xce\x0c\xb4\xd6N\xb2\
+v\xcaT'J(\xf3\xbeM\x0b\xbc\x22\xe9\xb0h\xf2\
+\xe9h<\xf7Wm\xc3o\xb8\xbb\xf75\xc2\xf7\x97\xb3\
+\xbd\xd2\x1fp\xf0\x8cXtQ7\xf4\x8eB\x8d\xa2#\
+\xaf\x11\xf1\xb1S5XZ\x802\xe5\xa6|\x05\xde\x87\
+K\x18\x84\xf0\xa3,\xa3\xa6\xe1krd\x8b?\x8f\xc6\
+=\xac\xd8\xdcMi\xb8G\x94\xd3Ae\xd6Du\xbe\
+\x80\xe8\xaa5|\xfd5\x94KuT\x9e\xaf\x88\x9f+\
+\xe1\xcb\x019\x88\xd4\x15#\xf9\xddD\xae\xe3\x13\x1bw\
+O?\xca\xd8\x9f\xbc\xa6\xf8\xfeSW\x00\xaf\x83\xec}\
+\xf8\xaeQ\xa2\xa3\xeb*y\xdd\xe1?\x80 \xeaCj\
+\x00A\x08\xe9\xe3RF\xdc\xec\xe9dK\x9dk\xe1x\
+n\xb3\xc4\xec\x04\xeb\xfep\x85\x9a\xbe\xf8a\x05\xde#\
+\xae\xf3~\xcb\x9a\x8b\xe2\xdc\x1c\x1au\x17u\x93\x81\x88\
+\x8e\xef\x11\xbek\xd1\xc4\xe7;z\x07\xff\xf7\xe0\x96\xf7\
+\x1d9\xcf\xdb\xf9\xf9S\x00\xdf\x0c\xcd8\xcd\xe7\xcf\x16\
+lM\xf3M\xcfWxO\x1e/U\xabA\xf7Z3\
+\xd6\x86\xc5\x88ek~J\x15\xc9\xe4\x89\xf3\xfe`\x0d\
+ \xde\xc0+\xac\xde\xf4\xc0{\x9eL\x12~\xbd\xe1\x05\
+\x8fr\xf1+\xd3\xe1\xab)\xc5O\xaa\xe9\xe4\xdf\xe5R\
+\x03_\x1c\xbe\xf8}\xa5\xf3\xbd\x87\x9fk\x05\xa8\x11}\
+\x8a\xffnK\xdd1|\xbbQ\xf5\x0d\xde\x8e\xa3\x05\x82\
+\x97+Z\x07YqH)\x83\x15\xafx\x91\xde\x95\x0b\
++1[\xaep\xc5\x85\xee\xf1\x1e'z\xb4\x1b\xbe\x10\
+\xb8ir\xa1\xfb\x02\xdb\xb9\xe0mWs`\xc4\x1f\x8a\
+\xb5\xb7}\xdaM^v\xc7\x8e\x1d;\xecWz\x0f?\
+\xd7\x0a`\x0a;jD\x0dPV\xa3:\x8d\x9a\x1d\xe1\
+\x93f\xc2U\xa2\xc4\xee\x05\xc9+\x13\x1d\xd5\xa2\xaa\x22\
+~\x16J\x0a\x9e\xef\xbe\x98V\xe0\xc3&\x01[\x0dO\
+,\x0a\xd8\x10\x96\xce\x05\xcf\xc4\x9aM\x0e\xf4\xbaj$\
+nOuw\xde\xbc\xf1\x92?x\xe4\x95\xfc\xb6\xe4\xcf\
+\xd2\xf6\xca!H\x8f\x9d\x22*\xeakZ,^\xad\xe6\
+k\x09\xdb7\x10z@s\xb6b\xf0\xe3\x98|\x90\xbb\
+)x\xbeZ\x0c\x09\x9d\xb7\xa5\x98\xdc\xd2\xa5\xf0\xb9\x95\
+7H\x19\xa6\xa5\xc0\xb2\x15\xdfS\xa3sZ<\xf5\xf9\
+\xd6\xde\xee[\xd6m\xfd@0\xcd\xff\x0f_k\xb9\xbd\
+j\xdb+V\x80b\x18\x0b\xd1x\xc2\xa7\x5c\x80\x95\xca\
+\xbe\xd5\xceW\x90\xb2\xe5\xcfz\x84KD\x0ab#\xdb\
++\xc5\xcaW\x0e\x09\x98/\xb7\xc3'\xe0Y\x01\xcc\x98\
+B\xe8$|\x9b\x04\xefj>\xd3\xe3\x07\x8c\x96\xdcg\
+R+\xfa\xbe8<\xfc\xf3\x89\xef/g{\xe5\x0aP\
+2\xc4\x82\xe6\xeb\x89x<Q\xa8*\x0ag.|\xad\
+\x07\x04\xbf%\x10Z=\xff\xd5$\x9bO=\xe5B\xb7\
+\x02\x8b'\xa8\xe1]\xc6\xfcG-xPu<\xddS\
+b\xc9\x1f\xc5\xdbr7\xebm+\xee\xd8\xb8\xf1z\xeb\
+\xb5\x16\xd0O{{\xc5\x0aX\xb9r\xa5}\xb8<Q\
+\x8e&S\x89JMc|\xca\x17\x0b\x7fn\xca\xe5\x13\
+;\xfc@\xf0\x9e\xb0r\x11\x5c-\xb9\x94\xa7E\xc27\
+]\x82\x19%R\xd5\xa3\xe9;\x92\x99\x8e\xbf\xdd\xfc\x86\
+\xf9}\x8c}\xf8g\x9e\xbf\xbfZ\xdb+\x0f\xc2\x8c\xb9\
+\xc7\x0e\xef\x1dI\xa6S]\x8d\x19\xc3\xe3\xeb\x08\xf1\xd9\
+\xfb\xbc\x93Z\xe0\xbb\xb0x9\xef\x97[}\x83\x14b\
+9\x0a\x1cG\xf3]5:\x1bM\xb5\xfc\x93\x96k\xfd\
+\xc4\x85\xaf\xff\xe0\xc4k-\x8c\xd7b{U~\xca\xd0\
+0\x22c\xc9Tz\xe7\xcc\x94\xa1\x12\x11\x12\xed\x22\xa2\
+K\x8c\x84\xcf\x03\xaa\xcd\x99\x0c\x05U\xbe\xfe\x9e\xed\xe9\
+\xbe\xa2%\x0eh\xd9\xccg\xdb\x86.\xfc\xfc\xf0\xf0[\
+\xff\xaf\xc5\xf7\x97\xb3\xbd*\x0a\xd0Tc\x92/\xed\x0e\
+-\xe9T\xaa\x8b\x82\x01\xf1\xb6?\x011\x9c\xcd\xf0N\
+\x09Ow\x15\x83\xf0=\x93\xf9\xbb\x0b\xdf\xf8\xd6\x7ff\
+l\xe3\xff\xf5\xf8\xfer\xb6WE\x01Lgw\xa4\xb3\
+\xad#\x8a\x96\xfe\x8bj=/\x16\xb8\xb0\x1cU@\x0d\
+\xa5\x05e\x16O\xde\x99\xce\xf5|z\xe3\xeb?\xf0\x98\
+\x9c5\xf8\xa7\xaf\xf5}\xff\xccl\xaf\xa8\x1a\xba|\xe3\
+\xbf\x1e\xfd\xfd\xdb?\xf9t\x0b;\xbc\xd5\xf14\xdfW\
+\xa3\x93Z<\xfd\xc5lK\xcf\xcdk^\xf7;c\xaf\
+\xf5\x8d\xfe\xacn\xaf\x9a\x02\xf8\xf6\xccg\x7f\xe77\xcc\
+\xd6\xf6\xf7+F\xfa\xb3\xabV]\xf6\xed\xf6\xf5\x97\xbe\
+\xe4\x0c\x91_n\xbf\xdc~\xb9\xfd\x22o\xff\x07\xe1\x09\
+\xd3\x94h.\x22\x80\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x08\
+\x05\xe2Y'\
+\x00l\
+\x00o\x00g\x00o\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x99)\xbdA\x88\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
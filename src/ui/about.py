@@ -6,9 +6,10 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QPixmap, QIcon
+
+from .. import resources_rc  # noqa: F401  (registers the :/icons resources)
 import sys
 import os
-from pathlib import Path
 
 # Import version information
 try:
@@ -75,10 +76,9 @@ class AboutDialog(QDialog):
         main_layout.setContentsMargins(30, 30, 30, 20)
         
         # Add logo
-        logo_path = Path(__file__).parent.parent.parent / "assets" / "logo.png"
-        if logo_path.exists():
+        pixmap = QPixmap(":/icons/logo.png")
+        if not pixmap.isNull():
             logo_label = QLabel()
-            pixmap = QPixmap(str(logo_path))
             # Scale logo to fit but maintain aspect ratio
             pixmap = pixmap.scaled(128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             logo_label.setPixmap(pixmap)